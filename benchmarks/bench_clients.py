@@ -0,0 +1,179 @@
+"""
+    Benchmark: client methods against a local stand-in for data.police.uk
+
+    Measures throughput (pytest-benchmark timings) and peak memory (reported as
+    `peak_mb` in extra_info) for sync vs async clients, cached vs uncached requests
+    and dict vs model vs record output, without touching the live API.
+
+    Run with `pip install pytest-benchmark` and
+    `pytest benchmarks/bench_clients.py --benchmark-group-by=func`; compare runs with
+    `--benchmark-autosave` and `--benchmark-compare`.
+"""
+
+import asyncio
+import tracemalloc
+
+import pytest
+
+from uk_police_client import (
+    AsyncUKPoliceClient,
+    ResponseCache,
+    RetryPolicy,
+    TokenBucket,
+    UKPoliceClient,
+)
+
+from mock_server import MockPoliceServer
+
+pytest.importorskip("pytest_benchmark")
+
+CRIMES = 10_000
+STOPS = 20_000
+BOUNDARY_POINTS = 5_000
+FAN_OUT = 32
+LOCATION = {"lat": 52.629729, "lng": -1.131592}
+# Long enough to be sent as a POST, like a detailed neighbourhood boundary.
+LARGE_POLY = ":".join(
+    f"{52.6 + i / 1e5:.5f},{-1.13 + i / 1e5:.5f}" for i in range(400)
+)
+
+
+@pytest.fixture(scope="module")
+def server():
+    with MockPoliceServer(CRIMES, STOPS, BOUNDARY_POINTS) as server:
+        yield server
+
+
+class Runner:
+    """Runs client calls the same way for sync and async clients."""
+
+    def __init__(self, mode: str, url: str, **kwargs):
+        base = AsyncUKPoliceClient if mode == "async" else UKPoliceClient
+        client_class = type(base.__name__, (base,), {"BASE_URL": url})
+        self.loop = asyncio.new_event_loop() if mode == "async" else None
+        self.client = client_class(
+            rate_limiter=TokenBucket(rate=1_000_000, burst=1_000_000),
+            retry_policy=RetryPolicy(max_attempts=1),
+            **kwargs,
+        )
+
+    def __call__(self, call):
+        result = call(self.client)
+        if self.loop is not None:
+            result = self.loop.run_until_complete(result)
+        return result
+
+    def fan_out(self, call, items):
+        if self.loop is None:
+            return self.client.map(lambda item: call(self.client, item), items)
+
+        async def gather():
+            return await asyncio.gather(*(call(self.client, item) for item in items))
+
+        return self.loop.run_until_complete(gather())
+
+    def close(self):
+        if self.loop is None:
+            self.client.close()
+        else:
+            self.loop.run_until_complete(self.client.aclose())
+            self.loop.close()
+
+
+@pytest.fixture
+def runner(server):
+    runners = []
+
+    def make(mode, **kwargs):
+        runners.append(Runner(mode, server.url, **kwargs))
+        return runners[-1]
+
+    yield make
+    for run in runners:
+        run.close()
+
+
+def measure(benchmark, func):
+    """Benchmarks `func`, recording the peak memory of one extra call."""
+    result = benchmark(func)
+    tracemalloc.start()
+    func()
+    benchmark.extra_info["peak_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return result
+
+
+@pytest.mark.parametrize("cached", [False, True], ids=["uncached", "cached"])
+@pytest.mark.parametrize("output", ["dict", "model", "record"])
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_street_level_crimes(benchmark, runner, mode, output, cached):
+    """A 10,000 crime month for a location."""
+    cache = ResponseCache(":memory:") if cached else None
+    run = runner(mode, output=output, cache=cache)
+
+    def call():
+        return run(lambda client: client.get_street_level_crimes(LOCATION, "2024-01"))
+
+    if cached:
+        call()
+    assert len(measure(benchmark, call)) == CRIMES
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_street_level_crimes_large_polygon(benchmark, runner, mode):
+    """A 10,000 crime month for a polygon too long for a URL, sent as a POST."""
+    run = runner(mode)
+
+    def call():
+        return run(
+            lambda client: client.get_street_level_crimes(
+                {"poly": LARGE_POLY}, "2024-01"
+            )
+        )
+
+    assert len(measure(benchmark, call)) == CRIMES
+
+
+@pytest.mark.parametrize("output", ["dict", "model", "record"])
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_stops_by_force(benchmark, runner, mode, output):
+    """A large stop and search month for a force."""
+    run = runner(mode, output=output)
+
+    def call():
+        return run(
+            lambda client: client.get_stops_by_force("leicestershire", "2024-01")
+        )
+
+    assert len(measure(benchmark, call)) == STOPS
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_neighbourhood_boundary(benchmark, runner, mode):
+    """A 5,000 point neighbourhood boundary."""
+    run = runner(mode)
+
+    def call():
+        return run(lambda client: client.get_neighbourhood_boundary("f", "n"))
+
+    assert len(measure(benchmark, call)) == BOUNDARY_POINTS
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_boundary_fan_out(benchmark, runner, mode):
+    """32 distinct boundaries fetched concurrently (threads vs event loop)."""
+    run = runner(mode)
+
+    def call():
+        return run.fan_out(
+            lambda client, i: client.get_neighbourhood_boundary("f", f"n{i}"),
+            range(FAN_OUT),
+        )
+
+    assert len(measure(benchmark, call)) == FAN_OUT
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
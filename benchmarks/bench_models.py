@@ -0,0 +1,86 @@
+"""
+    Benchmark: decoding crime responses as raw dicts vs. pydantic models
+
+    Run with the package installed: `python benchmarks/bench_models.py [n_records]`.
+"""
+
+import json
+import sys
+import time
+from typing import List
+
+from uk_police_client.models import Crime, LazyModelList, type_adapter
+
+
+def synthetic_crimes(n: int) -> bytes:
+    """Builds a /crimes-street response body with `n` realistic records."""
+    categories = ["anti-social-behaviour", "burglary", "violent-crime", "shoplifting"]
+    crimes = [
+        {
+            "category": categories[i % len(categories)],
+            "location_type": "Force",
+            "location": {
+                "latitude": f"{52.6 + (i % 1000) / 1e4:.6f}",
+                "street": {
+                    "id": 880000 + i % 5000,
+                    "name": f"On or near Street {i % 5000}",
+                },
+                "longitude": f"{-1.13 + (i % 997) / 1e4:.6f}",
+            },
+            "context": "",
+            "outcome_status": (
+                {"category": "Under investigation", "date": "2022-01"}
+                if i % 3
+                else None
+            ),
+            "persistent_id": f"{i:064x}",
+            "id": 54000000 + i,
+            "location_subtype": "",
+            "month": "2022-01",
+        }
+        for i in range(n)
+    ]
+    return json.dumps(crimes).encode()
+
+
+def timed(label: str, func, repeat: int = 3) -> None:
+    best = min(_run(func) for _ in range(repeat))
+    print(f"{label:<42} {best * 1000:9.1f} ms")
+
+
+def _run(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main(n: int = 100_000) -> None:
+    body = synthetic_crimes(n)
+    records = json.loads(body)
+    adapter = type_adapter(List[Crime])
+    print(f"{n} crimes, {len(body) / 1e6:.1f} MB of JSON\n")
+
+    timed("json.loads (raw dicts)", lambda: json.loads(body))
+    timed(
+        "json.loads + per-object Crime(**record)",
+        lambda: [Crime(**r) for r in json.loads(body)],
+    )
+    timed(
+        "json.loads + TypeAdapter.validate_python",
+        lambda: adapter.validate_python(json.loads(body)),
+    )
+    timed("TypeAdapter.validate_json (bytes)", lambda: adapter.validate_json(body))
+    timed(
+        "json.loads + LazyModelList, read 1%",
+        lambda: _read_some(LazyModelList(json.loads(body), Crime)),
+    )
+    timed("validation only: validate_python", lambda: adapter.validate_python(records))
+
+
+def _read_some(crimes: LazyModelList) -> None:
+    for i in range(0, len(crimes), 100):
+        crimes[i]
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,111 @@
+"""
+    Benchmark: memory held by crime and stop and search results per output format
+
+    Run with the package installed: `python benchmarks/bench_records.py [n_records]`.
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+
+from uk_police_client.frames import CrimeFrame
+from uk_police_client.records import crime_records, stop_and_search_records
+
+
+def synthetic_crimes(n: int) -> bytes:
+    """Builds a /crimes-street response body with `n` realistic records."""
+    categories = ["anti-social-behaviour", "burglary", "violent-crime", "shoplifting"]
+    crimes = [
+        {
+            "category": categories[i % len(categories)],
+            "location_type": "Force",
+            "location": {
+                "latitude": f"{52.6 + (i % 1000) / 1e4:.6f}",
+                "street": {
+                    "id": 880000 + i % 5000,
+                    "name": f"On or near Street {i % 5000}",
+                },
+                "longitude": f"{-1.13 + (i % 997) / 1e4:.6f}",
+            },
+            "context": "",
+            "outcome_status": (
+                {"category": "Under investigation", "date": "2022-01"}
+                if i % 3
+                else None
+            ),
+            "persistent_id": f"{i:064x}",
+            "id": 54000000 + i,
+            "location_subtype": "",
+            "month": "2022-01",
+        }
+        for i in range(n)
+    ]
+    return json.dumps(crimes).encode()
+
+
+def synthetic_stops(n: int) -> bytes:
+    """Builds a /stops-force response body with `n` realistic records."""
+    ethnicities = ["White", "Black", "Asian", "Other"]
+    stops = [
+        {
+            "age_range": "18-24",
+            "outcome": "A no further action disposal",
+            "involved_person": True,
+            "self_defined_ethnicity": f"{ethnicities[i % 4]} - Any other background",
+            "gender": "Male" if i % 2 else "Female",
+            "legislation": "Misuse of Drugs Act 1971 (section 23)",
+            "outcome_linked_to_object_of_search": None,
+            "datetime": f"2022-01-{1 + i % 28:02d}T{i % 24:02d}:00:00+00:00",
+            "removal_of_more_than_outer_clothing": False,
+            "outcome_object": {
+                "id": "bu-no-further-action",
+                "name": "A no further action disposal",
+            },
+            "location": {
+                "latitude": f"{51.5 + (i % 1000) / 1e4:.6f}",
+                "street": {
+                    "id": 960000 + i % 3000,
+                    "name": f"On or near Road {i % 3000}",
+                },
+                "longitude": f"{-0.12 + (i % 997) / 1e4:.6f}",
+            },
+            "operation": None,
+            "officer_defined_ethnicity": ethnicities[i % 4],
+            "type": "Person search",
+            "operation_name": None,
+            "object_of_search": "Controlled drugs",
+        }
+        for i in range(n)
+    ]
+    return json.dumps(stops).encode()
+
+
+def retained(label: str, build) -> None:
+    """Prints the memory still allocated by the value `build` returns."""
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+    print(f"{label:<42} {size / 1e6:9.1f} MB")
+
+
+def main(n: int = 100_000) -> None:
+    crimes = synthetic_crimes(n)
+    stops = synthetic_stops(n)
+    print(f"{n} records of each kind\n")
+
+    retained("crimes: dicts", lambda: json.loads(crimes))
+    retained("crimes: CrimeRecord", lambda: crime_records(json.loads(crimes)))
+    retained("crimes: CrimeFrame", lambda: CrimeFrame.from_records(json.loads(crimes)))
+    retained("stops: dicts", lambda: json.loads(stops))
+    retained(
+        "stops: StopAndSearchRecord",
+        lambda: stop_and_search_records(json.loads(stops)),
+    )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
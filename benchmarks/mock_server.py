@@ -0,0 +1,143 @@
+"""
+    Local stand-in for data.police.uk serving synthetic payloads for benchmarks
+
+    Run it on its own with `python benchmarks/mock_server.py [port]` and point a
+    client at it by overriding BASE_URL, e.g. for profiling.
+"""
+
+import gzip
+import json
+import math
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+from bench_records import synthetic_crimes, synthetic_stops
+
+
+def synthetic_boundary(n: int) -> bytes:
+    """Builds a /{force}/{neighbourhood}/boundary response body with `n` points."""
+    points = [
+        {
+            "latitude": f"{52.63 + 0.05 * math.sin(2 * math.pi * i / n):.7f}",
+            "longitude": f"{-1.13 + 0.08 * math.cos(2 * math.pi * i / n):.7f}",
+        }
+        for i in range(n)
+    ]
+    return json.dumps(points).encode()
+
+
+class MockPoliceServer:
+    """
+    HTTP server answering the endpoints exercised by the benchmarks with
+    pre-encoded synthetic bodies, gzip-compressed when the client accepts it like
+    the real API.
+
+    Every street-level crimes request (GET or POST) returns the same `crimes`
+    records, every stop and search by force request the same `stops` records and
+    every boundary request the same `boundary_points` points.
+    """
+
+    def __init__(
+        self,
+        crimes: int = 10_000,
+        stops: int = 20_000,
+        boundary_points: int = 5_000,
+        port: int = 0,
+    ):
+        """
+        Builds the payloads and binds the server, without starting it.
+
+        Args:
+            crimes: Records in each street-level crimes response, defaults to 10,000,
+                the most the API returns for a custom area.
+            stops: Records in each stop and search by force response, defaults to
+                20,000, a large force month.
+            boundary_points: Points in each neighbourhood boundary, defaults to 5,000.
+            port: Port to listen on, defaults to any free port.
+        """
+        self.routes: Dict[str, bytes] = {
+            "/crimes-street/all-crime": synthetic_crimes(crimes),
+            "/stops-force": synthetic_stops(stops),
+            "/boundary": synthetic_boundary(boundary_points),
+            "/forces": json.dumps(
+                [{"id": "leicestershire", "name": "Leicestershire Police"}]
+            ).encode(),
+            "/crime-last-updated": json.dumps({"date": "2024-03-01"}).encode(),
+        }
+        self.compressed = {
+            path: gzip.compress(body, 1) for path, body in self.routes.items()
+        }
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as a client's BASE_URL."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def _lookup(self, path: str, gzipped: bool) -> Tuple[int, bytes]:
+        path = path.partition("?")[0]
+        if not path.startswith("/api/"):
+            return 404, b"[]"
+        path = path[len("/api") :]
+        if path.endswith("/boundary"):
+            path = "/boundary"
+        routes = self.compressed if gzipped else self.routes
+        if path not in routes:
+            return 404, b"[]"
+        return 200, routes[path]
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+                status, body = server._lookup(self.path, gzipped)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if gzipped and status == 200:
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_POST = do_GET
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "MockPoliceServer":
+        """Starts serving on a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stops serving and closes the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    server = MockPoliceServer(port=int(sys.argv[1]) if len(sys.argv) > 1 else 8000)
+    print(f"Serving synthetic data.police.uk on {server.url}")
+    server._server.serve_forever()
@@ -4,5 +4,11 @@ setup(
     name="uk_police_client",
     version="0.1",
     packages=find_packages(),
-    install_requires=["httpx", "pydantic", "python-dateutil"],
+    install_requires=["httpx", "pydantic>=2", "python-dateutil"],
+    extras_require={
+        "frames": ["numpy", "pyarrow", "pandas"],
+        "http2": ["httpx[http2]"],
+        "prometheus": ["prometheus-client"],
+        "opentelemetry": ["opentelemetry-api"],
+    },
 )
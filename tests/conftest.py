@@ -0,0 +1,52 @@
+"""
+    Runs the test suite against recorded cassettes when UK_POLICE_CASSETTES is set
+"""
+
+import os
+
+import httpx
+import pytest
+
+from uk_police_client import TokenBucket
+from uk_police_client.cassette import use_cassette
+
+CASSETTE_MODE = os.environ.get("UK_POLICE_CASSETTES")
+CASSETTE_DIR = os.path.join(os.path.dirname(__file__), "cassettes")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "no_cassette: the test needs clients with their own connection pool"
+    )
+
+
+@pytest.fixture(autouse=True)
+def cassette(request):
+    """
+    Replays the requests of every test from its module's cassette, e.g. run
+    `UK_POLICE_CASSETTES=record pytest` once with network access, then
+    `UK_POLICE_CASSETTES=replay pytest` offline.
+    """
+    if not CASSETTE_MODE or request.node.get_closest_marker("no_cassette"):
+        yield None
+        return
+    name = request.module.__name__.rpartition(".")[2]
+    path = os.path.join(CASSETTE_DIR, f"{name}.json.gz")
+    with use_cassette(path, CASSETTE_MODE) as cassette:
+        yield cassette
+
+
+@pytest.fixture
+def mock_client():
+    """
+    Builds clients whose requests are answered by a handler instead of the API,
+    e.g. `mock_client(CrimesClient, handler, cache=cache)`. The handler receives
+    every httpx.Request and returns an httpx.Response; async clients accept async
+    handlers too. Clients get an unthrottled rate limiter unless one is passed.
+    """
+
+    def build(cls, handler, **kwargs):
+        kwargs.setdefault("rate_limiter", TokenBucket(rate=1000, burst=1000))
+        return cls(transport=httpx.MockTransport(handler), **kwargs)
+
+    return build
@@ -0,0 +1,148 @@
+import asyncio
+
+import httpx
+import pytest
+
+from uk_police_client import AsyncCrimesClient, AsyncUKPoliceClient, MemoryCache
+
+
+def test_async_get_street_level_crimes(mock_client):
+    """Test case for AsyncCrimesClient.get_street_level_crimes method."""
+    seen = []
+
+    def handler(request):
+        seen.append(request.url)
+        return httpx.Response(200, json=[{"id": 1, "category": "burglary"}])
+
+    async def run():
+        async with mock_client(AsyncCrimesClient, handler) as client:
+            location = {"lat": 52.629729, "lng": -1.131592}
+            return await client.get_street_level_crimes(location, "2022-02")
+
+    crimes = asyncio.run(run())
+
+    assert crimes == [{"id": 1, "category": "burglary"}]
+    assert seen[0].path == "/api/crimes-street/all-crime"
+    assert seen[0].params["date"] == "2022-02"
+    assert seen[0].params["lat"] == "52.629729"
+
+
+def test_async_uk_police_client_gathers_requests(mock_client):
+    """Test that AsyncUKPoliceClient can run requests concurrently."""
+
+    def handler(request):
+        force_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"id": force_id})
+
+    async def run():
+        async with mock_client(
+            AsyncUKPoliceClient, handler, reference_cache=MemoryCache(maxsize=0)
+        ) as client:
+            return await asyncio.gather(
+                client.get_force_details("leicestershire"),
+                client.get_force_details("metropolitan"),
+            )
+
+    details = asyncio.run(run())
+
+    assert details == [{"id": "leicestershire"}, {"id": "metropolitan"}]
+
+
+def test_async_iter_crimes_no_location(mock_client):
+    """AsyncCrimesClient.iter_crimes_no_location should cover the whole grid."""
+
+    def handler(request):
+        return httpx.Response(200, json=[dict(request.url.params)])
+
+    async def run():
+        async with mock_client(AsyncCrimesClient, handler) as client:
+            return [
+                cell
+                async for cell in client.iter_crimes_no_location(
+                    ["burglary"], ["a", "b"], "2022-01", "2022-02"
+                )
+            ]
+
+    cells = asyncio.run(run())
+
+    assert sorted((force, month) for _, force, month, _ in cells) == [
+        ("a", "2022-01"),
+        ("a", "2022-02"),
+        ("b", "2022-01"),
+        ("b", "2022-02"),
+    ]
+    assert all(crimes[0]["force"] == force for _, force, _, crimes in cells)
+
+
+def test_async_iter_outcomes_for_crimes(mock_client):
+    """AsyncCrimesClient.iter_outcomes_for_crimes should skip blank and repeated IDs."""
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        return httpx.Response(200, json={"crime": {}, "outcomes": []})
+
+    async def run():
+        async with mock_client(AsyncCrimesClient, handler) as client:
+            return [
+                crime_id
+                async for crime_id, _ in client.iter_outcomes_for_crimes(
+                    ["a", "", {"persistent_id": "b"}, "a"]
+                )
+            ]
+
+    assert sorted(asyncio.run(run())) == ["a", "b"]
+    assert len(requests) == 2
+
+
+def test_async_fan_outs_are_bounded_by_max_workers(mock_client):
+    """Nested fan-outs should never have more than max_workers calls in flight."""
+    running = []
+    peak = []
+
+    async def call(item):
+        running.append(item)
+        peak.append(len(running))
+        await asyncio.sleep(0.001)
+        running.remove(item)
+        return item * 2
+
+    async def run():
+        async with mock_client(AsyncCrimesClient, None, max_workers=3) as client:
+
+            async def fan_out(item):
+                return await client.map(call, [item, item + 100])
+
+            return await client.map(fan_out, list(range(10)))
+
+    results = asyncio.run(run())
+
+    assert results == [[item * 2, item * 2 + 200] for item in range(10)]
+    assert max(peak) == 3
+
+
+def test_async_subdivision_is_bounded_by_max_requests(mock_client):
+    """A polygon refused at every level should raise once the budget runs out."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503)
+
+    async def run():
+        async with mock_client(AsyncCrimesClient, handler) as client:
+            await client._get_subdivided(
+                "/crimes-street/all-crime",
+                {"poly": "0,0:0,1:1,1", "date": "2022-02"},
+                max_requests=21,
+            )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run())
+    assert 1 < len(requests) <= 21
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
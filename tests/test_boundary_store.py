@@ -0,0 +1,85 @@
+import httpx
+import pytest
+
+from uk_police_client import (
+    BoundaryStore,
+    MemoryCache,
+    NeighbourhoodIndex,
+    NeighbourhoodsClient,
+)
+from uk_police_client.boundary_store import write_boundary_store
+
+BOUNDARY = [
+    {"latitude": "52.6394052587", "longitude": "-1.1458618876"},
+    {"latitude": "52.6389452755", "longitude": "-1.1457057759"},
+    {"latitude": "52.6383706746", "longitude": "-1.1455755443"},
+]
+
+
+def _handler(requests):
+    """A mock API with two neighbourhoods sharing BOUNDARY."""
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path.endswith("/neighbourhoods"):
+            return httpx.Response(
+                200, json=[{"id": "NC04", "name": "City Centre"}, {"id": "NC66"}]
+            )
+        return httpx.Response(200, json=BOUNDARY)
+
+    return handler
+
+
+def test_write_and_read_store(tmp_path):
+    """Boundaries should be read back exactly from the mapped file."""
+    path = str(tmp_path / "boundaries.bin")
+    points = [(52.6394052587, -1.1458618876), (52.0, -1.0), (52.1, -1.0)]
+
+    assert write_boundary_store(path, [("leicestershire", "NC04", points)]) == 1
+    with BoundaryStore(path) as store:
+        assert len(store) == 1
+        assert ("leicestershire", "NC04") in store
+        assert ("leicestershire", "NC66") not in store
+        assert store.points("leicestershire", "NC04") == points
+        assert store.boundary("leicestershire", "NC04")[0] == BOUNDARY[0]
+        view = store.coordinates("leicestershire", "NC04")
+        assert view.format == "d" and len(view) == 6
+        view.release()
+
+
+def test_rejects_other_files(tmp_path):
+    """Opening a file that is not a snapshot should fail clearly."""
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a boundary store")
+
+    with pytest.raises(ValueError):
+        BoundaryStore(str(path))
+
+
+def test_snapshot_and_serve_boundaries(tmp_path, mock_client):
+    """Boundaries in the client's store should be served without a request."""
+    path = str(tmp_path / "boundaries.bin")
+    requests = []
+    options = dict(reference_cache=MemoryCache(maxsize=0))
+    client = mock_client(NeighbourhoodsClient, _handler(requests), **options)
+
+    assert client.snapshot_boundaries(path, ["leicestershire"]) == 2
+    assert len(requests) == 3
+
+    requests.clear()
+    with BoundaryStore(path) as store:
+        client = mock_client(
+            NeighbourhoodsClient, _handler(requests), boundary_store=store, **options
+        )
+        boundary = client.get_neighbourhood_boundary("leicestershire", "NC66")
+        index = NeighbourhoodIndex.from_boundaries(store.items())
+
+    assert boundary == BOUNDARY
+    assert requests == []
+    assert len(index) == 2
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
@@ -0,0 +1,89 @@
+import time
+
+import httpx
+
+from uk_police_client import MemoryCache, ResponseCache, UKPoliceClient
+from uk_police_client.cache import cache_key
+
+
+def _handler(requests, last_updated="2022-05-01"):
+    """A mock API logging the paths it is asked for."""
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path.endswith("/crime-last-updated"):
+            return httpx.Response(200, json={"date": last_updated})
+        return httpx.Response(200, json=[{"id": len(requests)}])
+
+    return handler
+
+
+def test_cache_key_ignores_order_and_missing_params():
+    """Keys should not depend on parameter order or parameters set to None."""
+    assert cache_key("/stops-force", {"force": "a", "date": "2022-01"}) == cache_key(
+        "/stops-force", {"date": "2022-01", "force": "a", "extra": None}
+    )
+
+
+def test_historical_months_are_served_from_cache(mock_client):
+    """Months older than the latest release should never be fetched twice."""
+    cache = ResponseCache(":memory:")
+    requests = []
+    client = mock_client(UKPoliceClient, _handler(requests), cache=cache)
+
+    first = client.get_crimes_no_location("all-crime", "leicestershire", "2022-03")
+    second = client.get_crimes_no_location("all-crime", "leicestershire", "2022-03")
+
+    assert first == second
+    assert requests.count("/api/crimes-no-location") == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_latest_month_is_revalidated_when_a_new_release_appears(mock_client):
+    """Entries for the latest month should be refetched once a new month is published."""
+    cache = ResponseCache(":memory:", revalidate_after=0)
+    requests = []
+    for last_updated in ("2022-05-01", "2022-05-01", "2022-06-01"):
+        client = mock_client(
+            UKPoliceClient, _handler(requests, last_updated), cache=cache
+        )
+        client.get_stops_by_force("a", "2022-05")
+
+    assert requests.count("/api/stops-force") == 2
+
+
+def test_reference_endpoints_use_memory_cache(mock_client):
+    """Reference data should be fetched once and then served from memory."""
+    requests = []
+    client = mock_client(
+        UKPoliceClient, _handler(requests), reference_cache=MemoryCache()
+    )
+
+    client.get_forces()
+    forces = client.get_forces()
+    forces.append("mutated")
+
+    assert requests == ["/api/forces"]
+    assert client.get_forces() != forces
+    assert client.reference_cache.stats() == {"hits": 2, "misses": 1, "size": 1}
+
+
+def test_memory_cache_evicts_and_expires():
+    """Entries beyond maxsize or older than the ttl should be dropped."""
+    cache = MemoryCache(maxsize=2, ttl=0.05)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    time.sleep(0.06)
+    assert cache.get("c") is None
+    assert cache.invalidate() == 1
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
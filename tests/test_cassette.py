@@ -0,0 +1,136 @@
+import asyncio
+
+import httpx
+import pytest
+
+from uk_police_client import (
+    AsyncCassetteTransport,
+    AsyncForcesClient,
+    CassetteTransport,
+    CrimesClient,
+    ForcesClient,
+    MemoryCache,
+    RetryPolicy,
+    TokenBucket,
+)
+from uk_police_client.cassette import Cassette, UnrecordedRequest, use_cassette
+
+FORCES = [{"id": "leicestershire", "name": "Leicestershire Police"}]
+CRIMES = [{"id": 1, "category": "burglary", "month": "2024-01"}]
+
+
+class CountingTransport(httpx.MockTransport):
+    def __init__(self, responses=None):
+        super().__init__(self.handle)
+        self.requests = []
+        self.responses = responses
+
+    def handle(self, request):
+        self.requests.append(request)
+        if self.responses:
+            return self.responses.pop(0)
+        if request.url.path.endswith("/forces"):
+            return httpx.Response(200, json=FORCES)
+        return httpx.Response(200, json=CRIMES)
+
+
+def options():
+    return dict(
+        rate_limiter=TokenBucket(rate=1000, burst=1000),
+        reference_cache=MemoryCache(maxsize=0),
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+
+
+def test_record_then_replay(tmp_path):
+    """Recorded responses should replay from the file without any request."""
+    path = str(tmp_path / "cassette.json.gz")
+    network = CountingTransport()
+    with ForcesClient(
+        transport=CassetteTransport(path, transport=network), **options()
+    ) as client:
+        assert client.get_forces() == FORCES
+        assert client.get_forces() == FORCES
+    assert len(network.requests) == 1
+
+    replay = CassetteTransport(path, mode="replay")
+    with ForcesClient(transport=replay, **options()) as client:
+        assert client.get_forces() == FORCES
+    assert len(replay.cassette) == 1
+
+
+def test_key_ignores_method_and_order(tmp_path):
+    """A polygon query recorded as a GET should replay when sent as a POST."""
+    path = str(tmp_path / "cassette.json.gz")
+    location = {"poly": "52.6,-1.1:52.7,-1.1:52.7,-1.2"}
+    client = CrimesClient(
+        transport=CassetteTransport(path, transport=CountingTransport()), **options()
+    )
+    client.get_street_level_crimes(location, "2024-01")
+    client.close()
+
+    client = CrimesClient(
+        transport=CassetteTransport(path, mode="replay"), max_url_length=10, **options()
+    )
+
+    assert client.get_street_level_crimes(location, "2024-01") == CRIMES
+
+
+def test_replay_missing_request(tmp_path):
+    """Replay mode should refuse requests that were not recorded."""
+    client = ForcesClient(
+        transport=CassetteTransport(str(tmp_path / "empty.json.gz"), mode="replay"),
+        **options(),
+    )
+
+    with pytest.raises(UnrecordedRequest):
+        client.get_forces()
+
+
+def test_retryable_responses_not_recorded(tmp_path):
+    """Transient failures should be retried but never recorded."""
+    path = str(tmp_path / "cassette.json.gz")
+    network = CountingTransport([httpx.Response(503), httpx.Response(200, json=FORCES)])
+    with ForcesClient(
+        transport=CassetteTransport(path, transport=network), **options()
+    ) as client:
+        assert client.get_forces() == FORCES
+
+    (interaction,) = Cassette(path).interactions.values()
+    assert interaction["status"] == 200
+
+
+def test_use_cassette(tmp_path, monkeypatch):
+    """Clients created inside use_cassette should default to its cassette."""
+    path = str(tmp_path / "cassette.json.gz")
+    network = CountingTransport()
+    monkeypatch.setattr(httpx, "HTTPTransport", lambda: network)
+
+    with use_cassette(path, mode="record"):
+        with ForcesClient(**options()) as client:
+            assert client.get_forces() == FORCES
+    with use_cassette(path, mode="replay"):
+        with ForcesClient(**options()) as client:
+            assert client.get_forces() == FORCES
+
+    assert len(network.requests) == 1
+
+
+def test_async_record_then_replay(tmp_path):
+    """Async clients should record and replay the same cassettes."""
+    path = str(tmp_path / "cassette.json.gz")
+    network = CountingTransport()
+
+    async def fetch(transport):
+        async with AsyncForcesClient(transport=transport, **options()) as client:
+            return await client.get_forces()
+
+    assert asyncio.run(fetch(AsyncCassetteTransport(path, transport=network))) == FORCES
+    assert asyncio.run(fetch(AsyncCassetteTransport(path, mode="replay"))) == FORCES
+    assert len(network.requests) == 1
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
@@ -1,4 +1,8 @@
-from uk_police_client import CrimesClient
+import httpx
+import pytest
+
+from uk_police_client import CrimesClient, ResponseCache, RetryPolicy
+from uk_police_client.geometry import bounding_box, contains_point, parse_poly
 
 
 def test_get_street_level_crimes():
@@ -127,6 +131,163 @@ def test_get_outcomes_for_crime():
     assert "outcomes" in outcomes
 
 
+def test_get_street_level_crimes_subdivides_large_areas(mock_client):
+    """Polygons refused with a 503 should be split until every part is accepted."""
+    points = [(lat / 10, lng / 10) for lat in range(1, 10) for lng in range(1, 10)]
+    crimes = [
+        {"id": i, "location": {"latitude": lat, "longitude": lng}}
+        for i, (lat, lng) in enumerate(points)
+    ]
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        min_lat, min_lng, max_lat, max_lng = bounding_box(
+            parse_poly(request.url.params["poly"])
+        )
+        matches = [
+            crime
+            for crime in crimes
+            if min_lat <= crime["location"]["latitude"] <= max_lat
+            and min_lng <= crime["location"]["longitude"] <= max_lng
+        ]
+        if len(matches) > 10:
+            return httpx.Response(503)
+        return httpx.Response(200, json=matches)
+
+    client = mock_client(CrimesClient, handler)
+
+    location = {"poly": "0,0:0,1:1,1:1,0"}
+    result = client.get_street_level_crimes(location, "2022-02", subdivide=True)
+
+    assert sorted(crime["id"] for crime in result) == list(range(len(crimes)))
+    assert len(requests) > 1
+
+
+# Outages are retried and then raised instead of split into quadrants.
+@pytest.mark.parametrize(
+    "response",
+    [
+        httpx.Response(503, headers={"Retry-After": "0"}),
+        httpx.Response(503, html="<h1>Down for maintenance</h1>"),
+    ],
+    ids=["retry-after", "html"],
+)
+def test_subdivision_stops_during_outages(response, mock_client):
+    """An outage should be retried or raised, not split into hundreds of requests."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return response
+
+    client = mock_client(
+        CrimesClient,
+        handler,
+        retry_policy=RetryPolicy(max_attempts=2, backoff_factor=0),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.get_street_level_crimes(
+            {"poly": "0,0:0,1:1,1"}, "2022-02", subdivide=True
+        )
+
+    assert len(requests) == 2
+
+
+def test_subdivision_is_bounded_by_max_requests(mock_client):
+    """Refused parts should be split without retries until the budget runs out."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(503)
+
+    client = mock_client(CrimesClient, handler)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client._get_subdivided(
+            "/crimes-street/all-crime",
+            {"poly": "0,0:0,1:1,1", "date": "2022-02"},
+            max_requests=21,
+        )
+
+    assert 1 < len(requests) <= 21
+    assert client.retry_stats.retries == 0
+
+
+def test_get_street_level_crimes_for_neighbourhood(mock_client):
+    """The boundary should be simplified for the request and used to filter crimes."""
+    boundary = [
+        {
+            "latitude": str(52.0 + 0.01 * (i % 2) * 0.01),
+            "longitude": str(-1.0 + i / 1000),
+        }
+        for i in range(100)
+    ] + [
+        {"latitude": "52.01", "longitude": "-0.901"},
+        {"latitude": "52.01", "longitude": "-1.0"},
+    ]
+    crimes = [
+        {"id": 1, "location": {"latitude": "52.005", "longitude": "-0.95"}},
+        {"id": 2, "location": {"latitude": "51.9999", "longitude": "-0.95"}},
+        {"id": 3, "location": None},
+    ]
+    polys = []
+
+    def handler(request):
+        if request.url.path.endswith("/boundary"):
+            return httpx.Response(200, json=boundary)
+        polys.append(parse_poly(request.url.params["poly"]))
+        return httpx.Response(200, json=crimes)
+
+    client = mock_client(CrimesClient, handler)
+
+    result = client.get_street_level_crimes_for_neighbourhood(
+        "leicestershire", "NC04", "2022-01"
+    )
+
+    assert [crime["id"] for crime in result] == [1]
+    assert len(polys[0]) < len(boundary)
+    assert all(
+        contains_point(polys[0], (float(p["latitude"]), float(p["longitude"])))
+        for p in boundary
+    )
+
+
+def _case(code):
+    return {
+        "crime": {"persistent_id": "x"},
+        "outcomes": [{"category": {"code": code}, "date": "2022-05"}],
+    }
+
+
+def test_iter_outcomes_for_crimes(mock_client):
+    """Distinct IDs should be fetched once each, and closed cases cached for good."""
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        crime_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(
+            200, json=_case("imprisoned" if crime_id == "a" else "charged")
+        )
+
+    client = mock_client(CrimesClient, handler, cache=ResponseCache(":memory:"))
+    crimes = ["a", {"persistent_id": "b"}, {"persistent_id": ""}, {"id": 1}, " a "]
+
+    first = dict(client.iter_outcomes_for_crimes(crimes))
+    second = dict(client.iter_outcomes_for_crimes(crimes))
+
+    assert sorted(first) == ["a", "b"]
+    assert first == second
+    assert sorted(requests) == [
+        "/api/outcomes-for-crime/a",
+        "/api/outcomes-for-crime/b",
+        "/api/outcomes-for-crime/b",
+    ]
+
+
 if __name__ == "__main__":
     import subprocess
 
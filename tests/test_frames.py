@@ -0,0 +1,111 @@
+import math
+
+import httpx
+import pytest
+
+from uk_police_client import CrimeFrame, CrimesClient
+from uk_police_client.utils import outcome_id
+
+CRIMES = [
+    {
+        "category": "anti-social-behaviour",
+        "location_type": "Force",
+        "location": {
+            "latitude": "52.640961",
+            "street": {"id": 884343, "name": "On or near Wharf Street North"},
+            "longitude": "-1.126371",
+        },
+        "context": "",
+        "outcome_status": None,
+        "persistent_id": "",
+        "id": 54164419,
+        "location_subtype": "",
+        "month": "2022-01",
+    },
+    {
+        "category": "burglary",
+        "persistent_id": "4ea1d4da29bd8b9e362af35cbabb6157149f62b65d37486dffd185a18e1aaadd",
+        "location_subtype": "",
+        "id": 56862854,
+        "location": None,
+        "context": "",
+        "month": "2022-01",
+        "location_type": None,
+        "outcome_status": {
+            "category": "Investigation complete; no suspect identified",
+            "date": "2022-03",
+        },
+    },
+]
+
+
+def test_crime_frame_from_records():
+    """Records should be stored column-wise with dictionary-encoded strings."""
+    frame = CrimeFrame.from_records(CRIMES)
+
+    assert len(frame) == 2
+    assert frame.column("id") == [54164419, 56862854]
+    assert frame.column("latitude")[0] == 52.640961
+    assert math.isnan(frame.column("latitude")[1])
+    assert frame.column("month") == ["2022-01", "2022-01"]
+    assert frame.categories("month") == ["2022-01"]
+    assert frame.column("outcome_category") == [
+        None,
+        "Investigation complete; no suspect identified",
+    ]
+    assert list(frame)[0]["street_name"] == "On or near Wharf Street North"
+
+
+def test_crime_frame_to_numpy_shares_memory():
+    """NumPy arrays should be views of the frame's buffers."""
+    np = pytest.importorskip("numpy")
+    frame = CrimeFrame.from_records(CRIMES)
+
+    arrays = frame.to_numpy()
+
+    assert arrays["latitude"].dtype == np.float64
+    assert arrays["id"].dtype == np.int64
+    assert arrays["category"].tolist() == [0, 1]
+    assert np.shares_memory(arrays["id"], np.frombuffer(frame._numeric["id"]))
+
+
+def test_crime_frame_to_arrow_and_pandas():
+    """Arrow and pandas conversions should decode dictionary columns."""
+    pytest.importorskip("pyarrow")
+    pytest.importorskip("pandas")
+    frame = CrimeFrame.from_records(CRIMES)
+
+    table = frame.to_arrow()
+    df = frame.to_pandas()
+
+    assert table.column("category").to_pylist() == ["anti-social-behaviour", "burglary"]
+    assert table.column("outcome_date").to_pylist() == [None, "2022-03"]
+    assert df["category"].tolist() == ["anti-social-behaviour", "burglary"]
+    assert df["latitude"].isna().tolist() == [False, True]
+
+
+def test_crime_frame_outcome_ids():
+    """Outcome labels should be normalised to the ids used for outcome codes."""
+    frame = CrimeFrame.from_records(CRIMES + CRIMES)
+
+    assert frame.outcome_ids().tolist() == [-1, outcome_id("no-further-action")] * 2
+
+
+def test_crimes_client_frame_output(mock_client):
+    """A client created with output="frame" should return CrimeFrames."""
+
+    def handler(request):
+        return httpx.Response(200, json=CRIMES)
+
+    client = mock_client(CrimesClient, handler, output="frame")
+
+    frame = client.get_crimes_no_location("all-crime", "leicestershire", "2022-01")
+
+    assert isinstance(frame, CrimeFrame)
+    assert len(frame) == 2
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
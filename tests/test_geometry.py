@@ -0,0 +1,155 @@
+import math
+import random
+
+import pytest
+
+from uk_police_client.geometry import (
+    boundary_poly,
+    bounding_box,
+    clip_to_box,
+    contains_point,
+    format_poly,
+    parse_poly,
+    polygon_area,
+    polygon_contains,
+    simplify_polygon,
+    split_polygon,
+)
+
+
+def test_parse_and_format_poly_round_trip():
+    """Poly strings should survive a parse/format round trip."""
+    poly = "52.268000,0.543000:52.794000,0.238000:52.130000,0.478000"
+
+    assert format_poly(parse_poly(poly)) == poly
+
+
+def test_split_polygon_preserves_area():
+    """The quadrants of a polygon should cover exactly the original shape."""
+    triangle = [(0.0, 0.0), (0.0, 4.0), (3.0, 0.0)]
+
+    parts = split_polygon(triangle)
+
+    assert len(parts) == 3
+    assert sum(abs(polygon_area(part)) for part in parts) == pytest.approx(
+        abs(polygon_area(triangle))
+    )
+
+
+def test_clip_to_box_outside_returns_none():
+    """Clipping to a box that does not overlap the polygon should give nothing."""
+    square = [(0.0, 0.0), (0.0, 1.0), (1.0, 1.0), (1.0, 0.0)]
+
+    assert clip_to_box(square, 2.0, 2.0, 3.0, 3.0) is None
+
+
+def test_contains_point():
+    """Points should be classified by the even-odd rule, including concave shapes."""
+    notch = [(0.0, 0.0), (0.0, 4.0), (4.0, 4.0), (2.0, 2.0), (4.0, 0.0)]
+
+    assert contains_point(notch, (1.0, 2.0))
+    assert contains_point(notch, (3.0, 3.5))
+    assert not contains_point(notch, (3.0, 2.0))
+    assert not contains_point(notch, (5.0, 1.0))
+
+
+def test_simplify_polygon_contains_original():
+    """Simplified polygons should have fewer vertices and cover the original."""
+    wobbly = [
+        (
+            52 + 0.01 * (1 + 0.3 * math.sin(5 * t)) * math.cos(t),
+            -1 + 0.015 * (1 + 0.3 * math.sin(5 * t)) * math.sin(t),
+        )
+        for t in (2 * math.pi * k / 500 for k in range(500))
+    ]
+
+    for tolerance in (0.0001, 0.0005, 0.002):
+        simplified = simplify_polygon(wobbly, tolerance)
+        assert len(simplified) < len(wobbly) / 5
+        assert polygon_contains(simplified, wobbly)
+
+
+def test_polygon_contains():
+    """Polygons should contain themselves but not shapes crossing a notch."""
+    notch = [(0.0, 0.0), (0.0, 4.0), (4.0, 4.0), (2.0, 2.0), (4.0, 0.0)]
+
+    assert polygon_contains(notch, notch)
+    assert polygon_contains(notch, [(0.0, 0.0), (0.0, 4.0), (4.0, 4.0)])
+    assert not polygon_contains(notch, [(0.0, 0.0), (0.0, 4.0), (4.0, 4.0), (4.0, 0.0)])
+    assert not polygon_contains(notch, [(1.0, 1.0), (1.0, 5.0), (2.0, 1.0)])
+
+
+def test_simplify_polygon_rarely_falls_back():
+    """Jittered circles and stars should be simplified, not boxed, and covered."""
+    rng = random.Random(0)
+    circles = [
+        [
+            (
+                52 + 0.01 * (1 + rng.uniform(-jitter, jitter)) * math.cos(t),
+                -1 + 0.015 * (1 + rng.uniform(-jitter, jitter)) * math.sin(t),
+            )
+            for t in (2 * math.pi * k / 200 for k in range(200))
+        ]
+        for jitter in (0.01, 0.05, 0.2, 0.4)
+        for _ in range(10)
+    ]
+    stars = [
+        [
+            (
+                51.5
+                + 0.01
+                * (1 if k % 2 == 0 else inner)
+                * math.cos(turn + math.pi * k / tips),
+                -0.1
+                + 0.01
+                * (1 if k % 2 == 0 else inner)
+                * math.sin(turn + math.pi * k / tips),
+            )
+            for k in range(2 * tips)
+        ]
+        for tips in range(3, 18)
+        for inner in (0.2, 0.4, 0.6, 0.8, 0.95)
+        for turn in (0.0, 0.3, 0.7, 1.1, 2.0, 2.9)
+    ]
+    boxed = 0
+
+    for ring in circles + stars:
+        simplified = simplify_polygon(ring, 0.0005)
+        assert polygon_contains(simplified, ring)
+        assert len(simplified) <= len(ring)
+        if ring in circles:
+            assert len(simplified) < len(ring) / 4
+        if len(simplified) == 4 and bounding_box(simplified) == pytest.approx(
+            bounding_box(ring), abs=1e-6
+        ):
+            boxed += 1
+
+    assert len(stars) == 450
+    assert boxed == 0
+
+
+def test_boundary_poly():
+    """Boundary responses should become poly strings, simplified on request."""
+    boundary = [
+        {"latitude": "52.0", "longitude": "-1.0"},
+        {"latitude": "52.0", "longitude": "-0.98"},
+        {"latitude": "52.0000001", "longitude": "-0.96"},
+        {"latitude": "52.0", "longitude": "-0.94"},
+        {"latitude": "52.0", "longitude": "-0.9"},
+        {"latitude": "52.1", "longitude": "-0.9"},
+        {"latitude": "52.0", "longitude": "-1.0"},
+    ]
+
+    assert boundary_poly(boundary[:2] + boundary[4:], tolerance=None) == (
+        "52.000000,-1.000000:52.000000,-0.980000:52.000000,-0.900000:"
+        "52.100000,-0.900000"
+    )
+    assert len(parse_poly(boundary_poly(boundary))) == 3
+    with pytest.raises(ValueError):
+        boundary_poly(boundary[:2])
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
@@ -0,0 +1,212 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from uk_police_client import (
+    AsyncForcesClient,
+    CrimesClient,
+    ForcesClient,
+    MemoryCache,
+    MetricsRecorder,
+    RetryPolicy,
+    TokenBucket,
+)
+from uk_police_client.instrumentation import Instrument, route
+
+FORCES = [{"id": "leicestershire", "name": "Leicestershire Police"}]
+CRIMES = [
+    {
+        "category": "burglary",
+        "persistent_id": "abc",
+        "location_type": "Force",
+        "location_subtype": "",
+        "id": 1,
+        "location": {
+            "latitude": "52.6",
+            "longitude": "-1.1",
+            "street": {"id": 7, "name": "On or near High Street"},
+        },
+        "context": "",
+        "month": "2024-01",
+        "outcome_status": None,
+    }
+]
+
+
+class Events(Instrument):
+    def __init__(self):
+        self.requests = []
+        self.decodes = []
+
+    def on_request(self, event):
+        self.requests.append(event)
+
+    def on_decode(self, event):
+        self.decodes.append(event)
+
+
+def options(**kwargs):
+    return dict(
+        rate_limiter=TokenBucket(rate=1000, burst=1000),
+        reference_cache=MemoryCache(maxsize=0),
+        retry_policy=RetryPolicy(backoff_factor=0),
+        **kwargs,
+    )
+
+
+def test_route():
+    """Identifiers in endpoints should be replaced by placeholders."""
+    assert route("/leicestershire/NC04/boundary") == "/{id}/{id}/boundary"
+    assert route("/forces/leicestershire/people") == "/forces/{id}/people"
+    assert route("/crimes-street/all-crime") == "/crimes-street/all-crime"
+    assert route("/outcomes-for-crime/abc123") == "/outcomes-for-crime/{id}"
+    assert route("/leicestershire/neighbourhoods") == "/{id}/neighbourhoods"
+
+
+def test_events_and_metrics(mock_client):
+    """Every attempt and conversion should be reported to the instruments."""
+    responses = iter([httpx.Response(503), httpx.Response(200, json=CRIMES)])
+    events = Events()
+    recorder = MetricsRecorder()
+    client = mock_client(
+        CrimesClient,
+        lambda request: next(responses),
+        instruments=[events, recorder],
+        output="record",
+        **options(),
+    )
+
+    crimes = client.get_street_level_crimes({"lat": 52.6, "lng": -1.1}, "2024-01")
+
+    assert len(crimes) == 1
+    retry, success = events.requests
+    assert (retry.status, retry.attempt, retry.parse_time) == (503, 1, None)
+    assert (success.status, success.attempt) == (200, 2)
+    assert success.route == "/crimes-street/all-crime"
+    assert success.response_bytes == len(httpx.Response(200, json=CRIMES).content)
+    assert success.parse_time >= 0
+    (decode,) = events.decodes
+    assert (decode.kind, decode.output, decode.records) == ("crime", "record", 1)
+
+    metrics = recorder.routes[("GET", "/crimes-street/all-crime")]
+    assert (metrics.requests, metrics.retries, metrics.errors) == (2, 1, 1)
+    assert metrics.statuses == {503: 1, 200: 1}
+    assert sum(metrics.latency) == 2
+    (row,) = recorder.report()
+    assert row["route"] == "/crimes-street/all-crime"
+
+
+def test_failed_attempts_are_reported(mock_client):
+    """Attempts raising instead of responding should be reported with the error."""
+
+    def handler(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    events = Events()
+    client = mock_client(ForcesClient, handler, instruments=[events], **options())
+
+    with pytest.raises(httpx.ConnectError):
+        client.get_forces()
+
+    assert [(event.status, event.error) for event in events.requests] == [
+        (None, "ConnectError")
+    ] * 4
+
+
+def test_streamed_requests_are_reported(mock_client):
+    """Streamed responses should be reported once fully consumed."""
+    events = Events()
+    client = mock_client(
+        CrimesClient,
+        lambda request: httpx.Response(200, json=CRIMES),
+        instruments=[events],
+        **options(),
+    )
+
+    crimes = list(
+        client.stream_street_level_crimes({"lat": 52.6, "lng": -1.1}, "2024-01")
+    )
+
+    assert len(crimes) == 1
+    (event,) = events.requests
+    assert event.status == 200
+    assert event.response_bytes == len(httpx.Response(200, json=CRIMES).content)
+
+
+@pytest.mark.no_cassette
+def test_phases_over_network():
+    """Requests over a real connection should report their phases."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps(FORCES).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    events = Events()
+    client = ForcesClient(instruments=[events], **options())
+    client.client.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        assert client.get_forces() == FORCES
+    finally:
+        client.close()
+        server.shutdown()
+
+    (event,) = events.requests
+    assert {"connect", "send", "wait", "receive"} <= set(event.phases)
+
+
+def test_async_client_events(mock_client):
+    """Async clients should report their requests the same way."""
+    events = Events()
+
+    async def main():
+        async with mock_client(
+            AsyncForcesClient,
+            lambda request: httpx.Response(200, json=FORCES),
+            instruments=[events],
+            **options(),
+        ) as client:
+            return await client.get_forces()
+
+    assert asyncio.run(main()) == FORCES
+    (event,) = events.requests
+    assert (event.route, event.status) == ("/forces", 200)
+
+
+def test_prometheus_instrument(mock_client):
+    """The Prometheus adapter should export request metrics per route."""
+    prometheus = pytest.importorskip("prometheus_client")
+    from uk_police_client import PrometheusInstrument
+
+    registry = prometheus.CollectorRegistry()
+    client = mock_client(
+        ForcesClient,
+        lambda request: httpx.Response(200, json=FORCES),
+        instruments=[PrometheusInstrument(registry=registry)],
+        **options(),
+    )
+
+    client.get_forces()
+
+    labels = {"method": "GET", "route": "/forces", "status": "200"}
+    assert registry.get_sample_value("uk_police_request_seconds_count", labels) == 1
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
@@ -0,0 +1,106 @@
+import subprocess
+import sys
+from datetime import datetime
+
+import httpx
+
+from uk_police_client import StopAndSearchClient, UKPoliceClient
+from uk_police_client.models import (
+    Crime,
+    LazyModelList,
+    Priority,
+    StopAndSearch,
+    model_decoders,
+)
+
+SEARCH = {
+    "age_range": "18-24",
+    "outcome": "Summons / charged by post",
+    "involved_person": True,
+    "self_defined_ethnicity": "White - English/Welsh/Scottish/Northern Irish/British",
+    "gender": "Male",
+    "legislation": "Misuse of Drugs Act 1971 (section 23)",
+    "outcome_linked_to_object_of_search": True,
+    "datetime": "2018-06-06T12:20:00+00:00",
+    "removal_of_more_than_outer_clothing": False,
+    "outcome_object": {"id": "bu-summons", "name": "Summons / charged by post"},
+    "location": {
+        "latitude": "52.631569",
+        "street": {"id": 1489803, "name": "Leicester (Station)"},
+        "longitude": "-1.124283",
+    },
+    "operation": None,
+    "officer_defined_ethnicity": "White",
+    "type": "Person search",
+    "operation_name": None,
+    "object_of_search": "Controlled drugs",
+}
+
+
+def test_model_output_validates_in_bulk(mock_client):
+    """A client created with output="model" should return typed models."""
+    client = mock_client(
+        StopAndSearchClient,
+        lambda request: httpx.Response(200, json=[SEARCH, SEARCH]),
+        output="model",
+    )
+
+    searches = client.get_stops_by_force("leicestershire", "2022-03")
+
+    assert all(isinstance(search, StopAndSearch) for search in searches)
+    assert searches[0].location.latitude == 52.631569
+    assert searches[0].datetime == datetime.fromisoformat("2018-06-06T12:20:00+00:00")
+
+
+def test_lazy_model_output_validates_on_access():
+    """Records of a lazy model list should only be validated when accessed."""
+    crimes = [{"id": 1, "category": "burglary", "month": "2022-01"}, {"id": "bad"}]
+    lazy = model_decoders(lazy=True)["crime"](crimes)
+
+    assert isinstance(lazy, LazyModelList)
+    assert len(lazy) == 2
+    assert lazy[0] == Crime(id=1, category="burglary", month="2022-01")
+    assert lazy.raw is crimes
+
+
+def test_aliased_fields():
+    """Hyphenated API fields should be exposed with Python names."""
+    priority = Priority.model_validate(
+        {"issue": "x", "issue-date": "2016-04-14T00:00:00", "action-date": None}
+    )
+
+    assert priority.issue_date == datetime(2016, 4, 14)
+
+
+def test_single_object_endpoints(mock_client):
+    """Endpoints returning one object should be validated as that model."""
+    client = mock_client(
+        UKPoliceClient,
+        lambda request: httpx.Response(
+            200, json={"force": "metropolitan", "neighbourhood": "00BKX6"}
+        ),
+        output="lazy_model",
+    )
+
+    located = client.locate_neighbourhood("51.500617,-0.124629")
+
+    assert located.force == "metropolitan"
+
+
+def test_models_are_imported_on_first_use():
+    """Importing the package should not build models until a model output is used."""
+    code = (
+        "import sys, uk_police_client; "
+        "assert 'uk_police_client.models' not in sys.modules; "
+        "from uk_police_client.decoding import decode; "
+        "decode([], 'crime', 'model'); "
+        "assert 'uk_police_client.models' in sys.modules"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
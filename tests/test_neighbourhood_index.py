@@ -0,0 +1,84 @@
+import httpx
+
+from uk_police_client import MemoryCache, NeighbourhoodIndex, NeighbourhoodsClient
+
+SQUARE = [(52.0, -1.0), (52.0, -0.9), (52.1, -0.9), (52.1, -1.0)]
+TRIANGLE = [(52.1, -1.0), (52.1, -0.9), (52.2, -1.0)]
+
+
+def as_boundary(points):
+    return [{"latitude": str(lat), "longitude": str(lng)} for lat, lng in points]
+
+
+def test_locate_points():
+    """Points should be matched to the boundary containing them."""
+    index = NeighbourhoodIndex(cell_size=0.05)
+    index.add("leicestershire", "NC04", SQUARE)
+    index.add("leicestershire", "NC66", TRIANGLE)
+
+    assert index.locate("52.05,-0.95") == {
+        "force": "leicestershire",
+        "neighbourhood": "NC04",
+    }
+    assert index.locate((52.12, -0.98))["neighbourhood"] == "NC66"
+    assert index.locate((52.19, -0.91)) is None
+    assert index.locate((53.0, -0.95)) is None
+
+
+def test_save_and_load(tmp_path):
+    """An index should survive a save/load round trip."""
+    index = NeighbourhoodIndex()
+    index.add("leicestershire", "NC04", SQUARE)
+    path = str(tmp_path / "neighbourhoods.idx")
+
+    index.save(path)
+    loaded = NeighbourhoodIndex.load(path)
+
+    assert len(loaded) == 1
+    assert loaded.cell_size == index.cell_size
+    assert loaded.locate_many([(52.05, -0.95), (0, 0)]) == [
+        {"force": "leicestershire", "neighbourhood": "NC04"},
+        None,
+    ]
+
+
+def test_build_and_locate_neighbourhoods(mock_client):
+    """Lookups should be answered locally, with misses sent to the API."""
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        path = request.url.path
+        if path.endswith("/leicestershire/neighbourhoods"):
+            return httpx.Response(200, json=[{"id": "NC04", "name": "City Centre"}])
+        if path.endswith("/leicestershire/NC04/boundary"):
+            return httpx.Response(200, json=as_boundary(SQUARE))
+        if request.url.params["q"].startswith("51.5"):
+            return httpx.Response(
+                200, json={"force": "metropolitan", "neighbourhood": "00BKX6"}
+            )
+        return httpx.Response(404, json={})
+
+    client = mock_client(
+        NeighbourhoodsClient, handler, reference_cache=MemoryCache(maxsize=0)
+    )
+
+    client.neighbourhood_index = client.build_neighbourhood_index(["leicestershire"])
+    requests.clear()
+    located = client.locate_neighbourhoods(
+        ["52.05,-0.95", (51.500617, -0.124629), (0.0, 0.0)]
+    )
+
+    assert located == [
+        {"force": "leicestershire", "neighbourhood": "NC04"},
+        {"force": "metropolitan", "neighbourhood": "00BKX6"},
+        None,
+    ]
+    assert len(requests) == 2
+    assert client.locate_neighbourhoods([(0.0, 0.0)], fallback=False) == [None]
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
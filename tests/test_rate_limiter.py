@@ -0,0 +1,51 @@
+import asyncio
+import threading
+import time
+
+from uk_police_client.rate_limiter import TokenBucket
+
+
+def test_burst_is_served_immediately():
+    """Requests up to the burst size should not wait."""
+    bucket = TokenBucket(rate=1, burst=5)
+
+    delays = [bucket._reserve() for _ in range(5)]
+
+    assert delays == [0.0] * 5
+    assert bucket._reserve() > 0
+
+
+def test_sustained_rate_is_enforced_across_threads():
+    """Threads sharing a bucket should together respect the configured rate."""
+    bucket = TokenBucket(rate=50, burst=1)
+    start = time.monotonic()
+
+    threads = [
+        threading.Thread(target=lambda: [bucket.acquire() for _ in range(5)])
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # 20 requests with a burst of 1 need at least 19 refills at 50/s.
+    assert time.monotonic() - start >= 19 / 50 * 0.9
+
+
+def test_acquire_async():
+    """Coroutines sharing a bucket should also respect the configured rate."""
+    bucket = TokenBucket(rate=100, burst=2)
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(12)))
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 10 / 100 * 0.9
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
@@ -0,0 +1,139 @@
+import json
+
+import httpx
+
+from uk_police_client import (
+    CrimeFrame,
+    CrimeRecord,
+    StopAndSearchRecord,
+    UKPoliceClient,
+)
+from uk_police_client.records import crime_records
+
+CRIMES = [
+    {
+        "category": "anti-social-behaviour",
+        "location_type": "Force",
+        "location": {
+            "latitude": "52.640961",
+            "street": {"id": 884343, "name": "On or near Wharf Street North"},
+            "longitude": "-1.126371",
+        },
+        "context": "",
+        "outcome_status": {"category": "Under investigation", "date": "2022-01"},
+        "persistent_id": "",
+        "id": 54164419,
+        "location_subtype": "",
+        "month": "2022-01",
+    },
+    {
+        "category": "anti-social-behaviour",
+        "location_type": None,
+        "location": None,
+        "context": "",
+        "outcome_status": None,
+        "persistent_id": "4ea1d4da29bd8b9e362af35cbabb6157149f62b65d37486dffd185a18e1aaadd",
+        "id": 56862854,
+        "location_subtype": "",
+        "month": "2022-01",
+    },
+]
+
+STOPS = [
+    {
+        "age_range": "18-24",
+        "outcome": "A no further action disposal",
+        "involved_person": True,
+        "self_defined_ethnicity": "White - Any other White background",
+        "gender": "Male",
+        "legislation": "Misuse of Drugs Act 1971 (section 23)",
+        "outcome_linked_to_object_of_search": None,
+        "datetime": "2022-01-05T12:30:00+00:00",
+        "removal_of_more_than_outer_clothing": False,
+        "outcome_object": {
+            "id": "bu-no-further-action",
+            "name": "A no further action disposal",
+        },
+        "location": {
+            "latitude": "51.512070",
+            "street": {"id": 968071, "name": "On or near Petrol Station"},
+            "longitude": "-0.131260",
+        },
+        "operation": None,
+        "officer_defined_ethnicity": "White",
+        "type": "Person search",
+        "operation_name": None,
+        "object_of_search": "Controlled drugs",
+    }
+]
+
+
+def test_crime_record_flattens_location():
+    """Location and outcome fields should become flat, typed attributes."""
+    record = CrimeRecord(CRIMES[0])
+
+    assert record.latitude == 52.640961
+    assert record.longitude == -1.126371
+    assert record.street_id == 884343
+    assert record.street_name == "On or near Wharf Street North"
+    assert record.outcome_category == "Under investigation"
+    assert not hasattr(record, "__dict__")
+
+
+def test_crime_record_missing_location():
+    """Crimes without a location should have None for the location fields."""
+    record = CrimeRecord(CRIMES[1])
+
+    assert record.latitude is None
+    assert record.street_name is None
+    assert record.outcome_date is None
+    assert record.to_dict()["id"] == 56862854
+
+
+def test_records_share_interned_strings():
+    """Repeated strings should refer to a single object across records."""
+    first, second = crime_records(json.loads(json.dumps(CRIMES)))
+
+    assert first.category is second.category
+    assert first.month is second.month
+
+
+def test_record_output(mock_client):
+    """A client created with output="record" should return record objects."""
+
+    def client(payload):
+        return mock_client(
+            UKPoliceClient,
+            lambda request: httpx.Response(200, json=payload),
+            output="record",
+        )
+
+    crimes = client(CRIMES).get_crimes_no_location(
+        "all-crime", "leicestershire", "2022-01"
+    )
+    stops = client(STOPS).get_stops_by_force("metropolitan", "2022-01")
+
+    assert [type(crime) for crime in crimes] == [CrimeRecord, CrimeRecord]
+    assert isinstance(stops[0], StopAndSearchRecord)
+    assert stops[0].outcome_id == "bu-no-further-action"
+    assert stops[0].street_id == 968071
+    assert stops[0] == StopAndSearchRecord(STOPS[0])
+
+
+def test_records_are_hashable_values():
+    """Equal records should hash alike, and blank ids match CrimeFrame's ""."""
+    first, second = crime_records(CRIMES), crime_records(CRIMES)
+
+    assert len({*first, *second}) == 2
+    assert {first[0]: 1}[second[0]] == 1
+    assert (
+        first[0].persistent_id
+        == CrimeFrame.from_records(CRIMES).column("persistent_id")[0]
+    )
+    assert first[0].persistent_id == ""
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
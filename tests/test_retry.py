@@ -0,0 +1,95 @@
+import httpx
+import pytest
+
+from uk_police_client import ForcesClient, MemoryCache, RetryPolicy
+
+
+def test_retries_transient_status_then_succeeds(mock_client):
+    """A 502 followed by a 200 should be retried transparently and counted."""
+    responses = iter([httpx.Response(502), httpx.Response(200, json=[{"id": "a"}])])
+    client = mock_client(
+        ForcesClient,
+        lambda request: next(responses),
+        reference_cache=MemoryCache(maxsize=0),
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+
+    assert client.get_forces() == [{"id": "a"}]
+    assert client.retry_stats.requests == 1
+    assert client.retry_stats.retries == 1
+    assert client.retry_stats.reasons == {"502": 1}
+
+
+def test_connection_errors_are_retried(mock_client):
+    """A refused connection followed by a 200 should be retried transparently."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        return httpx.Response(200, json=[{"id": "a"}])
+
+    client = mock_client(
+        ForcesClient,
+        handler,
+        reference_cache=MemoryCache(maxsize=0),
+        retry_policy=RetryPolicy(backoff_factor=0),
+    )
+
+    assert client.get_forces() == [{"id": "a"}]
+    assert client.retry_stats.reasons == {"ConnectError": 1}
+
+
+def test_retry_after_header_is_honoured():
+    """The delay requested by Retry-After should be used instead of backoff."""
+    policy = RetryPolicy(backoff_factor=100)
+    response = httpx.Response(429, headers={"Retry-After": "2"})
+
+    assert policy.next_delay(1, response=response) == 2.0
+
+
+def test_gives_up_after_max_attempts(mock_client):
+    """Requests should fail once every attempt has been used."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503)
+
+    client = mock_client(
+        ForcesClient,
+        handler,
+        reference_cache=MemoryCache(maxsize=0),
+        retry_policy=RetryPolicy(max_attempts=3, backoff_factor=0),
+    )
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.get_forces()
+    assert len(calls) == 3
+    assert client.retry_stats.exhausted == 1
+
+
+def test_timeouts_are_retried_and_client_errors_are_not():
+    """Read timeouts should be retried while a 404 fails immediately."""
+    policy = RetryPolicy()
+
+    assert policy.next_delay(1, exception=httpx.ReadTimeout("slow")) is not None
+    assert policy.next_delay(1, response=httpx.Response(404)) is None
+
+
+def test_over_limit_refusals_are_not_retried():
+    """A bare 503 for a custom area should not be retried, unlike one for a force."""
+    policy = RetryPolicy()
+    area = httpx.Request("GET", "https://x/crimes-street/all-crime?poly=0,0:0,1:1,1")
+    refusal = httpx.Response(503, request=area)
+    outage = httpx.Response(503, request=httpx.Request("GET", "https://x/forces"))
+
+    assert policy.next_delay(1, response=refusal) is None
+    assert policy.next_delay(1, response=outage) is not None
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
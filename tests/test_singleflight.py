@@ -0,0 +1,184 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from uk_police_client import (
+    AsyncForcesClient,
+    AsyncSingleFlight,
+    ForcesClient,
+    MemoryCache,
+    SingleFlight,
+    TokenBucket,
+)
+
+FORCES = [{"id": "leicestershire", "name": "Leicestershire Police"}]
+
+
+def options():
+    return dict(
+        rate_limiter=TokenBucket(rate=1000, burst=1000),
+        reference_cache=MemoryCache(maxsize=0),
+    )
+
+
+def test_single_flight_shares_call():
+    """Callers arriving while a call is in flight should share its result."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        started.set()
+        release.wait()
+        return {"value": [1, 2]}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        leader = executor.submit(flight.do, "key", fetch)
+        started.wait()
+        followers = [executor.submit(flight.do, "key", fetch) for _ in range(3)]
+        while flight.shared < 3:
+            time.sleep(0.001)
+        release.set()
+        results = [leader.result()] + [future.result() for future in followers]
+
+    assert len(calls) == 1
+    assert flight.calls == 1 and flight.shared == 3
+    assert all(result == {"value": [1, 2]} for result in results)
+    assert len({id(result) for result in results}) == 4
+
+
+def test_single_flight_copies_for_leader_only_when_shared():
+    """The leader should get a copy when followers joined, and the original if not."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    original = {"value": [1, 2]}
+
+    def fetch():
+        started.set()
+        release.wait()
+        return original
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "key", fetch)
+        started.wait()
+        follower = executor.submit(flight.do, "key", fetch)
+        while flight.shared < 1:
+            time.sleep(0.001)
+        release.set()
+        leader.result()["value"].append(3)
+        result = follower.result()
+
+    assert result == {"value": [1, 2]} and original == {"value": [1, 2]}
+    assert flight.do("other", lambda: original) is original
+
+
+def test_single_flight_shares_errors():
+    """Followers should receive the leader's exception, and the key be forgotten."""
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait()
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(flight.do, "key", fail)
+        started.wait()
+        follower = executor.submit(flight.do, "key", fail)
+        while flight.shared < 1:
+            time.sleep(0.001)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ValueError):
+                future.result()
+
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.calls == 2
+
+
+def test_client_coalesces_requests(mock_client):
+    """Identical concurrent requests of a client should reach the API once."""
+    release = threading.Event()
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        release.wait()
+        return httpx.Response(200, json=FORCES)
+
+    client = mock_client(ForcesClient, handler, **options())
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(client.get_forces) for _ in range(4)]
+        while client.single_flight.shared < 3:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(requests) == 1
+    assert all(result == FORCES for result in results)
+
+
+def test_async_client_coalesces_requests(mock_client):
+    """Identical concurrent requests of an async client should reach the API once."""
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=FORCES)
+
+    flight = AsyncSingleFlight()
+
+    async def main():
+        async with mock_client(
+            AsyncForcesClient, handler, single_flight=flight, **options()
+        ) as client:
+            return await asyncio.gather(*(client.get_forces() for _ in range(5)))
+
+    results = asyncio.run(main())
+
+    assert len(requests) == 1
+    assert flight.calls == 1 and flight.shared == 4
+    assert all(result == FORCES for result in results)
+
+
+def test_async_single_flight_copies_for_leader_only_when_shared():
+    """Async followers should not see changes the leader's caller makes."""
+    flight = AsyncSingleFlight()
+    original = {"value": [1, 2]}
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return original
+
+    async def leader():
+        result = await flight.do("key", fetch)
+        result["value"].append(3)
+        return result
+
+    async def main():
+        shared = await asyncio.gather(leader(), flight.do("key", fetch))
+        alone = await flight.do("other", fetch)
+        return shared, alone
+
+    (first, second), alone = asyncio.run(main())
+
+    assert first == {"value": [1, 2, 3]}
+    assert second == original == {"value": [1, 2]}
+    assert alone is original
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
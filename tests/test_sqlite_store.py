@@ -0,0 +1,121 @@
+import pytest
+
+from uk_police_client import SQLiteStore
+from tests.test_sync import FakeAPI, engine
+
+
+def crime(id, category, lat, lng, outcome=None):
+    return {
+        "id": id,
+        "category": category,
+        "month": "2024-01",
+        "location": {
+            "latitude": str(lat),
+            "longitude": str(lng),
+            "street": {"id": 7, "name": "On or near High Street"},
+        },
+        "outcome_status": outcome and {"category": outcome, "date": "2024-02"},
+    }
+
+
+CRIMES = [
+    crime(1, "burglary", 52.63, -1.13, "Under investigation"),
+    crime(2, "burglary", 52.64, -1.12),
+    crime(3, "robbery", 52.70, -1.00),
+    {"id": 4, "category": "burglary", "month": "2024-01", "location": None},
+]
+
+
+def test_write_and_query():
+    """Partitions should be queryable by column, month range and bounding box."""
+    store = SQLiteStore(":memory:")
+    store.write("crimes", "leicestershire", "2024-01", CRIMES)
+
+    burglaries = store.query("crimes", category="burglary", columns=["id"])
+    assert sorted(row["id"] for row in burglaries) == [1, 2, 4]
+    box = store.query("crimes", bbox=(52.6, -1.2, 52.65, -1.1))
+    assert sorted(row["id"] for row in box) == [1, 2]
+    (row,) = store.query("crimes", outcome_category="Under investigation")
+    assert (row["street_name"], row["month"]) == ("On or near High Street", "2024-01")
+    assert store.query("crimes", start="2024-02") == []
+    assert len(store.query("crimes", category=["burglary", "robbery"], limit=2)) == 2
+
+
+def test_count():
+    """Counts should be grouped by the requested columns, largest first."""
+    store = SQLiteStore(":memory:")
+    store.write("crimes", "leicestershire", "2024-01", CRIMES)
+    store.write("crimes", "leicestershire", "2024-02", CRIMES[:1])
+
+    assert store.count("crimes") == [{"count": 5}]
+    assert store.count("crimes", by=["category"]) == [
+        {"category": "burglary", "count": 4},
+        {"category": "robbery", "count": 1},
+    ]
+    assert store.count("crimes", by=["month"], category="robbery") == [
+        {"month": "2024-01", "count": 1}
+    ]
+    cells = store.count("crimes", by=["cell_row", "cell_col"], outcome_category=None)
+    assert sum(cell["count"] for cell in cells) == 3
+
+
+def test_partitions_are_replaced(tmp_path):
+    """Writing a partition again should replace it, and state should persist."""
+    path = str(tmp_path / "store.sqlite")
+    store = SQLiteStore(path)
+    store.write("crimes", "leicestershire", "2024-01", CRIMES)
+    store.write("crimes", "leicestershire", "2024-01", CRIMES[:2])
+    store.set_watermark("2024-01")
+    store.close()
+
+    store = SQLiteStore(path)
+
+    assert store.count("crimes") == [{"count": 2}]
+    assert store.watermark() == "2024-01"
+    (partition,) = store.partitions("crimes")
+    assert (partition["force"], partition["records"]) == ("leicestershire", 2)
+
+
+def test_unknown_names():
+    """Unknown datasets and columns should be rejected before reaching SQL."""
+    store = SQLiteStore(":memory:")
+
+    with pytest.raises(ValueError):
+        store.query("crimes; DROP TABLE crimes")
+    with pytest.raises(ValueError):
+        store.count("crimes", by=["category; --"])
+    with pytest.raises(ValueError):
+        store.query("stops", category="burglary")
+
+
+def test_sync_engine_into_store(engine):
+    """A SyncEngine should fill the store with every dataset."""
+    store = SQLiteStore(":memory:")
+
+    report = engine(FakeAPI("2024-03"), store).run()
+
+    assert report.partitions == 3
+    assert store.watermark() == "2024-03"
+    assert store.count("crimes") == [{"count": 4}]
+    (outcome,) = store.query("outcomes")
+    assert (outcome["category_code"], outcome["crime_id"]) == ("charged", 1)
+    assert store.query("stops", columns=["type"]) == [{"type": "Person search"}]
+
+
+def test_backfill(engine):
+    """Backfills should load a range of months without moving the watermark."""
+    store = SQLiteStore(":memory:")
+
+    report = engine(FakeAPI("2024-03"), store, datasets=["stops"]).backfill(
+        "2023-11", "2024-01"
+    )
+
+    assert report.months == ["2023-11", "2023-12", "2024-01"]
+    assert [p["month"] for p in store.partitions("stops")] == report.months
+    assert store.watermark() is None
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
@@ -1,3 +1,5 @@
+import httpx
+
 from uk_police_client import StopAndSearchClient
 
 
@@ -122,6 +124,48 @@ def test_get_stops_by_force():
     )
 
 
+def test_get_stop_and_searches_by_area_posts_long_polygons(mock_client):
+    """Polygons that would overflow the URL length limit should be sent as a POST."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=[])
+
+    client = mock_client(StopAndSearchClient, handler, max_url_length=200)
+
+    short_poly = "52.2,0.5:52.7,0.2:52.1,0.4"
+    long_poly = ":".join(f"52.{i:06d},0.{i:06d}" for i in range(100))
+    client.get_stop_and_searches_by_area({"poly": short_poly}, "2022-02")
+    client.get_stop_and_searches_by_area({"poly": long_poly}, "2022-02")
+
+    assert requests[0].method == "GET"
+    assert requests[1].method == "POST"
+    assert b"poly=" in requests[1].content
+
+
+def test_iter_stops_by_force_covers_force_month_grid(mock_client):
+    """Every force and month in the range should be fetched exactly once."""
+    requests = []
+
+    def handler(request):
+        requests.append((request.url.params["force"], request.url.params["date"]))
+        return httpx.Response(200, json=[{"force": request.url.params["force"]}])
+
+    client = mock_client(StopAndSearchClient, handler)
+
+    results = list(client.iter_stops_by_force(["a", "b"], "2022-11", "2023-01"))
+
+    expected = {
+        (force, month)
+        for force in ["a", "b"]
+        for month in ["2022-11", "2022-12", "2023-01"]
+    }
+    assert {(force, month) for force, month, _ in results} == expected
+    assert sorted(requests) == sorted(expected)
+    assert all(searches == [{"force": force}] for force, _, searches in results)
+
+
 if __name__ == "__main__":
     import subprocess
 
@@ -0,0 +1,45 @@
+import json
+
+import httpx
+import pytest
+
+from uk_police_client import StopAndSearchClient
+from uk_police_client.streaming import iter_json_array
+
+
+def test_iter_json_array_handles_any_chunking():
+    """Records should parse identically however the body is split into chunks."""
+    records = [{"id": i, "street": "On or near Café Street"} for i in range(20)]
+    records += [1, -2.5e3, None, "text", True]
+    body = json.dumps(records).encode()
+
+    for size in (1, 2, 7, 64, len(body)):
+        chunks = (body[i : i + size] for i in range(0, len(body), size))
+        assert list(iter_json_array(chunks)) == records
+
+
+def test_iter_json_array_rejects_truncated_bodies():
+    """A body that ends before the array is closed should raise."""
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"id": 1}, {"id"']))
+
+
+def test_stream_stops_by_force_yields_records(mock_client):
+    """StopAndSearchClient.stream_stops_by_force should yield the records one by one."""
+    searches = [{"type": "Person search", "force": i} for i in range(100)]
+
+    def handler(request):
+        return httpx.Response(200, content=json.dumps(searches).encode())
+
+    client = mock_client(StopAndSearchClient, handler)
+
+    stream = client.stream_stops_by_force("leicestershire", "2022-03")
+
+    assert not isinstance(stream, list)
+    assert list(stream) == searches
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
@@ -0,0 +1,222 @@
+import threading
+
+import httpx
+import pytest
+
+from uk_police_client import (
+    DirectoryStore,
+    MemoryCache,
+    RetryPolicy,
+    SyncEngine,
+    UKPoliceClient,
+)
+from uk_police_client.sync import SyncStore, shift_month
+
+SQUARES = {
+    "N1": [(52.0, -1.0), (52.0, -0.9), (52.1, -0.9), (52.1, -1.0)],
+    "N2": [(52.1, -1.0), (52.1, -0.9), (52.2, -0.9), (52.2, -1.0)],
+}
+
+
+def crime(id, lat, lng, month):
+    location = {"latitude": str(lat), "longitude": str(lng), "street": {"id": id}}
+    return {"id": id, "month": month, "location": location}
+
+
+class FakeAPI:
+    def __init__(self, published):
+        self.published = published
+        self.fail = False
+        self.months = []
+        self.outcome_refusals = 0
+
+    def __call__(self, request):
+        path = request.url.path[len("/api") :]
+        params = dict(request.url.params)
+        if request.method == "POST":
+            params.update(httpx.QueryParams(request.content.decode()))
+        if path == "/crime-last-updated":
+            return httpx.Response(200, json={"date": f"{self.published}-01"})
+        if path == "/leicestershire/neighbourhoods":
+            return httpx.Response(200, json=[{"id": "N1"}, {"id": "N2"}])
+        if path.endswith("/boundary"):
+            square = SQUARES[path.split("/")[2]]
+            return httpx.Response(
+                200,
+                json=[{"latitude": str(a), "longitude": str(b)} for a, b in square],
+            )
+        month = params["date"]
+        self.months.append(month)
+        if self.fail:
+            return httpx.Response(404)
+        if path == "/crimes-street/all-crime":
+            return httpx.Response(
+                200,
+                json=[
+                    crime(1, 52.05, -0.95, month),
+                    crime(2, 52.15, -0.95, month),
+                    # Outside both squares, e.g. in a gap between neighbourhoods.
+                    crime(3, 52.1003, -0.8997, month),
+                ],
+            )
+        if path == "/crimes-no-location":
+            return httpx.Response(
+                200, json=[{"id": 4, "month": month, "location": None}]
+            )
+        if path == "/outcomes-at-location":
+            if self.outcome_refusals:
+                self.outcome_refusals -= 1
+                return httpx.Response(503)
+            outcome = {
+                "category": {"code": "charged"},
+                "date": month,
+                "person_id": None,
+            }
+            return httpx.Response(
+                200, json=[dict(outcome, crime=crime(1, 52.05, -0.95, month))]
+            )
+        if path == "/stops-force":
+            return httpx.Response(200, json=[{"type": "Person search"}])
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def engine(mock_client):
+    """Builds SyncEngines syncing leicestershire from a FakeAPI."""
+
+    def build(api, store, **kwargs):
+        client = mock_client(
+            UKPoliceClient,
+            api,
+            reference_cache=MemoryCache(maxsize=0),
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+        return SyncEngine(client, store, forces=["leicestershire"], **kwargs)
+
+    return build
+
+
+def test_shift_month():
+    """Months should roll over years in both directions."""
+    assert shift_month("2024-01", -1) == "2023-12"
+    assert shift_month("2023-12", 1) == "2024-01"
+    assert shift_month("2024-05", -17) == "2022-12"
+
+
+def test_first_run(tmp_path, engine):
+    """The first run should fetch the initial months of every dataset."""
+    store = DirectoryStore(str(tmp_path))
+    api = FakeAPI("2024-03")
+
+    report = engine(api, store, initial_months=2).run()
+
+    assert report.months == ["2024-02", "2024-03"]
+    assert report.partitions == 6
+    assert store.watermark() == "2024-03"
+    crimes = store.read("crimes", "leicestershire", "2024-03")
+    assert sorted(crime["id"] for crime in crimes) == [1, 2, 3, 4]
+    assert len(store.read("outcomes", "leicestershire", "2024-02")) == 1
+    assert store.read("stops", "leicestershire", "2024-03") == [
+        {"type": "Person search"}
+    ]
+
+
+def test_only_new_months_are_fetched(tmp_path, engine):
+    """Later runs should fetch nothing until a new month is published."""
+    store = DirectoryStore(str(tmp_path))
+    api = FakeAPI("2024-03")
+    engine(api, store).run()
+
+    api.months.clear()
+    report = engine(api, store).run()
+    assert report.months == [] and api.months == []
+
+    api.published = "2024-04"
+    report = engine(api, store).run()
+    assert report.months == ["2024-03", "2024-04"]
+    assert set(api.months) == {"2024-03", "2024-04"}
+    assert store.watermark() == "2024-04"
+
+    api.published = "2024-05"
+    report = engine(api, store, refetch_previous=False).run()
+    assert report.months == ["2024-05"]
+
+
+def test_failed_run_keeps_watermark(tmp_path, engine):
+    """A failing run should leave the watermark for the next run to retry."""
+    store = DirectoryStore(str(tmp_path))
+    store.set_watermark("2024-02")
+    api = FakeAPI("2024-03")
+    api.fail = True
+
+    with pytest.raises(httpx.HTTPStatusError):
+        engine(api, store).run()
+
+    assert store.watermark() == "2024-02"
+
+
+def test_unknown_dataset(tmp_path, engine):
+    """Unknown datasets should be rejected up front."""
+    with pytest.raises(ValueError):
+        engine(FakeAPI("2024-03"), DirectoryStore(str(tmp_path)), datasets=["crime"])
+
+
+def test_sync_store_is_abstract():
+    """Stores missing a method should fail when created, not halfway through a run."""
+
+    class WatermarkOnly(SyncStore):
+        def watermark(self):
+            return None
+
+        def set_watermark(self, month):
+            pass
+
+    with pytest.raises(TypeError):
+        SyncStore()
+    with pytest.raises(TypeError):
+        WatermarkOnly()
+
+
+def test_nested_requests_share_one_pool(tmp_path, engine):
+    """Partitions, neighbourhoods and quadrants should share max_workers threads."""
+    api = FakeAPI("2024-03")
+    threads = set()
+
+    def handler(request):
+        threads.add(threading.get_ident())
+        return api(request)
+
+    sync = engine(handler, DirectoryStore(str(tmp_path)), initial_months=3)
+    sync.client.max_workers = 2
+
+    report = sync.run()
+
+    assert report.partitions == 9
+    # The pool's two threads, plus the caller's for the release date and forces.
+    assert len(threads) <= 3
+
+
+def test_dense_outcome_areas_are_split(tmp_path, engine):
+    """Outcome polygons refused for matching too many records should be split."""
+    store = DirectoryStore(str(tmp_path))
+    api = FakeAPI("2024-03")
+    api.outcome_refusals = 2
+
+    engine(api, store, datasets=["outcomes"]).run()
+
+    assert api.outcome_refusals == 0
+    assert len(store.read("outcomes", "leicestershire", "2024-03")) == 1
+
+
+def test_engine_requires_dict_output(tmp_path, mock_client):
+    """Records are stored as JSON, so other output formats should be rejected."""
+    client = mock_client(UKPoliceClient, FakeAPI("2024-03"), output="record")
+
+    with pytest.raises(ValueError):
+        SyncEngine(client, DirectoryStore(str(tmp_path)))
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
@@ -0,0 +1,176 @@
+import httpx
+import pytest
+
+from uk_police_client import (
+    BoundaryStore,
+    DensityGrid,
+    NeighbourhoodIndex,
+    TilePlanner,
+    UKPoliceClient,
+)
+from uk_police_client.boundary_store import write_boundary_store
+from uk_police_client.geometry import bounding_box, parse_poly
+from uk_police_client.tiling import plan_tiles
+
+BOX = (0.0, 0.0, 1.0, 1.0)
+# A dense town in one corner and a few crimes elsewhere.
+CRIMES = [
+    {
+        "id": i,
+        "location": {
+            "latitude": str(0.103 + i % 5 / 100),
+            "longitude": str(0.103 + i // 5 / 100),
+        },
+    }
+    for i in range(30)
+] + [
+    {"id": 100 + i, "location": {"latitude": str(lat), "longitude": str(lng)}}
+    for i, (lat, lng) in enumerate([(0.7, 0.7), (0.3, 0.8), (0.9, 0.2), (0.5, 0.5)])
+]
+
+
+def _handler(requests, limit=12, routes=None):
+    """A mock API whose crimes endpoint refuses areas with over `limit` crimes."""
+
+    def handler(request):
+        path = request.url.path
+        if routes and path in routes:
+            return httpx.Response(200, json=routes[path])
+        requests.append(request)
+        min_lat, min_lng, max_lat, max_lng = bounding_box(
+            parse_poly(request.url.params["poly"])
+        )
+        matches = [
+            crime
+            for crime in CRIMES
+            if min_lat <= float(crime["location"]["latitude"]) <= max_lat
+            and min_lng <= float(crime["location"]["longitude"]) <= max_lng
+        ]
+        if len(matches) > limit:
+            return httpx.Response(503)
+        return httpx.Response(200, json=matches)
+
+    return handler
+
+
+def test_plan_tiles_uniform_without_density():
+    """Without a density grid the box should be cut into a uniform grid."""
+    tiles = plan_tiles(BOX, tile_size=0.3)
+
+    assert len(tiles) == 16
+    assert sum((t[2] - t[0]) * (t[3] - t[1]) for t in tiles) == pytest.approx(1.0)
+
+
+def test_plan_tiles_follows_density():
+    """Dense areas should get small tiles and sparse ones large tiles."""
+    density = DensityGrid(cell_size=0.01)
+    density.add(CRIMES)
+
+    tiles = plan_tiles(BOX, density, target=10)
+    points = density.points(BOX)
+
+    assert sum((t[2] - t[0]) * (t[3] - t[1]) for t in tiles) == pytest.approx(1.0)
+    for tile in tiles:
+        inside = [
+            count
+            for lat, lng, count in points
+            if tile[0] <= lat < tile[2] and tile[1] <= lng < tile[3]
+        ]
+        assert sum(inside) <= 10
+    town = [t for t in tiles if t[0] <= 0.12 <= t[2] and t[1] <= 0.12 <= t[3]]
+    assert (town[0][2] - town[0][0]) * (town[0][3] - town[0][1]) < 0.1
+    assert len(tiles) < 10
+
+
+def test_density_grid_averages_and_persists(tmp_path):
+    """Counts should be averaged per month and survive a save/load round trip."""
+    density = DensityGrid(cell_size=0.5)
+    density.add(CRIMES)
+    density.add(CRIMES[:10] + [{"id": 0, "location": None}])
+    path = str(tmp_path / "density.grid")
+
+    density.save(path)
+    loaded = DensityGrid.load(path)
+
+    assert loaded.months == 2
+    assert sorted(loaded.points(BOX)) == sorted(density.points(BOX))
+    assert (0.25, 0.25, 20.0) in loaded.points(BOX)
+
+
+def test_sweep_learns_density(mock_client):
+    """A sweep should return every crime once, and the next one need fewer requests."""
+    planner = TilePlanner(DensityGrid(cell_size=0.01), target=10, tile_size=0.5)
+    first_requests, second_requests = [], []
+
+    first = planner.sweep(
+        mock_client(UKPoliceClient, _handler(first_requests)), BOX, "2024-01"
+    )
+    second = planner.sweep(
+        mock_client(UKPoliceClient, _handler(second_requests)), BOX, "2024-02"
+    )
+
+    assert sorted(crime["id"] for crime in first) == sorted(c["id"] for c in CRIMES)
+    assert sorted(crime["id"] for crime in second) == sorted(c["id"] for c in CRIMES)
+    assert planner.density.months == 2
+    assert len(second_requests) < len(first_requests)
+    assert all(request.url.params["date"] == "2024-02" for request in second_requests)
+
+
+def test_plan_clips_polygons():
+    """Tiles of a polygon area should be clipped to it."""
+    triangle = [(0.0, 0.0), (0.0, 1.0), (1.0, 0.0)]
+
+    polys = TilePlanner(tile_size=0.5).plan(triangle)
+
+    assert len(polys) == 3
+    assert all(
+        lat + lng <= 1.0 + 1e-9 for poly in polys for lat, lng in parse_poly(poly)
+    )
+
+
+def test_sweep_force(mock_client):
+    """Only tiles overlapping the force's neighbourhoods should be requested."""
+    square = [(0.0, 0.0), (0.0, 0.2), (0.2, 0.2), (0.2, 0.0)]
+    routes = {
+        "/api/leicestershire/neighbourhoods": [{"id": "NC04", "name": "City"}],
+        "/api/leicestershire/NC04/boundary": [
+            {"latitude": str(lat), "longitude": str(lng)} for lat, lng in square
+        ],
+    }
+    requests = []
+    planner = TilePlanner(tile_size=0.5)
+
+    client = mock_client(UKPoliceClient, _handler(requests, limit=100, routes=routes))
+
+    crimes = planner.sweep_force(client, "leicestershire", "2024-01")
+
+    assert sorted(crime["id"] for crime in crimes) == list(range(30))
+    assert len(requests) == 1
+
+
+def test_plan_skips_tiles_without_neighbourhoods(tmp_path, mock_client):
+    """Tiles overlapping no neighbourhood, e.g. at sea, should not be requested."""
+    square = [(0.0, 0.0), (0.0, 0.2), (0.2, 0.2), (0.2, 0.0)]
+    index = NeighbourhoodIndex.from_boundaries([("leicestershire", "NC04", square)])
+    path = str(tmp_path / "boundaries.bin")
+    write_boundary_store(path, [("leicestershire", "NC04", square)])
+    requests = []
+
+    assert len(TilePlanner(tile_size=0.25).plan(BOX)) == 16
+    assert len(TilePlanner(tile_size=0.25, neighbourhoods=index).plan(BOX)) == 1
+    with BoundaryStore(path) as store:
+        client = mock_client(
+            UKPoliceClient, _handler(requests, limit=100), boundary_store=store
+        )
+        planner = TilePlanner(tile_size=0.25)
+        crimes = planner.sweep(client, BOX, "2024-01")
+
+    assert sorted(crime["id"] for crime in crimes) == list(range(30))
+    assert len(requests) == 1
+    assert planner.neighbourhoods is None
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
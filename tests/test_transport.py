@@ -0,0 +1,94 @@
+import asyncio
+
+import httpx
+import pytest
+
+from uk_police_client import (
+    AsyncForcesClient,
+    AsyncSharedTransport,
+    ForcesClient,
+    MemoryCache,
+    SharedTransport,
+    TokenBucket,
+    UKPoliceClient,
+)
+from uk_police_client.transport import pool_limits
+
+FORCES = [{"id": "leicestershire", "name": "Leicestershire Police"}]
+
+
+class CountingTransport(httpx.MockTransport):
+    def __init__(self):
+        super().__init__(self.handle)
+        self.requests = 0
+        self.closed = False
+
+    def handle(self, request):
+        self.requests += 1
+        return httpx.Response(200, json=FORCES)
+
+    def close(self):
+        self.closed = True
+
+    async def aclose(self):
+        self.closed = True
+
+
+def options():
+    return dict(
+        rate_limiter=TokenBucket(rate=1000, burst=1000),
+        reference_cache=MemoryCache(maxsize=0),
+    )
+
+
+def test_clients_share_transport():
+    """Closing clients should leave a shared pool open until it is shut down."""
+    inner = CountingTransport()
+    shared = SharedTransport(transport=inner)
+
+    with ForcesClient(transport=shared, **options()) as first:
+        assert first.get_forces() == FORCES
+    with UKPoliceClient(transport=shared, **options()) as second:
+        assert second.get_forces() == FORCES
+    third = ForcesClient(transport=shared, **options())
+    third.close()
+
+    assert inner.requests == 2
+    assert not inner.closed
+    shared.shutdown()
+    assert inner.closed
+
+
+def test_async_clients_share_transport():
+    """Async clients should share an AsyncSharedTransport the same way."""
+    inner = CountingTransport()
+    shared = AsyncSharedTransport(transport=inner)
+
+    async def main():
+        for _ in range(3):
+            async with AsyncForcesClient(transport=shared, **options()) as client:
+                assert await client.get_forces() == FORCES
+        assert not inner.closed
+        await shared.shutdown()
+
+    asyncio.run(main())
+
+    assert inner.requests == 3
+    assert inner.closed
+
+
+@pytest.mark.no_cassette
+def test_pool_limits():
+    """Clients without a transport should build their own pool with the limits."""
+    client = ForcesClient(limits=pool_limits(max_connections=4))
+
+    pool = client.client._transport._pool
+
+    assert pool._max_connections == 4
+    client.close()
+
+
+if __name__ == "__main__":
+    import subprocess
+
+    subprocess.call(["pytest", "--tb=short", str(__file__)])
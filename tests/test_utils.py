@@ -1,6 +1,14 @@
 import pytest
 from datetime import datetime
-from uk_police_client.utils import format_date
+from uk_police_client.utils import (
+    UNKNOWN_OUTCOME,
+    court_outcome_ids,
+    format_date,
+    is_case_closed,
+    month_range,
+    outcome_id,
+    outcome_ids,
+)
 
 
 def test_format_date():
@@ -31,6 +39,60 @@ def test_format_date():
         format_date("invalid_date_format")
 
 
+def test_month_range():
+    """Test that month_range lists every month between two dates, inclusive."""
+    assert month_range("2021-11", "2022-02") == [
+        "2021-11",
+        "2021-12",
+        "2022-01",
+        "2022-02",
+    ]
+    assert month_range(datetime(2022, 6, 15), "2022-06-01") == ["2022-06"]
+    assert month_range("2022-06", "2022-05") == []
+
+
+def test_is_case_closed():
+    """Test that only cases whose latest outcome is final count as closed."""
+
+    def outcome(code, date):
+        return {"category": {"code": code}, "date": date}
+
+    assert not is_case_closed({"outcomes": []})
+    assert not is_case_closed(
+        {"outcomes": [outcome("imprisoned", "2022-04"), outcome("charged", "2022-05")]}
+    )
+    assert is_case_closed(
+        {"outcomes": [outcome("charged", "2022-04"), outcome("imprisoned", "2022-05")]}
+    )
+    assert is_case_closed(
+        {"outcomes": [outcome("charged", "2022-05"), outcome("fined", "2022-05")]}
+    )
+
+
+def test_unknown_outcomes_keep_cases_open():
+    """Test that new codes and missing categories are never treated as final."""
+    assert not is_case_closed(
+        {"outcomes": [{"category": {"code": "new-outcome"}, "date": "2022-05"}]}
+    )
+    assert not is_case_closed({"outcomes": [{"category": None, "date": "2022-05"}]})
+    assert not is_case_closed({"outcomes": [{"date": "2022-05"}]})
+
+
+def test_outcome_ids():
+    """Test that codes, labels and categories normalise to the same ids."""
+    charged = court_outcome_ids["charged"]
+
+    assert outcome_id("charged") == charged
+    assert outcome_id("Suspect charged") == charged
+    assert outcome_id({"code": "charged", "name": "Suspect charged"}) == charged
+    assert outcome_id(" suspect CHARGED ") == charged
+    assert outcome_id(None) == outcome_id("made-up") == UNKNOWN_OUTCOME
+    assert outcome_ids(
+        ["Suspect charged", {"code": "charged"}, None, "Under investigation"]
+    ).tolist() == [charged, charged, UNKNOWN_OUTCOME, outcome_id("under-investigation")]
+    assert sorted(court_outcome_ids.values()) == list(range(len(court_outcome_ids)))
+
+
 if __name__ == "__main__":
     import subprocess
 
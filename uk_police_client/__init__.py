@@ -4,4 +4,28 @@ from uk_police_client.clients import (
     NeighbourhoodsClient,
     StopAndSearchClient,
     UKPoliceClient,
+    AsyncForcesClient,
+    AsyncCrimesClient,
+    AsyncNeighbourhoodsClient,
+    AsyncStopAndSearchClient,
+    AsyncUKPoliceClient,
+)
+from uk_police_client.rate_limiter import TokenBucket, configure_rate_limit
+from uk_police_client.retry import RetryPolicy, RetryStats
+from uk_police_client.cache import MemoryCache, ResponseCache
+from uk_police_client.frames import CrimeFrame
+from uk_police_client.records import CrimeRecord, StopAndSearchRecord
+from uk_police_client.neighbourhood_index import NeighbourhoodIndex
+from uk_police_client.boundary_store import BoundaryStore
+from uk_police_client.transport import AsyncSharedTransport, SharedTransport
+from uk_police_client.cassette import AsyncCassetteTransport, CassetteTransport
+from uk_police_client.sync import DirectoryStore, SyncEngine
+from uk_police_client.sqlite_store import SQLiteStore
+from uk_police_client.tiling import DensityGrid, TilePlanner
+from uk_police_client.singleflight import AsyncSingleFlight, SingleFlight
+from uk_police_client.instrumentation import (
+    Instrument,
+    MetricsRecorder,
+    OpenTelemetryInstrument,
+    PrometheusInstrument,
 )
@@ -0,0 +1,184 @@
+"""
+    Memory-mapped snapshot of neighbourhood boundaries
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from uk_police_client.geometry import Point
+
+MAGIC = b"UKPB"
+FORMAT_VERSION = 1
+# Magic, format version and length of the JSON offset index, little-endian.
+HEADER = struct.Struct("<4sII")
+
+
+def write_boundary_store(
+    path: str, boundaries: Iterable[Tuple[str, str, List[Point]]]
+) -> int:
+    """
+    Writes boundaries to a file readable by BoundaryStore.
+
+    The file holds a small header, a JSON index of (force_id, neighbourhood_id,
+    offset, point count) entries and then every boundary as packed little-endian
+    float64 (latitude, longitude) pairs, aligned to 8 bytes.
+
+    Args:
+        path: Path of the file, which is overwritten.
+        boundaries: (force_id, neighbourhood_id, points) tuples.
+
+    Returns:
+        The number of boundaries written.
+    """
+    coordinates = array("d")
+    entries = []
+    for force_id, neighbourhood_id, points in boundaries:
+        entries.append([force_id, neighbourhood_id, len(coordinates), len(points)])
+        for lat, lng in points:
+            coordinates.append(lat)
+            coordinates.append(lng)
+    if sys.byteorder != "little":
+        coordinates.byteswap()
+    index = json.dumps(entries).encode()
+    index += b" " * (-(HEADER.size + len(index)) % 8)
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, FORMAT_VERSION, len(index)))
+        file.write(index)
+        file.write(coordinates.tobytes())
+    return len(entries)
+
+
+class BoundaryStore:
+    """
+    Read-only neighbourhood boundaries served from a memory-mapped snapshot.
+
+    Opening a store only reads its offset index; coordinates stay in the mapped
+    file, shared with the OS page cache, and are exposed without copying until a
+    boundary is converted to Python objects.
+
+    Build a snapshot with `NeighbourhoodsClient.snapshot_boundaries(path)` or
+    `python -m uk_police_client.boundary_store PATH [FORCE ...]`.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens a boundary snapshot.
+
+        Args:
+            path: Path of a file written by write_boundary_store.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_length = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._mmap.close()
+            raise ValueError(f"Unsupported boundary store file: {path}")
+        data_start = HEADER.size + index_length
+        entries = json.loads(self._mmap[HEADER.size : data_start])
+        self._index: Dict[Tuple[str, str], Tuple[int, int]] = {
+            (force_id, neighbourhood_id): (offset, count)
+            for force_id, neighbourhood_id, offset, count in entries
+        }
+        self._coordinates = memoryview(self._mmap)[data_start:].cast("d")
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._index
+
+    def keys(self) -> List[Tuple[str, str]]:
+        """The (force_id, neighbourhood_id) pairs in the store."""
+        return list(self._index)
+
+    def coordinates(self, force_id: str, neighbourhood_id: str) -> memoryview:
+        """
+        Returns a boundary as a flat view of the mapped coordinates.
+
+        Args:
+            force_id: The unique identifier of the police force.
+            neighbourhood_id: The unique identifier of the neighbourhood.
+
+        Returns:
+            A float64 memoryview of alternating latitudes and longitudes, e.g. for
+            `numpy.frombuffer(view).reshape(-1, 2)`.
+        """
+        offset, count = self._index[(force_id, neighbourhood_id)]
+        view = self._coordinates[offset : offset + 2 * count]
+        if sys.byteorder != "little":
+            swapped = array("d", view)
+            swapped.byteswap()
+            return memoryview(swapped)
+        return view
+
+    def points(self, force_id: str, neighbourhood_id: str) -> List[Point]:
+        """
+        Returns a boundary as a list of points.
+
+        Args:
+            force_id: The unique identifier of the police force.
+            neighbourhood_id: The unique identifier of the neighbourhood.
+
+        Returns:
+            A list of (latitude, longitude) tuples.
+        """
+        flat = self.coordinates(force_id, neighbourhood_id).tolist()
+        return list(zip(flat[::2], flat[1::2]))
+
+    def boundary(self, force_id: str, neighbourhood_id: str) -> List[Dict[str, str]]:
+        """
+        Returns a boundary in the format of get_neighbourhood_boundary.
+
+        Args:
+            force_id: The unique identifier of the police force.
+            neighbourhood_id: The unique identifier of the neighbourhood.
+
+        Returns:
+            A list of dictionaries with 'latitude' and 'longitude' strings.
+        """
+        return [
+            {"latitude": str(lat), "longitude": str(lng)}
+            for lat, lng in self.points(force_id, neighbourhood_id)
+        ]
+
+    def items(self) -> Iterator[Tuple[str, str, List[Point]]]:
+        """Yields (force_id, neighbourhood_id, points) for every boundary."""
+        for force_id, neighbourhood_id in self._index:
+            yield force_id, neighbourhood_id, self.points(force_id, neighbourhood_id)
+
+    def close(self) -> None:
+        """Unmaps the file. Views returned by `coordinates` must be released first."""
+        self._coordinates.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Downloads every neighbourhood boundary into a snapshot file."""
+    import argparse
+
+    from uk_police_client.clients import UKPoliceClient
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("path", help="file to write the snapshot to")
+    parser.add_argument("forces", nargs="*", help="force IDs, defaults to all forces")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent requests")
+    args = parser.parse_args(argv)
+
+    client = UKPoliceClient(max_workers=args.workers)
+    count = client.snapshot_boundaries(args.path, args.forces or None)
+    print(f"Wrote {count} boundaries to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
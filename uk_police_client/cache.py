@@ -0,0 +1,279 @@
+"""
+    Response caches for UK Police API data
+"""
+
+import copy
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+# Release recorded for responses that never change again, e.g. closed cases.
+FINAL = "final"
+
+
+def cache_key(endpoint: str, params: Optional[dict] = None) -> str:
+    """
+    Builds a cache key that does not depend on parameter order or HTTP method.
+
+    Args:
+        endpoint: The API endpoint of the request.
+        params: Optional dictionary of parameters. Parameters set to None are ignored.
+
+    Returns:
+        A string identifying the request.
+    """
+    items = sorted(
+        (str(name), str(value).strip())
+        for name, value in (params or {}).items()
+        if value is not None
+    )
+    return endpoint + "?" + "&".join(f"{name}={value}" for name, value in items)
+
+
+def request_month(params: Optional[dict]) -> Optional[str]:
+    """
+    Extracts the month a request is for.
+
+    Args:
+        params: Optional dictionary of parameters.
+
+    Returns:
+        The 'date' parameter if it is a YYYY-MM month, else None (the latest month).
+    """
+    date = str((params or {}).get("date") or "").strip()
+    return date[:7] if re.match(r"^\d{4}-\d{2}$", date[:7]) else None
+
+
+class CacheEntry(NamedTuple):
+    """A cached response together with the data release it was fetched from."""
+
+    data: Any
+    month: Optional[str]
+    published: str
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache for responses of month-based endpoints.
+
+    Every entry remembers the month it was requested for and the month of the latest
+    data release (from /crime-last-updated) at the time it was fetched. Entries for a
+    month older than that release never change again and are served without any
+    network access. Entries for the latest month, or requests without a date, are
+    only reused while the latest release is still the same; the release itself is
+    looked up at most once every `revalidate_after` seconds.
+    """
+
+    def __init__(
+        self, path: str = "uk_police_cache.sqlite", revalidate_after: float = 3600
+    ):
+        """
+        Initializes the ResponseCache, creating the database if needed.
+
+        Args:
+            path: Location of the SQLite database file, or ":memory:".
+            revalidate_after: Seconds for which the latest release month is trusted
+                before it is fetched again, defaults to one hour.
+        """
+        self.path = path
+        self.revalidate_after = revalidate_after
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._published = None
+        self._published_at = 0.0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " month TEXT,"
+                " published TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " body BLOB NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Looks up an entry regardless of whether it is still valid.
+
+        Args:
+            key: The key built by `cache_key`.
+
+        Returns:
+            The stored entry, or None if there is none.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, month, published FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        body, month, published = row
+        return CacheEntry(json.loads(zlib.decompress(body)), month, published)
+
+    def set(self, key: str, data: Any, month: Optional[str], published: str) -> None:
+        """
+        Stores a response.
+
+        Args:
+            key: The key built by `cache_key`.
+            data: The decoded JSON response.
+            month: The month the request was made for, or None for the latest month.
+            published: The latest release month when the response was fetched.
+        """
+        body = zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, month, published, time.time(), body),
+            )
+
+    def is_immutable(self, entry: CacheEntry) -> bool:
+        """
+        Checks whether an entry is final, or for a month older than the release it
+        came from.
+        """
+        if entry.published == FINAL:
+            return True
+        return entry.month is not None and entry.month < entry.published
+
+    @property
+    def published_month(self) -> Optional[str]:
+        """The latest release month in YYYY-MM format, or None if unknown or stale."""
+        if self._published is None or self._is_stale():
+            return None
+        return self._published
+
+    def set_published_month(self, last_updated: dict) -> str:
+        """
+        Records a /crime-last-updated response as the latest release.
+
+        Args:
+            last_updated: The response, e.g. {"date": "2022-05-01"}.
+
+        Returns:
+            The release month in YYYY-MM format.
+        """
+        self._published = last_updated["date"][:7]
+        self._published_at = time.monotonic()
+        return self._published
+
+    def _is_stale(self) -> bool:
+        return time.monotonic() - self._published_at > self.revalidate_after
+
+    def record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def clear(self) -> None:
+        """Removes every stored response."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        self._db.close()
+
+
+class MemoryCache:
+    """
+    Bounded in-process LRU cache with a time-to-live, for near-static reference data
+    such as the list of forces or crime categories.
+
+    Callers receive a copy of the cached value, so mutating a result never affects
+    later calls.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        """
+        Initializes the MemoryCache.
+
+        Args:
+            maxsize: Maximum number of entries kept; the least recently used entry is
+                evicted first. Use 0 to disable caching.
+            ttl: Seconds an entry stays valid, defaults to one hour.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Looks up a valid entry.
+
+        Args:
+            key: The key built by `cache_key`.
+
+        Returns:
+            A copy of the cached value, or None if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                value = entry[1]
+            else:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Stores a value, evicting the least recently used entries beyond `maxsize`.
+
+        Args:
+            key: The key built by `cache_key`.
+            value: The value to cache.
+        """
+        if self.maxsize <= 0:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str = "") -> int:
+        """
+        Removes entries whose key starts with `prefix`, e.g. "/forces".
+
+        Args:
+            prefix: Endpoint prefix to match, defaults to every entry.
+
+        Returns:
+            The number of entries removed.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the hit, miss and size counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+
+# Shared by every client in the process unless one is given its own cache.
+default_reference_cache = MemoryCache()
@@ -0,0 +1,290 @@
+"""
+    Record/replay transports for deterministic, network-free runs
+"""
+
+import base64
+import gzip
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Union
+from urllib.parse import parse_qsl
+
+import httpx
+
+from uk_police_client.cache import cache_key
+
+FORMAT_VERSION = 1
+MODES = ("once", "record", "replay")
+# Headers describing the original encoding of the body, which is stored decoded.
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding", "connection"}
+)
+
+
+class UnrecordedRequest(LookupError):
+    """Raised in replay mode for a request missing from the cassette."""
+
+
+class Cassette:
+    """
+    Responses recorded to a gzip-compressed JSON file, keyed by endpoint and
+    parameters.
+
+    Keys ignore the HTTP method and parameter order, like the response cache, so a
+    polygon query recorded as a GET replays when it is sent as a POST. Responses
+    with a retryable status (429 and 5xx) are never recorded.
+
+    Modes:
+        once: Replay recorded requests and record the others (the default).
+        record: Send every request and record its response, replacing older ones.
+        replay: Never touch the network; unrecorded requests raise
+            UnrecordedRequest.
+    """
+
+    def __init__(self, path: str, mode: str = "once"):
+        """
+        Opens a cassette, loading its file if it exists.
+
+        Args:
+            path: Location of the cassette file, e.g. "cassettes/crimes.json.gz".
+            mode: "once", "record" or "replay", defaults to "once".
+        """
+        if mode not in MODES:
+            raise ValueError(
+                f"Unknown cassette mode {mode!r}; expected one of {MODES}."
+            )
+        self.path = path
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.interactions: Dict[str, dict] = {}
+        if os.path.exists(path):
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                payload = json.load(file)
+            if payload.get("version") != FORMAT_VERSION:
+                raise ValueError(f"Unsupported cassette file: {path}")
+            self.interactions = payload["interactions"]
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    @staticmethod
+    def key(request: httpx.Request) -> str:
+        """
+        Builds the key a request is recorded under.
+
+        Args:
+            request: The request.
+
+        Returns:
+            The path of the request followed by its sorted query or form parameters.
+        """
+        params = parse_qsl(request.url.query.decode(), keep_blank_values=True)
+        if request.method == "POST":
+            params += parse_qsl(request.content.decode(), keep_blank_values=True)
+        return cache_key(request.url.path, dict(params))
+
+    def play(self, request: httpx.Request) -> Optional[httpx.Response]:
+        """
+        Looks up the recorded response to a request.
+
+        Args:
+            request: The request.
+
+        Returns:
+            A new response, or None if the request should be sent.
+
+        Raises:
+            UnrecordedRequest: In replay mode, if the request was not recorded.
+        """
+        if self.mode == "record":
+            return None
+        interaction = self.interactions.get(self.key(request))
+        if interaction is None:
+            if self.mode == "replay":
+                raise UnrecordedRequest(
+                    f"{request.method} {request.url} is not in cassette {self.path}"
+                )
+            return None
+        return _response(interaction, request)
+
+    def record(
+        self, request: httpx.Request, response: httpx.Response
+    ) -> httpx.Response:
+        """
+        Records the response to a request, whose body must have been read.
+
+        Args:
+            request: The request.
+            response: Its response.
+
+        Returns:
+            A new response replaying the recorded one.
+        """
+        interaction = {
+            "status": response.status_code,
+            "headers": [
+                [name, value]
+                for name, value in response.headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+            ],
+        }
+        try:
+            interaction["body"] = response.content.decode("utf-8")
+        except UnicodeDecodeError:
+            interaction["body"] = base64.b64encode(response.content).decode()
+            interaction["base64"] = True
+        status = response.status_code
+        if status != 429 and status < 500:
+            with self._lock:
+                self.interactions[self.key(request)] = interaction
+                self._dirty = True
+        return _response(interaction, request)
+
+    def save(self) -> None:
+        """Writes the cassette to its file if new responses were recorded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {"version": FORMAT_VERSION, "interactions": self.interactions}
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temporary = self.path + ".tmp"
+            with gzip.open(temporary, "wt", encoding="utf-8") as file:
+                json.dump(payload, file, sort_keys=True)
+            os.replace(temporary, self.path)
+            self._dirty = False
+
+
+def _response(interaction: dict, request: httpx.Request) -> httpx.Response:
+    """Builds a response from a recorded interaction."""
+    body = interaction["body"]
+    content = base64.b64decode(body) if interaction.get("base64") else body.encode()
+    return httpx.Response(
+        interaction["status"],
+        headers=interaction["headers"],
+        content=content,
+        request=request,
+    )
+
+
+def _open(cassette: Union[str, Cassette], mode: str) -> Cassette:
+    return cassette if isinstance(cassette, Cassette) else Cassette(cassette, mode)
+
+
+class CassetteTransport(httpx.BaseTransport):
+    """
+    Transport answering requests from a cassette, sending and recording the ones
+    it does not hold. Pass it as `transport` to any client.
+
+    Closing the transport, e.g. by closing the client, saves the cassette.
+    """
+
+    def __init__(
+        self,
+        cassette: Union[str, Cassette],
+        mode: str = "once",
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        """
+        Initializes the CassetteTransport.
+
+        Args:
+            cassette: A Cassette, or the path of its file.
+            mode: Mode of the cassette when a path is given, defaults to "once".
+            transport: Optional transport sending the requests to record, defaults
+                to a new connection pool.
+        """
+        self.cassette = _open(cassette, mode)
+        self._transport = transport or httpx.HTTPTransport()
+        self._owns_transport = transport is None
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self.cassette.play(request)
+        if response is not None:
+            return response
+        response = self._transport.handle_request(request)
+        try:
+            response.read()
+        finally:
+            response.close()
+        return self.cassette.record(request, response)
+
+    def close(self) -> None:
+        self.cassette.save()
+        if self._owns_transport:
+            self._transport.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """
+    Async counterpart of CassetteTransport, for async clients.
+    """
+
+    def __init__(
+        self,
+        cassette: Union[str, Cassette],
+        mode: str = "once",
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initializes the AsyncCassetteTransport.
+
+        Args:
+            cassette: A Cassette, or the path of its file.
+            mode: Mode of the cassette when a path is given, defaults to "once".
+            transport: Optional transport sending the requests to record, defaults
+                to a new connection pool.
+        """
+        self.cassette = _open(cassette, mode)
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self._owns_transport = transport is None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = self.cassette.play(request)
+        if response is not None:
+            return response
+        response = await self._transport.handle_async_request(request)
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return self.cassette.record(request, response)
+
+    async def aclose(self) -> None:
+        self.cassette.save()
+        if self._owns_transport:
+            await self._transport.aclose()
+
+
+_active: Optional[Cassette] = None
+
+
+def active_cassette() -> Optional[Cassette]:
+    """The cassette installed by `use_cassette`, if any."""
+    return _active
+
+
+@contextmanager
+def use_cassette(path: str, mode: str = "once") -> Iterator[Cassette]:
+    """
+    Makes clients created inside the block without a `transport` use a cassette,
+    e.g. to run existing code or test suites without the network.
+
+    Args:
+        path: Location of the cassette file.
+        mode: "once", "record" or "replay", defaults to "once".
+
+    Yields:
+        The Cassette, which is saved when the block exits.
+    """
+    global _active
+    previous, _active = _active, Cassette(path, mode)
+    try:
+        yield _active
+    finally:
+        _active.save()
+        _active = previous
@@ -2,10 +2,28 @@ from uk_police_client.clients.crimes_client import CrimesClient
 from uk_police_client.clients.forces_client import ForcesClient
 from uk_police_client.clients.neighbourhoods_client import NeighbourhoodsClient
 from uk_police_client.clients.stop_search_client import StopAndSearchClient
+from uk_police_client.clients.async_crimes_client import AsyncCrimesClient
+from uk_police_client.clients.async_forces_client import AsyncForcesClient
+from uk_police_client.clients.async_neighbourhoods_client import (
+    AsyncNeighbourhoodsClient,
+)
+from uk_police_client.clients.async_stop_search_client import (
+    AsyncStopAndSearchClient,
+)
 
 
 class UKPoliceClient(
     ForcesClient, CrimesClient, NeighbourhoodsClient, StopAndSearchClient
 ):
-    def __init__(self, timeout=10):
-        super().__init__(timeout=timeout)
+    def __init__(self, timeout=10, **kwargs):
+        super().__init__(timeout=timeout, **kwargs)
+
+
+class AsyncUKPoliceClient(
+    AsyncForcesClient,
+    AsyncCrimesClient,
+    AsyncNeighbourhoodsClient,
+    AsyncStopAndSearchClient,
+):
+    def __init__(self, timeout=10, **kwargs):
+        super().__init__(timeout=timeout, **kwargs)
@@ -0,0 +1,597 @@
+import asyncio
+import contextvars
+
+import httpx
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from uk_police_client.clients.base_client import (
+    _area_method,
+    _merge_records,
+    _split_refused,
+)
+from uk_police_client.boundary_store import BoundaryStore
+from uk_police_client.cache import (
+    FINAL,
+    MemoryCache,
+    ResponseCache,
+    cache_key,
+    default_reference_cache,
+    request_month,
+)
+from uk_police_client.cassette import AsyncCassetteTransport, active_cassette
+from uk_police_client.decoding import check_output, decode
+from uk_police_client.geometry import format_poly, parse_poly
+from uk_police_client.instrumentation import Instrument, start_trace, timed_decode
+from uk_police_client.rate_limiter import TokenBucket, default_rate_limiter
+from uk_police_client.retry import (
+    RETRYABLE_EXCEPTIONS,
+    RetryPolicy,
+    RetryStats,
+    is_over_limit,
+)
+from uk_police_client.singleflight import AsyncSingleFlight
+from uk_police_client.streaming import aiter_json_array
+from uk_police_client.transport import pool_limits
+
+# Marks the tasks started by map and imap_unordered.
+_in_fan_out = contextvars.ContextVar("_in_fan_out", default=False)
+
+
+class AsyncBaseClient:
+    """Base client for accessing the UK Police API from asyncio code."""
+
+    BASE_URL = "https://data.police.uk/api"
+
+    def __init__(
+        self,
+        timeout=10,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_workers: int = 20,
+        max_url_length: int = 4094,
+        cache: Optional[ResponseCache] = None,
+        reference_cache: Optional[MemoryCache] = None,
+        output: str = "dict",
+        boundary_store: Optional[BoundaryStore] = None,
+        single_flight: Optional[AsyncSingleFlight] = None,
+        instruments: Optional[Iterable[Instrument]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+    ):
+        """
+        Initializes the AsyncBaseClient with an asynchronous HTTP client.
+
+        Args:
+            timeout: Timeout value for HTTP requests, defaults to 10 seconds.
+            rate_limiter: Optional token bucket to throttle requests with. Defaults to
+                the process-wide limiter shared by every client, sync or async.
+            retry_policy: Optional policy for retrying transient failures. Defaults to
+                RetryPolicy(); pass RetryPolicy(max_attempts=1) to disable retries.
+            max_workers: Number of requests in flight at once for calls that fan
+                out into several requests, defaults to 20, the number of connections
+                the default pool keeps alive. Fan-outs nested inside another one run
+                serially within its tasks.
+            max_url_length: Longest URL sent as a GET request by methods accepting a
+                custom area; longer requests are sent as a POST. Defaults to 4094, the
+                limit enforced by the API.
+            cache: Optional persistent cache for responses of month-based endpoints.
+            reference_cache: Optional in-memory cache for near-static reference data
+                (forces, crime categories, neighbourhood lists). Defaults to a cache
+                shared by every client; pass MemoryCache(maxsize=0) to disable it.
+            output: Format of responses. "dict" (the default) returns the JSON as
+                dictionaries; "frame" returns crime lists as CrimeFrame; "model"
+                returns pydantic models validated in bulk; "lazy_model" validates
+                each record of a list only when it is first accessed; "record"
+                returns crimes and stop and searches as compact __slots__ objects.
+            boundary_store: Optional snapshot of neighbourhood boundaries, which are
+                then read from it instead of being requested.
+            single_flight: Optional AsyncSingleFlight coalescing identical concurrent
+                requests. Defaults to one per client; share one between clients to
+                coalesce their requests too.
+            instruments: Optional Instrument objects notified of every request
+                attempt (latency, status, bytes, JSON decode time) and output
+                conversion, e.g. a MetricsRecorder or PrometheusInstrument.
+            transport: Optional httpx transport to send requests with. Pass one
+                AsyncSharedTransport to several clients to let them share a
+                connection pool. Inside a `cassette.use_cassette()` block, defaults
+                to replaying and recording the block's cassette.
+            limits: Optional connection limits of the client's own pool, e.g.
+                transport.pool_limits(max_connections=20). Ignored with `transport`.
+            http2: Whether the client's own pool negotiates HTTP/2; requires
+                `pip install httpx[http2]`. Ignored with `transport`.
+        """
+        if transport is None and active_cassette() is not None:
+            transport = AsyncCassetteTransport(active_cassette())
+        self.client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            timeout=timeout,
+            transport=transport,
+            limits=limits or pool_limits(),
+            http2=http2,
+        )
+        self.rate_limiter = rate_limiter or default_rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_stats = RetryStats()
+        self.max_workers = max_workers
+        self.max_url_length = max_url_length
+        self.cache = cache
+        self.reference_cache = reference_cache or default_reference_cache
+        self.output = check_output(output)
+        self.boundary_store = boundary_store
+        self.single_flight = single_flight or AsyncSingleFlight()
+        self.instruments = tuple(instruments or ())
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> dict:
+        """
+        Sends a request to the specified endpoint, sharing the response of an
+        identical request already in flight instead of sending another one.
+
+        Args:
+            method: "GET" to send `params` in the query string, "POST" to send them
+                as a form-encoded body.
+            endpoint: The API endpoint to send the request to.
+            params: Optional dictionary of parameters.
+            retry_policy: Optional policy overriding the client's one for this request.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        key = (method, cache_key(endpoint, params), id(retry_policy))
+        return await self.single_flight.do(
+            key, lambda: self._cached_request(method, endpoint, params, retry_policy)
+        )
+
+    async def _cached_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> dict:
+        """
+        Sends a request to the specified endpoint, going through the response cache
+        for month-based endpoints when one is configured.
+
+        Args:
+            method: "GET" to send `params` in the query string, "POST" to send them
+                as a form-encoded body.
+            endpoint: The API endpoint to send the request to.
+            params: Optional dictionary of parameters.
+            retry_policy: Optional policy overriding the client's one for this request.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        if self.cache is None or not params or "date" not in params:
+            return await self._send(method, endpoint, params, retry_policy)
+
+        key = cache_key(endpoint, params)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_immutable(entry):
+            self.cache.record(hit=True)
+            return entry.data
+        published = self.cache.published_month
+        if published is None:
+            last_updated = await self._send("GET", "/crime-last-updated")
+            published = self.cache.set_published_month(last_updated)
+        if entry is not None and entry.published == published:
+            self.cache.record(hit=True)
+            return entry.data
+
+        self.cache.record(hit=False)
+        data = await self._send(method, endpoint, params, retry_policy)
+        self.cache.set(key, data, request_month(params), published)
+        return data
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> dict:
+        """
+        Sends a request to the specified endpoint without blocking the event loop,
+        retrying transient failures.
+
+        Args:
+            method: "GET" to send `params` in the query string, "POST" to send them
+                as a form-encoded body.
+            endpoint: The API endpoint to send the request to.
+            params: Optional dictionary of parameters.
+            retry_policy: Optional policy overriding the client's one for this request.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        retry_policy = retry_policy or self.retry_policy
+        if method == "POST":
+            kwargs = {"data": params}
+        else:
+            kwargs = {"params": params}
+        self.retry_stats.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            await self.rate_limiter.acquire_async()
+            trace = start_trace(
+                self.instruments, method, endpoint, attempt, asynchronous=True
+            )
+            try:
+                response = await self.client.request(
+                    method, endpoint, extensions=trace.extensions, **kwargs
+                )
+            except RETRYABLE_EXCEPTIONS as exc:
+                trace.failed(exc)
+                delay = retry_policy.schedule_retry(
+                    attempt, self.retry_stats, exception=exc
+                )
+                if delay is None:
+                    raise
+            except httpx.HTTPError as exc:
+                trace.failed(exc)
+                raise
+            else:
+                delay = retry_policy.schedule_retry(
+                    attempt, self.retry_stats, response=response
+                )
+                if delay is None:
+                    return trace.complete(response)
+                trace.finish(response)
+            await asyncio.sleep(delay)
+
+    async def _get(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> dict:
+        """
+        Sends a GET request to the specified endpoint.
+
+        Args:
+            endpoint: The API endpoint to send the request to.
+            params: Optional dictionary of query parameters.
+            retry_policy: Optional policy overriding the client's one for this request.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        return await self._request("GET", endpoint, params, retry_policy)
+
+    async def _get_final(self, endpoint: str, is_final: Callable[[Any], bool]) -> dict:
+        """
+        Sends a GET request for a resource that stops changing at some point, such
+        as a case history, keeping responses `is_final` accepts in the response cache
+        for good when one is configured.
+
+        Args:
+            endpoint: The API endpoint to send the request to.
+            is_final: Tells whether a response will never change again.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        if self.cache is None:
+            return await self._get(endpoint)
+        key = cache_key(endpoint)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_immutable(entry):
+            self.cache.record(hit=True)
+            return entry.data
+        self.cache.record(hit=False)
+        data = await self._get(endpoint)
+        if is_final(data):
+            self.cache.set(key, data, None, FINAL)
+        return data
+
+    async def _get_reference(
+        self, endpoint: str, params: Optional[dict] = None
+    ) -> dict:
+        """
+        Sends a GET request for near-static reference data, answering from the
+        in-memory reference cache when possible.
+
+        Args:
+            endpoint: The API endpoint to send the request to.
+            params: Optional dictionary of query parameters.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        key = cache_key(endpoint, params)
+        data = self.reference_cache.get(key)
+        if data is None:
+            data = await self._request("GET", endpoint, params)
+            self.reference_cache.set(key, data)
+        return data
+
+    async def _boundary(
+        self, force_id: str, neighbourhood_id: str
+    ) -> List[Dict[str, str]]:
+        """
+        Retrieves a neighbourhood boundary, from the boundary store when it has it.
+
+        Args:
+            force_id: The unique identifier of the police force.
+            neighbourhood_id: The unique identifier of the neighbourhood.
+
+        Returns:
+            The boundary, in the format of the boundary endpoint.
+        """
+        store = self.boundary_store
+        if store is not None and (force_id, neighbourhood_id) in store:
+            return store.boundary(force_id, neighbourhood_id)
+        return await self._get(f"/{force_id}/{neighbourhood_id}/boundary")
+
+    async def force_ids(self, forces: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Resolves the forces a bulk call should cover.
+
+        Args:
+            forces: Force identifiers, or None (the default) for every force listed
+                by the API.
+
+        Returns:
+            A list of force identifiers.
+        """
+        if forces is None:
+            return [force["id"] for force in await self._get_reference("/forces")]
+        return list(forces)
+
+    async def _post(
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> dict:
+        """
+        Sends a POST request with a form-encoded body to the specified endpoint.
+
+        Args:
+            endpoint: The API endpoint to send the request to.
+            data: Optional dictionary of parameters.
+            retry_policy: Optional policy overriding the client's one for this request.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        return await self._request("POST", endpoint, data, retry_policy)
+
+    async def _get_area(
+        self,
+        endpoint: str,
+        params: dict,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> dict:
+        """
+        Sends a request for an area, switching from GET to POST when the polygon is
+        too long to fit in a URL.
+
+        See BaseClient._get_area.
+        """
+        method = _area_method(self.client, endpoint, params, self.max_url_length)
+        return await self._request(method, endpoint, params, retry_policy)
+
+    async def _stream(
+        self, endpoint: str, params: Optional[dict] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Sends a request and parses the JSON array in its body as it is received,
+        without holding the whole response in memory.
+
+        See BaseClient._stream.
+        """
+        params = params or {}
+        method = _area_method(self.client, endpoint, params, self.max_url_length)
+        kwargs = {"data": params} if method == "POST" else {"params": params}
+        self.retry_stats.record_request()
+        attempt = 0
+        started = False
+        while True:
+            attempt += 1
+            await self.rate_limiter.acquire_async()
+            trace = start_trace(
+                self.instruments, method, endpoint, attempt, asynchronous=True
+            )
+            try:
+                async with self.client.stream(
+                    method, endpoint, extensions=trace.extensions, **kwargs
+                ) as response:
+                    try:
+                        delay = self.retry_policy.schedule_retry(
+                            attempt, self.retry_stats, response=response
+                        )
+                        if delay is None:
+                            response.raise_for_status()
+                            async for record in aiter_json_array(
+                                response.aiter_bytes()
+                            ):
+                                started = True
+                                yield record
+                            return
+                    finally:
+                        trace.finish(response)
+            except RETRYABLE_EXCEPTIONS as exc:
+                trace.failed(exc)
+                if started:
+                    raise
+                delay = self.retry_policy.schedule_retry(
+                    attempt, self.retry_stats, exception=exc
+                )
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+
+    def decode(self, data: Any, kind: str) -> Any:
+        """
+        Converts records retrieved with `get_records` into the client's output
+        format.
+
+        Args:
+            data: The decoded JSON response.
+            kind: The record kind, e.g. "crime".
+
+        Returns:
+            The records in the client's output format.
+        """
+        if self.instruments:
+            return timed_decode(self.instruments, decode, data, kind, self.output)
+        return decode(data, kind, self.output)
+
+    async def map(self, func: Callable[[Any], Awaitable], items: List) -> List:
+        """
+        Awaits `func` for every item, at most `max_workers` at a time.
+
+        Args:
+            func: The coroutine function to call, usually one that sends a request.
+            items: The arguments to call it with.
+
+        Returns:
+            The results, in the same order as `items`. Called from a task of
+            another map or imap_unordered, it runs serially within that task, so
+            nested fan-outs never have more than `max_workers` requests in flight.
+        """
+        if len(items) <= 1 or _in_fan_out.get():
+            return [await func(item) for item in items]
+        results = [None] * len(items)
+        async for index, result in self.imap_unordered(
+            lambda index: func(items[index]), range(len(items))
+        ):
+            results[index] = result
+        return results
+
+    async def imap_unordered(
+        self, func: Callable[[Any], Awaitable], items: Iterable
+    ) -> AsyncIterator[Tuple[Any, Any]]:
+        """
+        Awaits `func` for every item with a pool of `max_workers` tasks, yielding
+        results as soon as they complete.
+
+        Args:
+            func: The coroutine function to call, usually one that sends a request.
+            items: The arguments to call it with.
+
+        Yields:
+            (item, result) tuples in completion order. The first exception raised
+            by `func` is re-raised and the remaining calls are cancelled. Like
+            map, it runs serially when called from one of their tasks.
+        """
+        if _in_fan_out.get():
+            for item in items:
+                yield item, await func(item)
+            return
+        items = iter(items)
+        done = asyncio.Queue()
+
+        async def work():
+            _in_fan_out.set(True)
+            for item in items:
+                try:
+                    result = await func(item)
+                except Exception as exc:
+                    done.put_nowait((item, None, exc))
+                    return
+                done.put_nowait((item, result, None))
+            done.put_nowait(None)
+
+        workers = [asyncio.ensure_future(work()) for _ in range(self.max_workers)]
+        try:
+            running = len(workers)
+            while running:
+                entry = await done.get()
+                if entry is None:
+                    running -= 1
+                    continue
+                item, result, exc = entry
+                if exc is not None:
+                    raise exc
+                yield item, result
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def get_records(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        subdivide: bool = False,
+        key: Callable[[Dict[str, Any]], Any] = lambda record: record["id"],
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves the records of any list endpoint as returned by the API, without
+        converting them to the client's output format.
+
+        See BaseClient.get_records.
+        """
+        params = params or {}
+        if subdivide and "poly" in params:
+            return await self._get_subdivided(endpoint, params, key=key)
+        return await self._get_area(endpoint, params)
+
+    async def _get_subdivided(
+        self,
+        endpoint: str,
+        params: dict,
+        max_depth: int = 5,
+        key: Callable[[Dict[str, Any]], Any] = lambda record: record["id"],
+        max_requests: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Sends a GET request for a `poly` area, splitting the polygon into quadrants
+        whenever the API refuses it for matching too many records.
+
+        See BaseClient._get_subdivided.
+        """
+
+        async def fetch(points, can_split):
+            try:
+                return await self._get_area(
+                    endpoint, {**params, "poly": format_poly(points)}
+                )
+            except httpx.HTTPStatusError as exc:
+                if can_split and is_over_limit(exc.response):
+                    return exc
+                raise
+
+        if max_requests is None:
+            max_requests = sum(4**depth for depth in range(max_depth + 1))
+        merged = {}
+        pending = [parse_poly(params["poly"])]
+        sent = 0
+        for depth in range(max_depth + 1):
+            results = await self.map(
+                lambda points: fetch(points, depth < max_depth), pending
+            )
+            sent += len(pending)
+            pending = _split_refused(pending, results, merged, key, max_requests - sent)
+            if not pending:
+                break
+        return list(merged.values())
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP client and its connections."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -0,0 +1,281 @@
+"""
+    Asynchronous client for the Crimes endpoints
+"""
+
+from itertools import product
+from typing import Optional, Dict, Any, AsyncIterator, Iterable, List, Tuple, Union
+from datetime import datetime
+
+from uk_police_client.clients.async_base_client import AsyncBaseClient
+from uk_police_client.clients.crimes_client import _persistent_ids
+from uk_police_client.geometry import boundary_points, boundary_poly, record_within
+from uk_police_client.utils import is_case_closed, month_range
+
+
+class AsyncCrimesClient(AsyncBaseClient):
+    """Asynchronous client for accessing crimes data from the UK Police API.
+
+    Mirrors CrimesClient method for method; see it for the response formats.
+    """
+
+    def __init__(self, timeout=10, **kwargs):
+        super().__init__(timeout=timeout, **kwargs)
+
+    async def get_street_level_crimes(
+        self, location: dict, date: Optional[str] = None, subdivide: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves street-level crimes data based on a specific location.
+
+        Args:
+            location: Dictionary containing the location parameters.
+                For a specific point:
+                    {'lat': Latitude, 'lng': Longitude}
+                For a custom area:
+                    {'poly': 'lat1,lng1:lat2,lng2:lat3,lng3', ...}
+                    Polygons too long to fit in a URL are sent in a POST body.
+            date: Optional. Limit results to a specific month in YYYY-MM format.
+                  Defaults to the latest month if not provided.
+            subdivide: Optional. For a custom area, split the polygon into smaller
+                  parts whenever the API refuses it for containing more than 10,000
+                  crimes, and merge the results. Defaults to False.
+
+        Returns:
+            A list of dictionaries containing street-level crimes data, or a
+            CrimeFrame if the client was created with output="frame".
+        """
+        params = {"date": date, **location}
+        return self.decode(
+            await self._street_level_crimes(params, subdivide and "poly" in params),
+            "crime",
+        )
+
+    async def get_street_level_crimes_for_neighbourhood(
+        self,
+        force_id: str,
+        neighbourhood_id: str,
+        date: Optional[str] = None,
+        tolerance: Optional[float] = 0.0005,
+        subdivide: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves street-level crimes within a neighbourhood, querying the API with a
+        simplified polygon covering its boundary.
+
+        Args:
+            force_id: The unique identifier of the police force.
+            neighbourhood_id: The unique identifier of the neighbourhood.
+            date: Optional. Limit results to a specific month in YYYY-MM format.
+            tolerance: Optional. Simplification tolerance in degrees; None sends the
+                boundary unchanged.
+            subdivide: Optional. Split the polygon into smaller requests if needed.
+
+        Returns:
+            The crimes in the format of get_street_level_crimes.
+        """
+        boundary = boundary_points(await self._boundary(force_id, neighbourhood_id))
+        params = {"date": date, "poly": boundary_poly(boundary, tolerance)}
+        crimes = await self._street_level_crimes(params, subdivide)
+        if tolerance:
+            crimes = [crime for crime in crimes if record_within(boundary, crime)]
+        return self.decode(crimes, "crime")
+
+    async def _street_level_crimes(
+        self, params: dict, subdivide: bool
+    ) -> List[Dict[str, Any]]:
+        """Fetches the raw street-level crimes for a location."""
+        if subdivide:
+            return await self._get_subdivided("/crimes-street/all-crime", params)
+        return await self._get_area("/crimes-street/all-crime", params)
+
+    async def get_street_level_outcomes(
+        self, location: dict, date: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves street-level outcomes data based on a specific location.
+
+        Args:
+            location: Dictionary containing the location parameters.
+                For a specific location ID:
+                    {'location_id': Location ID}
+                For a specific point:
+                    {'lat': Latitude, 'lng': Longitude}
+                For a custom area:
+                    {'poly': 'lat1,lng1:lat2,lng2:lat3,lng3', ...}
+                    Polygons too long to fit in a URL are sent in a POST body.
+            date: Optional. Limit results to a specific month in YYYY-MM format.
+                  Defaults to the latest month if not provided.
+
+        Returns:
+            A list of dictionaries containing street-level outcomes data.
+        """
+        params = {"date": date, **location}
+        return self.decode(
+            await self._get_area("/outcomes-at-location", params), "outcome"
+        )
+
+    async def get_crimes_at_location(
+        self, location: dict, date: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves crimes data at a specific location.
+
+        Args:
+            location: Dictionary containing the location parameters.
+                For a specific location ID:
+                    {'location_id': Location ID}
+                For a specific point:
+                    {'lat': Latitude, 'lng': Longitude}
+            date: Optional. Limit results to a specific month in YYYY-MM format.
+                  Defaults to the latest month if not provided.
+
+        Returns:
+            A list of dictionaries containing crimes data at the specified location,
+            or a CrimeFrame if the client was created with output="frame".
+        """
+        params = {"date": date, **location}
+        crimes = await self._get("/crimes-at-location", params=params)
+        return self.decode(crimes, "crime")
+
+    async def get_crimes_no_location(
+        self, category: str, force: str, date: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves crimes data with no mapped location.
+
+        Args:
+            category: The category of the crimes.
+            force: Specific police force.
+            date: Optional. Limit results to a specific month in YYYY-MM format.
+                  Defaults to the latest month if not provided.
+
+        Returns:
+            A list of dictionaries containing crimes data with no mapped location,
+            or a CrimeFrame if the client was created with output="frame".
+        """
+        params = {"category": category, "force": force, "date": date}
+        crimes = await self._get("/crimes-no-location", params=params)
+        return self.decode(crimes, "crime")
+
+    async def get_crime_categories(self, date: str) -> List[Dict[str, str]]:
+        """
+        Retrieves a list of valid crime categories for a given data set date.
+
+        Args:
+            date: The date of the data set in YYYY-MM format.
+
+        Returns:
+            A list of dictionaries containing valid crime categories.
+        """
+        params = {"date": date}
+        return self.decode(
+            await self._get_reference("/crime-categories", params=params),
+            "crime_category",
+        )
+
+    async def get_last_updated_date(self) -> Dict[str, str]:
+        """
+        Retrieves the month of the latest crime data update.
+
+        Returns:
+            A dictionary holding the month of the latest update, e.g. {"date": "2011-09-01"}.
+        """
+        return self.decode(await self._get("/crime-last-updated"), "last_updated")
+
+    async def get_outcomes_for_crime(self, crime_id: str) -> Dict[str, Any]:
+        """
+        Retrieves the outcomes (case history) for the specified crime.
+
+        Args:
+            crime_id: The 64-character identifier of the crime.
+
+        Returns:
+            A dictionary containing the crime details and outcomes.
+        """
+        endpoint = f"/outcomes-for-crime/{crime_id}"
+        return self.decode(
+            await self._get_final(endpoint, is_case_closed), "crime_outcomes"
+        )
+
+    async def iter_outcomes_for_crimes(
+        self, crimes: Iterable[Union[str, Dict[str, Any]]]
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Retrieves the outcomes of many crimes concurrently.
+
+        Blank and repeated persistent IDs are skipped, and the remaining requests are
+        sent concurrently on the event loop and throttled by the client's rate
+        limiter. With a response cache, closed cases (whose latest outcome is final)
+        are kept for good and never requested again.
+
+        Args:
+            crimes: Persistent IDs, or crimes as returned by get_street_level_crimes
+                (dictionaries, records or models), e.g. a whole month of crimes.
+
+        Yields:
+            (persistent_id, outcomes) tuples in the order the requests complete,
+            where outcomes is the get_outcomes_for_crime response.
+        """
+        async for crime_id, outcomes in self.imap_unordered(
+            self.get_outcomes_for_crime, _persistent_ids(crimes)
+        ):
+            yield crime_id, outcomes
+
+    def stream_street_level_crimes(
+        self, location: dict, date: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Streaming variant of `get_street_level_crimes`; yields records one at a time."""
+        params = {"date": date, **location}
+        return self._stream("/crimes-street/all-crime", params)
+
+    def stream_street_level_outcomes(
+        self, location: dict, date: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Streaming variant of `get_street_level_outcomes`; yields records one at a time."""
+        params = {"date": date, **location}
+        return self._stream("/outcomes-at-location", params)
+
+    def stream_crimes_at_location(
+        self, location: dict, date: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Streaming variant of `get_crimes_at_location`; yields records one at a time."""
+        params = {"date": date, **location}
+        return self._stream("/crimes-at-location", params)
+
+    def stream_crimes_no_location(
+        self, category: str, force: str, date: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Streaming variant of `get_crimes_no_location`; yields records one at a time."""
+        params = {"category": category, "force": force, "date": date}
+        return self._stream("/crimes-no-location", params)
+
+    async def iter_crimes_no_location(
+        self,
+        categories: Iterable[str],
+        forces: Optional[Iterable[str]],
+        start: Union[str, datetime],
+        end: Union[str, datetime],
+    ) -> AsyncIterator[Tuple[str, str, str, List[Dict[str, Any]]]]:
+        """
+        Retrieves crimes with no mapped location for every category, force and month
+        in a range concurrently.
+
+        Requests for the whole category x force x month grid are sent concurrently
+        on the event loop and throttled by the client's rate limiter.
+
+        Args:
+            categories: Crime categories to cover, e.g. ["all-crime"].
+            forces: Force IDs to cover, or None for every force.
+            start: First month, in any format accepted by utils.format_date.
+            end: Last month, in any format accepted by utils.format_date.
+
+        Yields:
+            (category, force, month, crimes) tuples in the order the requests
+            complete, where crimes is the get_crimes_no_location response.
+        """
+        force_ids = await self.force_ids(forces)
+        grid = list(product(list(categories), force_ids, month_range(start, end)))
+        async for (category, force, month), crimes in self.imap_unordered(
+            lambda cell: self.get_crimes_no_location(*cell), grid
+        ):
+            yield category, force, month, crimes
@@ -0,0 +1,52 @@
+"""
+    Asynchronous client for the Forces endpoints
+"""
+
+from typing import Dict, Any, List
+
+from uk_police_client.clients.async_base_client import AsyncBaseClient
+
+
+class AsyncForcesClient(AsyncBaseClient):
+    """Asynchronous client for accessing police force data from the UK Police API.
+
+    Mirrors ForcesClient method for method; see it for the response formats.
+    """
+
+    def __init__(self, timeout=10, **kwargs):
+        super().__init__(timeout=timeout, **kwargs)
+
+    async def get_forces(self) -> List[Dict[str, str]]:
+        """
+        Retrieves a list of all police forces available via the API.
+
+        Returns:
+            A list of dictionaries with 'id' and 'name' keys.
+        """
+        return self.decode(await self._get_reference("/forces"), "force")
+
+    async def get_force_details(self, force_id: str) -> Dict[str, Any]:
+        """
+        Retrieves details of a specific police force.
+
+        Args:
+            force_id: The unique identifier of the police force.
+
+        Returns:
+            A dictionary containing detailed information about the specified police force.
+        """
+        endpoint = f"/forces/{force_id}"
+        return self.decode(await self._get_reference(endpoint), "force_details")
+
+    async def get_force_senior_officers(self, force_id: str) -> List[Dict[str, Any]]:
+        """
+        Retrieves details of senior officers for a specific police force.
+
+        Args:
+            force_id: The unique identifier of the police force.
+
+        Returns:
+            A list of dictionaries containing information about the force's senior officers.
+        """
+        endpoint = f"/forces/{force_id}/people"
+        return self.decode(await self._get(endpoint), "officer")
@@ -0,0 +1,253 @@
+"""
+    Asynchronous client for the Neighbourhoods endpoints
+"""
+
+from typing import Dict, Any, AsyncIterator, Iterable, List, Optional, Tuple, Union
+
+import httpx
+
+from uk_police_client.clients.async_base_client import AsyncBaseClient
+from uk_police_client.boundary_store import write_boundary_store
+from uk_police_client.geometry import Point, boundary_points, parse_point
+from uk_police_client.neighbourhood_index import NeighbourhoodIndex
+
+
+class AsyncNeighbourhoodsClient(AsyncBaseClient):
+    """Asynchronous client for accessing Neighbourhoods data from the UK Police API.
+
+    Mirrors NeighbourhoodsClient method for method; see it for the response formats.
+    """
+
+    def __init__(
+        self,
+        timeout=10,
+        neighbourhood_index: Optional[NeighbourhoodIndex] = None,
+        **kwargs,
+    ):
+        super().__init__(timeout=timeout, **kwargs)
+        self.neighbourhood_index = neighbourhood_index
+
+    async def get_neighbourhoods_for_force(self, force_id: str) -> List[Dict[str, str]]:
+        """
+        Retrieves a list of neighbourhoods for a specific police force.
+
+        Args:
+            force_id: The unique identifier of the police force.
+
+        Returns:
+            A list of dictionaries with the 'id' and 'name' of each neighbourhood.
+        """
+        endpoint = f"/{force_id}/neighbourhoods"
+        return self.decode(await self._get_reference(endpoint), "neighbourhood")
+
+    async def get_specific_neighbourhood(
+        self, force_id: str, neighbourhood_id: str
+    ) -> Dict[str, Any]:
+        """
+        Retrieves details of a specific neighbourhood within a police force.
+
+        Args:
+            force_id: The unique identifier of the police force.
+            neighbourhood_id: The unique identifier of the neighbourhood.
+
+        Returns:
+            A dictionary containing detailed information about the specified neighbourhood.
+        """
+        endpoint = f"/{force_id}/{neighbourhood_id}"
+        return self.decode(await self._get(endpoint), "neighbourhood_details")
+
+    async def get_neighbourhood_boundary(
+        self, force_id: str, neighbourhood_id: str
+    ) -> List[Dict[str, str]]:
+        """
+        Retrieves the boundary of a specific neighbourhood within a police force.
+
+        Args:
+            force_id: The unique identifier of the police force.
+            neighbourhood_id: The unique identifier of the neighbourhood.
+
+        Returns:
+            A list of dictionaries containing latitude and longitude pairs.
+        """
+        return self.decode(await self._boundary(force_id, neighbourhood_id), "boundary")
+
+    async def get_neighbourhood_team(
+        self, force_id: str, neighbourhood_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves the team members for a specific neighbourhood within a police force.
+
+        Args:
+            force_id: The unique identifier of the police force.
+            neighbourhood_id: The unique identifier of the neighbourhood.
+
+        Returns:
+            A list of dictionaries containing information about the team members.
+        """
+        endpoint = f"/{force_id}/{neighbourhood_id}/people"
+        return self.decode(await self._get(endpoint), "officer")
+
+    async def get_neighbourhood_events(
+        self, force_id: str, neighbourhood_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves the events for a specific neighbourhood within a police force.
+
+        Args:
+            force_id: The unique identifier of the police force.
+            neighbourhood_id: The unique identifier of the neighbourhood.
+
+        Returns:
+            A list of dictionaries containing information about the events.
+        """
+        endpoint = f"/{force_id}/{neighbourhood_id}/events"
+        return self.decode(await self._get(endpoint), "event")
+
+    async def get_neighbourhood_priorities(
+        self, force_id: str, neighbourhood_id: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves the policing priorities for a specific neighbourhood within a police force.
+
+        Args:
+            force_id: The unique identifier of the police force.
+            neighbourhood_id: The unique identifier of the neighbourhood.
+
+        Returns:
+            A list of dictionaries containing information about the priorities.
+        """
+        endpoint = f"/{force_id}/{neighbourhood_id}/priorities"
+        return self.decode(await self._get(endpoint), "priority")
+
+    async def locate_neighbourhood(self, coordinates: str) -> Dict[str, str]:
+        """
+        Locates the neighbourhood policing team responsible for a particular area.
+
+        Args:
+            coordinates: Latitude and Longitude separated by a comma, e.g., "51.500617,-0.124629".
+
+        Returns:
+            A dictionary containing the police force and neighbourhood identifiers.
+        """
+        params = {"q": coordinates}
+        return self.decode(
+            await self._get("/locate-neighbourhood", params=params),
+            "located_neighbourhood",
+        )
+
+    async def locate_neighbourhoods(
+        self,
+        points: Iterable[Union[str, Point]],
+        index: Optional[NeighbourhoodIndex] = None,
+        fallback: bool = True,
+    ) -> List[Optional[Dict[str, str]]]:
+        """
+        Locates the neighbourhood policing team responsible for each of many points,
+        answering from a local NeighbourhoodIndex where possible.
+
+        Args:
+            points: "lat,lng" strings or (latitude, longitude) pairs.
+            index: Optional index to use instead of the client's neighbourhood_index.
+            fallback: Whether points missing from the index are sent to the API.
+
+        Returns:
+            One locate_neighbourhood result per point, or None for points outside
+            every neighbourhood.
+        """
+        index = self.neighbourhood_index if index is None else index
+        points = [parse_point(point) for point in points]
+        if index is None:
+            results = [None] * len(points)
+        else:
+            results = index.locate_many(points)
+        misses = [i for i, result in enumerate(results) if result is None]
+
+        async def locate(i):
+            lat, lng = points[i]
+            try:
+                return await self._get(
+                    "/locate-neighbourhood", params={"q": f"{lat},{lng}"}
+                )
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code == 404:
+                    return None
+                raise
+
+        if fallback:
+            for i, result in zip(misses, await self.map(locate, misses)):
+                results[i] = result
+        return [
+            None if result is None else self.decode(result, "located_neighbourhood")
+            for result in results
+        ]
+
+    async def build_neighbourhood_index(
+        self, forces: Optional[Iterable[str]] = None, cell_size: float = 0.02
+    ) -> NeighbourhoodIndex:
+        """
+        Downloads neighbourhood boundaries concurrently and indexes them for
+        locate_neighbourhoods.
+
+        Args:
+            forces: Force IDs to cover, or None for every force.
+            cell_size: Size of the index's grid cells in degrees.
+
+        Returns:
+            A NeighbourhoodIndex.
+        """
+        return NeighbourhoodIndex.from_boundaries(
+            await self.fetch_boundaries(forces), cell_size
+        )
+
+    async def snapshot_boundaries(
+        self, path: str, forces: Optional[Iterable[str]] = None
+    ) -> int:
+        """
+        Downloads neighbourhood boundaries concurrently into a snapshot file that
+        can be opened with BoundaryStore and passed as `boundary_store`.
+
+        Args:
+            path: Path of the snapshot file, which is overwritten.
+            forces: Force IDs to cover, or None for every force.
+
+        Returns:
+            The number of boundaries written.
+        """
+        return write_boundary_store(path, await self.fetch_boundaries(forces))
+
+    async def fetch_boundaries(
+        self, forces: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, str, List[Point]]]:
+        """
+        Retrieves the boundary of every neighbourhood of the given forces concurrently,
+        from the boundary store when it has them.
+
+        Args:
+            forces: Force IDs to cover, or None for every force.
+
+        Returns:
+            (force_id, neighbourhood_id, points) tuples, with the points as
+            (latitude, longitude) tuples.
+        """
+        force_ids = await self.force_ids(forces)
+        neighbourhoods = await self.map(
+            lambda force_id: self._get_reference(f"/{force_id}/neighbourhoods"),
+            force_ids,
+        )
+        pairs = [
+            (force_id, neighbourhood["id"])
+            for force_id, found in zip(force_ids, neighbourhoods)
+            for neighbourhood in found
+        ]
+        boundaries = await self.map(lambda pair: self._boundary(*pair), pairs)
+        return [
+            (force_id, neighbourhood_id, boundary_points(boundary))
+            for (force_id, neighbourhood_id), boundary in zip(pairs, boundaries)
+        ]
+
+    def stream_neighbourhood_boundary(
+        self, force_id: str, neighbourhood_id: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Streaming variant of `get_neighbourhood_boundary`; yields records one at a time."""
+        endpoint = f"/{force_id}/{neighbourhood_id}/boundary"
+        return self._stream(endpoint)
@@ -0,0 +1,156 @@
+"""
+    Asynchronous client for the Stop & Search endpoints
+"""
+
+from itertools import product
+from typing import Optional, Dict, Any, AsyncIterator, Iterable, List, Tuple, Union
+from datetime import datetime
+
+from uk_police_client.clients.async_base_client import AsyncBaseClient
+from uk_police_client.utils import month_range
+
+
+class AsyncStopAndSearchClient(AsyncBaseClient):
+    """Asynchronous client for accessing stop and searches data from the UK Police API.
+
+    Mirrors StopAndSearchClient method for method; see it for the response formats.
+    """
+
+    def __init__(self, timeout=10, **kwargs):
+        super().__init__(timeout=timeout, **kwargs)
+
+    async def get_stop_and_searches_by_area(
+        self, location: dict, date: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves stop and searches data based on a specific area.
+
+        Args:
+            location: Dictionary containing the location parameters.
+                For a specific point:
+                    {'lat': Latitude, 'lng': Longitude}
+                For a custom area:
+                    {'poly': 'lat1,lng1:lat2,lng2:lat3,lng3', ...}
+                    Polygons too long to fit in a URL are sent in a POST body.
+            date: Optional. Limit results to a specific month in YYYY-MM format.
+                  Defaults to the latest month if not provided.
+
+        Returns:
+            A list of dictionaries containing stop and searches data.
+        """
+        params = {"date": date, **location}
+        return self.decode(
+            await self._get_area("/stops-street", params), "stop_and_search"
+        )
+
+    async def get_stop_and_searches_by_location(
+        self, location_id: str, date: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves stop and searches data at a specific location.
+
+        Args:
+            location_id: The ID of the location to get stop and searches for.
+            date: Optional. Limit results to a specific month in YYYY-MM format.
+                  Defaults to the latest month if not provided.
+
+        Returns:
+            A list of dictionaries containing stop and searches data.
+        """
+        params = {"location_id": location_id, "date": date}
+        return self.decode(
+            await self._get("/stops-at-location", params=params), "stop_and_search"
+        )
+
+    async def get_stops_no_location(
+        self, force: str, date: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves stop and searches data that could not be mapped to a location.
+
+        Args:
+            force: The force that carried out the stop and searches.
+            date: Optional. Limit results to a specific month in YYYY-MM format.
+                  Defaults to the latest month if not provided.
+
+        Returns:
+            A list of dictionaries containing stop and searches data with no location.
+        """
+        params = {"force": force, "date": date}
+        return self.decode(
+            await self._get("/stops-no-location", params=params), "stop_and_search"
+        )
+
+    async def get_stops_by_force(
+        self, force: str, date: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves stop and searches reported by a particular force.
+
+        Args:
+            force: The force ID of the force to get stop and searches for.
+            date: Optional. Limit results to a specific month in YYYY-MM format.
+                  Defaults to the latest month if not provided.
+
+        Returns:
+            A list of dictionaries containing stop and searches data reported by the specified force.
+        """
+        params = {"force": force, "date": date}
+        return self.decode(
+            await self._get("/stops-force", params=params), "stop_and_search"
+        )
+
+    def stream_stop_and_searches_by_area(
+        self, location: dict, date: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Streaming variant of `get_stop_and_searches_by_area`; yields records one at a time."""
+        params = {"date": date, **location}
+        return self._stream("/stops-street", params)
+
+    def stream_stop_and_searches_by_location(
+        self, location_id: str, date: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Streaming variant of `get_stop_and_searches_by_location`; yields records one at a time."""
+        params = {"location_id": location_id, "date": date}
+        return self._stream("/stops-at-location", params)
+
+    def stream_stops_no_location(
+        self, force: str, date: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Streaming variant of `get_stops_no_location`; yields records one at a time."""
+        params = {"force": force, "date": date}
+        return self._stream("/stops-no-location", params)
+
+    def stream_stops_by_force(
+        self, force: str, date: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Streaming variant of `get_stops_by_force`; yields records one at a time."""
+        params = {"force": force, "date": date}
+        return self._stream("/stops-force", params)
+
+    async def iter_stops_by_force(
+        self,
+        forces: Optional[Iterable[str]],
+        start: Union[str, datetime],
+        end: Union[str, datetime],
+    ) -> AsyncIterator[Tuple[str, str, List[Dict[str, Any]]]]:
+        """
+        Retrieves stop and searches for every force and month in a range concurrently.
+
+        Requests for the whole force x month grid are sent concurrently on the
+        event loop and throttled by the client's rate limiter.
+
+        Args:
+            forces: Force IDs to cover, or None for every force.
+            start: First month, in any format accepted by utils.format_date.
+            end: Last month, in any format accepted by utils.format_date.
+
+        Yields:
+            (force, month, searches) tuples in the order the requests complete, where
+            searches is the get_stops_by_force response.
+        """
+        grid = list(product(await self.force_ids(forces), month_range(start, end)))
+        async for (force, month), searches in self.imap_unordered(
+            lambda cell: self.get_stops_by_force(*cell), grid
+        ):
+            yield force, month, searches
@@ -1,5 +1,36 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import httpx
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from uk_police_client.boundary_store import BoundaryStore
+from uk_police_client.cache import (
+    FINAL,
+    MemoryCache,
+    ResponseCache,
+    cache_key,
+    default_reference_cache,
+    request_month,
+)
+from uk_police_client.cassette import CassetteTransport, active_cassette
+from uk_police_client.decoding import check_output, decode
+from uk_police_client.geometry import Point, format_poly, parse_poly, split_polygon
+from uk_police_client.instrumentation import Instrument, start_trace, timed_decode
+from uk_police_client.rate_limiter import TokenBucket, default_rate_limiter
+from uk_police_client.retry import (
+    RETRYABLE_EXCEPTIONS,
+    RetryPolicy,
+    RetryStats,
+    is_over_limit,
+)
+from uk_police_client.singleflight import SingleFlight
+from uk_police_client.streaming import iter_json_array
+from uk_police_client.transport import pool_limits
+
+# Marks the threads of the pools started by map and imap_unordered.
+_pool_thread = threading.local()
 
 
 class BaseClient:
@@ -7,26 +38,621 @@ class BaseClient:
 
     BASE_URL = "https://data.police.uk/api"
 
-    def __init__(self, timeout=10):
+    def __init__(
+        self,
+        timeout=10,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        max_workers: int = 8,
+        max_url_length: int = 4094,
+        cache: Optional[ResponseCache] = None,
+        reference_cache: Optional[MemoryCache] = None,
+        output: str = "dict",
+        boundary_store: Optional[BoundaryStore] = None,
+        single_flight: Optional[SingleFlight] = None,
+        instruments: Optional[Iterable[Instrument]] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+    ):
         """
         Initializes the BaseClient with an HTTP client.
 
         Args:
             timeout: Timeout value for HTTP requests, defaults to 10 seconds.
+            rate_limiter: Optional token bucket to throttle requests with. Defaults to
+                the process-wide limiter shared by every client.
+            retry_policy: Optional policy for retrying transient failures. Defaults to
+                RetryPolicy(); pass RetryPolicy(max_attempts=1) to disable retries.
+            max_workers: Number of threads used by calls that fan out into several
+                requests, defaults to 8. Fan-outs nested inside another one, such as
+                the quadrants of each tile of a sweep, run serially on its threads.
+            max_url_length: Longest URL sent as a GET request by methods accepting a
+                custom area; longer requests are sent as a POST. Defaults to 4094, the
+                limit enforced by the API.
+            cache: Optional persistent cache for responses of month-based endpoints.
+            reference_cache: Optional in-memory cache for near-static reference data
+                (forces, crime categories, neighbourhood lists). Defaults to a cache
+                shared by every client; pass MemoryCache(maxsize=0) to disable it.
+            output: Format of responses. "dict" (the default) returns the JSON as
+                dictionaries; "frame" returns crime lists as CrimeFrame; "model"
+                returns pydantic models validated in bulk; "lazy_model" validates
+                each record of a list only when it is first accessed; "record"
+                returns crimes and stop and searches as compact __slots__ objects.
+            boundary_store: Optional snapshot of neighbourhood boundaries, which are
+                then read from it instead of being requested.
+            single_flight: Optional SingleFlight coalescing identical concurrent
+                requests. Defaults to one per client; share one between clients to
+                coalesce their requests too.
+            instruments: Optional Instrument objects notified of every request
+                attempt (latency, status, bytes, JSON decode time) and output
+                conversion, e.g. a MetricsRecorder or PrometheusInstrument.
+            transport: Optional httpx transport to send requests with. Pass one
+                SharedTransport to several clients to let them share a connection pool.
+                Inside a `cassette.use_cassette()` block, defaults to replaying and
+                recording the block's cassette.
+            limits: Optional connection limits of the client's own pool, e.g.
+                transport.pool_limits(max_connections=20). Ignored with `transport`.
+            http2: Whether the client's own pool negotiates HTTP/2; requires
+                `pip install httpx[http2]`. Ignored with `transport`.
+        """
+        if transport is None and active_cassette() is not None:
+            transport = CassetteTransport(active_cassette())
+        self.client = httpx.Client(
+            base_url=self.BASE_URL,
+            timeout=timeout,
+            transport=transport,
+            limits=limits or pool_limits(),
+            http2=http2,
+        )
+        self.rate_limiter = rate_limiter or default_rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.retry_stats = RetryStats()
+        self.max_workers = max_workers
+        self.max_url_length = max_url_length
+        self.cache = cache
+        self.reference_cache = reference_cache or default_reference_cache
+        self.output = check_output(output)
+        self.boundary_store = boundary_store
+        self.single_flight = single_flight or SingleFlight()
+        self.instruments = tuple(instruments or ())
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> dict:
         """
-        self.client = httpx.Client(base_url=self.BASE_URL, timeout=timeout)
+        Sends a request to the specified endpoint, sharing the response of an
+        identical request already in flight instead of sending another one.
 
-    def _get(self, endpoint: str, params: Optional[dict] = None) -> dict:
+        Args:
+            method: "GET" to send `params` in the query string, "POST" to send them
+                as a form-encoded body.
+            endpoint: The API endpoint to send the request to.
+            params: Optional dictionary of parameters.
+            retry_policy: Optional policy overriding the client's one for this request.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        key = (method, cache_key(endpoint, params), id(retry_policy))
+        return self.single_flight.do(
+            key, lambda: self._cached_request(method, endpoint, params, retry_policy)
+        )
+
+    def _cached_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> dict:
+        """
+        Sends a request to the specified endpoint, going through the response cache
+        for month-based endpoints when one is configured.
+
+        Args:
+            method: "GET" to send `params` in the query string, "POST" to send them
+                as a form-encoded body.
+            endpoint: The API endpoint to send the request to.
+            params: Optional dictionary of parameters.
+            retry_policy: Optional policy overriding the client's one for this request.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        if self.cache is None or not params or "date" not in params:
+            return self._send(method, endpoint, params, retry_policy)
+
+        key = cache_key(endpoint, params)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_immutable(entry):
+            self.cache.record(hit=True)
+            return entry.data
+        published = self.cache.published_month
+        if published is None:
+            last_updated = self._send("GET", "/crime-last-updated")
+            published = self.cache.set_published_month(last_updated)
+        if entry is not None and entry.published == published:
+            self.cache.record(hit=True)
+            return entry.data
+
+        self.cache.record(hit=False)
+        data = self._send(method, endpoint, params, retry_policy)
+        self.cache.set(key, data, request_month(params), published)
+        return data
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> dict:
+        """
+        Sends a request to the specified endpoint, retrying transient failures.
+
+        Args:
+            method: "GET" to send `params` in the query string, "POST" to send them
+                as a form-encoded body.
+            endpoint: The API endpoint to send the request to.
+            params: Optional dictionary of parameters.
+            retry_policy: Optional policy overriding the client's one for this request.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        retry_policy = retry_policy or self.retry_policy
+        if method == "POST":
+            kwargs = {"data": params}
+        else:
+            kwargs = {"params": params}
+        self.retry_stats.record_request()
+        attempt = 0
+        while True:
+            attempt += 1
+            self.rate_limiter.acquire()
+            trace = start_trace(self.instruments, method, endpoint, attempt)
+            try:
+                response = self.client.request(
+                    method, endpoint, extensions=trace.extensions, **kwargs
+                )
+            except RETRYABLE_EXCEPTIONS as exc:
+                trace.failed(exc)
+                delay = retry_policy.schedule_retry(
+                    attempt, self.retry_stats, exception=exc
+                )
+                if delay is None:
+                    raise
+            except httpx.HTTPError as exc:
+                trace.failed(exc)
+                raise
+            else:
+                delay = retry_policy.schedule_retry(
+                    attempt, self.retry_stats, response=response
+                )
+                if delay is None:
+                    return trace.complete(response)
+                trace.finish(response)
+            time.sleep(delay)
+
+    def _get(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> dict:
         """
         Sends a GET request to the specified endpoint.
 
         Args:
             endpoint: The API endpoint to send the request to.
             params: Optional dictionary of query parameters.
+            retry_policy: Optional policy overriding the client's one for this request.
 
         Returns:
             The response data as a dictionary.
         """
-        response = self.client.get(endpoint, params=params)
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", endpoint, params, retry_policy)
+
+    def _get_final(self, endpoint: str, is_final: Callable[[Any], bool]) -> dict:
+        """
+        Sends a GET request for a resource that stops changing at some point, such
+        as a case history, keeping responses `is_final` accepts in the response cache
+        for good when one is configured.
+
+        Args:
+            endpoint: The API endpoint to send the request to.
+            is_final: Tells whether a response will never change again.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        if self.cache is None:
+            return self._get(endpoint)
+        key = cache_key(endpoint)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_immutable(entry):
+            self.cache.record(hit=True)
+            return entry.data
+        self.cache.record(hit=False)
+        data = self._get(endpoint)
+        if is_final(data):
+            self.cache.set(key, data, None, FINAL)
+        return data
+
+    def _get_reference(self, endpoint: str, params: Optional[dict] = None) -> dict:
+        """
+        Sends a GET request for near-static reference data, answering from the
+        in-memory reference cache when possible.
+
+        Args:
+            endpoint: The API endpoint to send the request to.
+            params: Optional dictionary of query parameters.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        key = cache_key(endpoint, params)
+        data = self.reference_cache.get(key)
+        if data is None:
+            data = self._request("GET", endpoint, params)
+            self.reference_cache.set(key, data)
+        return data
+
+    def _boundary(self, force_id: str, neighbourhood_id: str) -> List[Dict[str, str]]:
+        """
+        Retrieves a neighbourhood boundary, from the boundary store when it has it.
+
+        Args:
+            force_id: The unique identifier of the police force.
+            neighbourhood_id: The unique identifier of the neighbourhood.
+
+        Returns:
+            The boundary, in the format of the boundary endpoint.
+        """
+        store = self.boundary_store
+        if store is not None and (force_id, neighbourhood_id) in store:
+            return store.boundary(force_id, neighbourhood_id)
+        return self._get(f"/{force_id}/{neighbourhood_id}/boundary")
+
+    def force_ids(self, forces: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Resolves the forces a bulk call should cover.
+
+        Args:
+            forces: Force identifiers, or None (the default) for every force listed
+                by the API.
+
+        Returns:
+            A list of force identifiers.
+        """
+        if forces is None:
+            return [force["id"] for force in self._get_reference("/forces")]
+        return list(forces)
+
+    def _post(
+        self,
+        endpoint: str,
+        data: Optional[dict] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> dict:
+        """
+        Sends a POST request with a form-encoded body to the specified endpoint.
+
+        Args:
+            endpoint: The API endpoint to send the request to.
+            data: Optional dictionary of parameters.
+            retry_policy: Optional policy overriding the client's one for this request.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        return self._request("POST", endpoint, data, retry_policy)
+
+    def _get_area(
+        self,
+        endpoint: str,
+        params: dict,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> dict:
+        """
+        Sends a request for an area, switching from GET to POST when the polygon is
+        too long to fit in a URL.
+
+        Args:
+            endpoint: The API endpoint to send the request to.
+            params: Query parameters, possibly including a 'poly' entry.
+            retry_policy: Optional policy overriding the client's one for this request.
+
+        Returns:
+            The response data as a dictionary.
+        """
+        method = _area_method(self.client, endpoint, params, self.max_url_length)
+        return self._request(method, endpoint, params, retry_policy)
+
+    def _stream(self, endpoint: str, params: Optional[dict] = None) -> Iterator[Any]:
+        """
+        Sends a request and parses the JSON array in its body as it is received,
+        without holding the whole response in memory.
+
+        Polygons too long for a URL are sent as a POST, like `_get_area`. Transient
+        failures are retried as long as no record has been yielded yet; the
+        response cache is bypassed.
+
+        Args:
+            endpoint: The API endpoint to send the request to.
+            params: Optional dictionary of parameters.
+
+        Yields:
+            The records of the response, one at a time.
+        """
+        params = params or {}
+        method = _area_method(self.client, endpoint, params, self.max_url_length)
+        kwargs = {"data": params} if method == "POST" else {"params": params}
+        self.retry_stats.record_request()
+        attempt = 0
+        started = False
+        while True:
+            attempt += 1
+            self.rate_limiter.acquire()
+            trace = start_trace(self.instruments, method, endpoint, attempt)
+            try:
+                with self.client.stream(
+                    method, endpoint, extensions=trace.extensions, **kwargs
+                ) as response:
+                    try:
+                        delay = self.retry_policy.schedule_retry(
+                            attempt, self.retry_stats, response=response
+                        )
+                        if delay is None:
+                            response.raise_for_status()
+                            for record in iter_json_array(response.iter_bytes()):
+                                started = True
+                                yield record
+                            return
+                    finally:
+                        trace.finish(response)
+            except RETRYABLE_EXCEPTIONS as exc:
+                trace.failed(exc)
+                if started:
+                    raise
+                delay = self.retry_policy.schedule_retry(
+                    attempt, self.retry_stats, exception=exc
+                )
+                if delay is None:
+                    raise
+            time.sleep(delay)
+
+    def decode(self, data: Any, kind: str) -> Any:
+        """
+        Converts records retrieved with `get_records` into the client's output
+        format.
+
+        Args:
+            data: The decoded JSON response.
+            kind: The record kind, e.g. "crime".
+
+        Returns:
+            The records in the client's output format.
+        """
+        if self.instruments:
+            return timed_decode(self.instruments, decode, data, kind, self.output)
+        return decode(data, kind, self.output)
+
+    def map(self, func: Callable, items: List) -> List:
+        """
+        Applies `func` to every item using the client's thread pool.
+
+        Args:
+            func: The function to call, usually one that sends a request.
+            items: The arguments to call it with.
+
+        Returns:
+            The results, in the same order as `items`. Called from a thread of
+            another map or imap_unordered, it runs serially on that thread, so
+            nested fan-outs never use more than `max_workers` threads.
+        """
+        if len(items) <= 1 or getattr(_pool_thread, "active", False):
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items)), initializer=_mark_pool_thread
+        ) as pool:
+            return list(pool.map(func, items))
+
+    def imap_unordered(
+        self, func: Callable, items: Iterable
+    ) -> Iterator[Tuple[Any, Any]]:
+        """
+        Applies `func` to every item using a thread pool, yielding results as soon
+        as they complete.
+
+        Args:
+            func: The function to call, usually one that sends a request.
+            items: The arguments to call it with.
+
+        Yields:
+            (item, result) tuples in completion order. The first exception raised
+            by `func` is re-raised and the remaining calls are cancelled. Like
+            map, it runs serially when called from one of their threads.
+        """
+        if getattr(_pool_thread, "active", False):
+            for item in items:
+                yield item, func(item)
+            return
+        pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, initializer=_mark_pool_thread
+        )
+        try:
+            futures = {pool.submit(func, item): item for item in items}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def get_records(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        subdivide: bool = False,
+        key: Callable[[Dict[str, Any]], Any] = lambda record: record["id"],
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves the records of any list endpoint as returned by the API, without
+        converting them to the client's output format.
+
+        Args:
+            endpoint: The API endpoint, e.g. "/crimes-street/all-crime".
+            params: Optional query parameters. A 'poly' entry too long to fit in a
+                URL is sent in a POST body.
+            subdivide: For a 'poly' area, split the polygon into smaller parts
+                whenever the API refuses it for matching too many records, and
+                merge the results. Defaults to False.
+            key: Function returning the identity of a record, used to drop records
+                returned for two parts of a subdivided area. Defaults to its 'id'.
+
+        Returns:
+            The records, as decoded from JSON.
+        """
+        params = params or {}
+        if subdivide and "poly" in params:
+            return self._get_subdivided(endpoint, params, key=key)
+        return self._get_area(endpoint, params)
+
+    def _get_subdivided(
+        self,
+        endpoint: str,
+        params: dict,
+        max_depth: int = 5,
+        key: Callable[[Dict[str, Any]], Any] = lambda record: record["id"],
+        max_requests: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Sends a GET request for a `poly` area, splitting the polygon into quadrants
+        whenever the API refuses it for matching too many records.
+
+        Every level of subdivision is requested concurrently, and records that fall
+        on the border between two parts are only returned once. Only the API's
+        over-limit refusal (a bare 503) splits the polygon; other failures are
+        retried by the retry policy. If a part is still refused after `max_depth`
+        splits, or the next level would exceed `max_requests`, the refusal is
+        raised.
+
+        Args:
+            endpoint: The API endpoint to send the request to.
+            params: Query parameters, including a 'poly' entry.
+            max_depth: Maximum number of times a polygon is split before giving up.
+            key: Function returning the identity of a record, used to de-duplicate.
+            max_requests: Maximum number of requests sent for the whole polygon.
+                Defaults to the size of a full quadtree of `max_depth` levels, so
+                that only `max_depth` limits the split.
+
+        Returns:
+            The merged list of records for the whole polygon.
+        """
+
+        def fetch(points, can_split):
+            try:
+                return self._get_area(endpoint, {**params, "poly": format_poly(points)})
+            except httpx.HTTPStatusError as exc:
+                if can_split and is_over_limit(exc.response):
+                    return exc
+                raise
+
+        if max_requests is None:
+            max_requests = sum(4**depth for depth in range(max_depth + 1))
+        merged = {}
+        pending = [parse_poly(params["poly"])]
+        sent = 0
+        for depth in range(max_depth + 1):
+            results = self.map(lambda points: fetch(points, depth < max_depth), pending)
+            sent += len(pending)
+            pending = _split_refused(pending, results, merged, key, max_requests - sent)
+            if not pending:
+                break
+        return list(merged.values())
+
+    def close(self) -> None:
+        """Closes the underlying HTTP client and its connections."""
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _mark_pool_thread() -> None:
+    """Flags a new pool thread, so fan-outs started on it run serially."""
+    _pool_thread.active = True
+
+
+def _area_method(client: Any, endpoint: str, params: dict, max_url_length: int) -> str:
+    """
+    Chooses how to send a request that may carry a long `poly` parameter.
+
+    Args:
+        client: The httpx client the request will be sent with.
+        endpoint: The API endpoint to send the request to.
+        params: Query parameters.
+        max_url_length: Longest URL that may be sent as a GET request.
+
+    Returns:
+        "POST" if the GET URL would be longer than `max_url_length`, else "GET".
+    """
+    if "poly" not in params:
+        return "GET"
+    url = client.build_request("GET", endpoint, params=params).url
+    return "POST" if len(str(url)) > max_url_length else "GET"
+
+
+def _merge_records(
+    merged: Dict[Any, Dict[str, Any]],
+    records: Iterable[Dict[str, Any]],
+    key: Callable[[Dict[str, Any]], Any],
+) -> None:
+    """Adds records to `merged`, keeping the first record seen for every key."""
+    for record in records:
+        merged.setdefault(key(record), record)
+
+
+def _split_refused(
+    pending: List[List[Point]],
+    results: List[Any],
+    merged: Dict[Any, Dict[str, Any]],
+    key: Callable[[Dict[str, Any]], Any],
+    budget: int,
+) -> List[List[Point]]:
+    """
+    Merges the records of one level of `_get_subdivided` and splits the refused
+    polygons into the next level.
+
+    Args:
+        pending: The polygons of the level.
+        results: Their records, or the HTTPStatusError of an over-limit refusal.
+        merged: Records merged so far, keyed by `key`.
+        key: Function returning the identity of a record.
+        budget: Number of requests that may still be sent.
+
+    Returns:
+        The polygons of the next level, empty when every part was accepted.
+
+    Raises:
+        httpx.HTTPStatusError: If the next level would need more than `budget`
+            requests.
+    """
+    refusals = []
+    split = []
+    for points, records in zip(pending, results):
+        if isinstance(records, httpx.HTTPStatusError):
+            refusals.append(records)
+            split.extend(split_polygon(points))
+        else:
+            _merge_records(merged, records, key)
+    if len(split) > budget:
+        raise refusals[0]
+    return split
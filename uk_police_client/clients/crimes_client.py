@@ -2,19 +2,23 @@
     Client for the Crimes endpoints
 """
 
-from typing import Optional, Dict, Any, List
+from itertools import product
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple, Union
+from datetime import datetime
 
 from uk_police_client.clients.base_client import BaseClient
+from uk_police_client.geometry import boundary_points, boundary_poly, record_within
+from uk_police_client.utils import is_case_closed, month_range
 
 
 class CrimesClient(BaseClient):
     """Client for accessing crimes data from the UK Police API."""
 
-    def __init__(self, timeout=10):
-        super().__init__(timeout=timeout)
+    def __init__(self, timeout=10, **kwargs):
+        super().__init__(timeout=timeout, **kwargs)
 
     def get_street_level_crimes(
-        self, location: dict, date: Optional[str] = None
+        self, location: dict, date: Optional[str] = None, subdivide: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Retrieves street-level crimes data based on a specific location.
@@ -25,11 +29,16 @@ class CrimesClient(BaseClient):
                     {'lat': Latitude, 'lng': Longitude}
                 For a custom area:
                     {'poly': 'lat1,lng1:lat2,lng2:lat3,lng3', ...}
+                    Polygons too long to fit in a URL are sent in a POST body.
             date: Optional. Limit results to a specific month in YYYY-MM format.
                   Defaults to the latest month if not provided.
+            subdivide: Optional. For a custom area, split the polygon into smaller
+                  parts whenever the API refuses it for containing more than 10,000
+                  crimes, and merge the results. Defaults to False.
 
         Returns:
-            A list of dictionaries containing street-level crimes data.
+            A list of dictionaries containing street-level crimes data, or a
+            CrimeFrame if the client was created with output="frame".
 
             Example Response (location = {"poly" : "52.268,0.543:52.794,0.238:52.130,0.478"}, date= "2022-01")
             [
@@ -56,7 +65,53 @@ class CrimesClient(BaseClient):
 
         """
         params = {"date": date, **location}
-        return self._get("/crimes-street/all-crime", params=params)
+        return self.decode(
+            self._street_level_crimes(params, subdivide and "poly" in params),
+            "crime",
+        )
+
+    def get_street_level_crimes_for_neighbourhood(
+        self,
+        force_id: str,
+        neighbourhood_id: str,
+        date: Optional[str] = None,
+        tolerance: Optional[float] = 0.0005,
+        subdivide: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieves street-level crimes within a neighbourhood, querying the API with a
+        simplified polygon covering its boundary.
+
+        The boundary is simplified with geometry.boundary_poly, which keeps the
+        request small while still covering the whole neighbourhood, and crimes
+        outside the original boundary are then dropped.
+
+        Args:
+            force_id: The unique identifier of the police force.
+            neighbourhood_id: The unique identifier of the neighbourhood.
+            date: Optional. Limit results to a specific month in YYYY-MM format.
+            tolerance: Optional. Simplification tolerance in degrees, defaults to
+                0.0005 (about 50m); None sends the boundary unchanged.
+            subdivide: Optional. Split the polygon into smaller requests if the
+                API refuses it for matching too many crimes.
+
+        Returns:
+            The crimes in the format of get_street_level_crimes.
+        """
+        boundary = boundary_points(self._boundary(force_id, neighbourhood_id))
+        params = {"date": date, "poly": boundary_poly(boundary, tolerance)}
+        crimes = self._street_level_crimes(params, subdivide)
+        if tolerance:
+            crimes = [crime for crime in crimes if record_within(boundary, crime)]
+        return self.decode(crimes, "crime")
+
+    def _street_level_crimes(
+        self, params: dict, subdivide: bool
+    ) -> List[Dict[str, Any]]:
+        """Fetches the raw street-level crimes for a location."""
+        if subdivide:
+            return self._get_subdivided("/crimes-street/all-crime", params)
+        return self._get_area("/crimes-street/all-crime", params)
 
     def get_street_level_outcomes(
         self, location: dict, date: Optional[str] = None
@@ -72,6 +127,7 @@ class CrimesClient(BaseClient):
                     {'lat': Latitude, 'lng': Longitude}
                 For a custom area:
                     {'poly': 'lat1,lng1:lat2,lng2:lat3,lng3', ...}
+                    Polygons too long to fit in a URL are sent in a POST body.
             date: Optional. Limit results to a specific month in YYYY-MM format.
                   Defaults to the latest month if not provided.
 
@@ -109,7 +165,7 @@ class CrimesClient(BaseClient):
             ]
         """
         params = {"date": date, **location}
-        return self._get("/outcomes-at-location", params=params)
+        return self.decode(self._get_area("/outcomes-at-location", params), "outcome")
 
     def get_crimes_at_location(
         self, location: dict, date: Optional[str] = None
@@ -127,7 +183,8 @@ class CrimesClient(BaseClient):
                   Defaults to the latest month if not provided.
 
         Returns:
-            A list of dictionaries containing crimes data at the specified location.
+            A list of dictionaries containing crimes data at the specified location,
+            or a CrimeFrame if the client was created with output="frame".
 
             Example Response (location = {"lat": 52.629729, "lng": -1.131592}, date= "2022-02"):
 
@@ -156,7 +213,8 @@ class CrimesClient(BaseClient):
             ]
         """
         params = {"date": date, **location}
-        return self._get("/crimes-at-location", params=params)
+        crimes = self._get("/crimes-at-location", params=params)
+        return self.decode(crimes, "crime")
 
     def get_crimes_no_location(
         self, category: str, force: str, date: Optional[str] = None
@@ -171,7 +229,8 @@ class CrimesClient(BaseClient):
                   Defaults to the latest month if not provided.
 
         Returns:
-            A list of dictionaries containing crimes data with no mapped location.
+            A list of dictionaries containing crimes data with no mapped location,
+            or a CrimeFrame if the client was created with output="frame".
 
             Example Response (category="all-crime", force="leicestershire", date="2022-03"):
             [
@@ -194,7 +253,8 @@ class CrimesClient(BaseClient):
         """
 
         params = {"category": category, "force": force, "date": date}
-        return self._get("/crimes-no-location", params=params)
+        crimes = self._get("/crimes-no-location", params=params)
+        return self.decode(crimes, "crime")
 
     def get_crime_categories(self, date: str) -> List[Dict[str, str]]:
         """
@@ -224,7 +284,9 @@ class CrimesClient(BaseClient):
             ]
         """
         params = {"date": date}
-        return self._get("/crime-categories", params=params)
+        return self.decode(
+            self._get_reference("/crime-categories", params=params), "crime_category"
+        )
 
     def get_last_updated_date(self) -> Dict[str, str]:
         """
@@ -239,7 +301,7 @@ class CrimesClient(BaseClient):
                 "date": "2011-09-01"
             }
         """
-        return self._get("/crime-last-updated")
+        return self.decode(self._get("/crime-last-updated"), "last_updated")
 
     def get_outcomes_for_crime(self, crime_id: str) -> Dict[str, Any]:
         """
@@ -291,4 +353,103 @@ class CrimesClient(BaseClient):
             }
         """
         endpoint = f"/outcomes-for-crime/{crime_id}"
-        return self._get(endpoint)
+        return self.decode(self._get_final(endpoint, is_case_closed), "crime_outcomes")
+
+    def iter_outcomes_for_crimes(
+        self, crimes: Iterable[Union[str, Dict[str, Any]]]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Retrieves the outcomes of many crimes concurrently.
+
+        Blank and repeated persistent IDs are skipped, and the remaining requests are
+        spread over the client's thread pool (`max_workers`) and throttled by its
+        rate limiter. With a response cache, closed cases (whose latest outcome is
+        final) are kept for good and never requested again.
+
+        Args:
+            crimes: Persistent IDs, or crimes as returned by get_street_level_crimes
+                (dictionaries, records or models), e.g. a whole month of crimes.
+
+        Yields:
+            (persistent_id, outcomes) tuples in the order the requests complete,
+            where outcomes is the get_outcomes_for_crime response.
+        """
+        yield from self.imap_unordered(
+            self.get_outcomes_for_crime, _persistent_ids(crimes)
+        )
+
+    def stream_street_level_crimes(
+        self, location: dict, date: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Streaming variant of `get_street_level_crimes`; yields records one at a time."""
+        params = {"date": date, **location}
+        return self._stream("/crimes-street/all-crime", params)
+
+    def stream_street_level_outcomes(
+        self, location: dict, date: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Streaming variant of `get_street_level_outcomes`; yields records one at a time."""
+        params = {"date": date, **location}
+        return self._stream("/outcomes-at-location", params)
+
+    def stream_crimes_at_location(
+        self, location: dict, date: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Streaming variant of `get_crimes_at_location`; yields records one at a time."""
+        params = {"date": date, **location}
+        return self._stream("/crimes-at-location", params)
+
+    def stream_crimes_no_location(
+        self, category: str, force: str, date: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Streaming variant of `get_crimes_no_location`; yields records one at a time."""
+        params = {"category": category, "force": force, "date": date}
+        return self._stream("/crimes-no-location", params)
+
+    def iter_crimes_no_location(
+        self,
+        categories: Iterable[str],
+        forces: Optional[Iterable[str]],
+        start: Union[str, datetime],
+        end: Union[str, datetime],
+    ) -> Iterator[Tuple[str, str, str, List[Dict[str, Any]]]]:
+        """
+        Retrieves crimes with no mapped location for every category, force and month
+        in a range concurrently.
+
+        Requests for the whole category x force x month grid are spread over the
+        client's thread pool (`max_workers`) and throttled by its rate limiter.
+
+        Args:
+            categories: Crime categories to cover, e.g. ["all-crime"].
+            forces: Force IDs to cover, or None for every force.
+            start: First month, in any format accepted by utils.format_date.
+            end: Last month, in any format accepted by utils.format_date.
+
+        Yields:
+            (category, force, month, crimes) tuples in the order the requests
+            complete, where crimes is the get_crimes_no_location response.
+        """
+        grid = list(
+            product(list(categories), self.force_ids(forces), month_range(start, end))
+        )
+        for (category, force, month), crimes in self.imap_unordered(
+            lambda cell: self.get_crimes_no_location(*cell), grid
+        ):
+            yield category, force, month, crimes
+
+
+def _persistent_ids(crimes: Iterable[Any]) -> Iterator[str]:
+    """Yields the distinct, non-blank persistent IDs of crimes or crime IDs."""
+    seen = set()
+    for crime in crimes:
+        if isinstance(crime, str):
+            crime_id = crime
+        elif isinstance(crime, dict):
+            crime_id = crime.get("persistent_id")
+        else:
+            crime_id = getattr(crime, "persistent_id", None)
+        crime_id = (crime_id or "").strip()
+        if crime_id and crime_id not in seen:
+            seen.add(crime_id)
+            yield crime_id
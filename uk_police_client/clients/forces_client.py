@@ -10,8 +10,8 @@ from uk_police_client.clients.base_client import BaseClient
 class ForcesClient(BaseClient):
     """Client for accessing police force data from the UK Police API."""
 
-    def __init__(self, timeout=10):
-        super().__init__(timeout=timeout)
+    def __init__(self, timeout=10, **kwargs):
+        super().__init__(timeout=timeout, **kwargs)
 
     def get_forces(self):
         """
@@ -24,7 +24,7 @@ class ForcesClient(BaseClient):
             Each dictionary contains 'id' (unique force identifier) and 'name' (force name) keys.
         """
 
-        return self._get("/forces")
+        return self.decode(self._get_reference("/forces"), "force")
 
     def get_force_details(self, force_id: str) -> Dict[str, Any]:
         """
@@ -55,7 +55,7 @@ class ForcesClient(BaseClient):
 
         """
         endpoint = f"/forces/{force_id}"
-        return self._get(endpoint)
+        return self.decode(self._get_reference(endpoint), "force_details")
 
     def get_force_senior_officers(self, force_id: str) -> List[Dict[str, Any]]:
         """
@@ -82,4 +82,4 @@ class ForcesClient(BaseClient):
             ]
         """
         endpoint = f"/forces/{force_id}/people"
-        return self._get(endpoint)
+        return self.decode(self._get(endpoint), "officer")
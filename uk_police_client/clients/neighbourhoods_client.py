@@ -2,16 +2,27 @@
     Client for the Neighbourhoods endpoints
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+import httpx
 
 from uk_police_client.clients.base_client import BaseClient
+from uk_police_client.boundary_store import write_boundary_store
+from uk_police_client.geometry import Point, boundary_points, parse_point
+from uk_police_client.neighbourhood_index import NeighbourhoodIndex
 
 
 class NeighbourhoodsClient(BaseClient):
     """Client for accessing Neighbourhoods data from the UK Police API."""
 
-    def __init__(self, timeout=10):
-        super().__init__(timeout=timeout)
+    def __init__(
+        self,
+        timeout=10,
+        neighbourhood_index: Optional[NeighbourhoodIndex] = None,
+        **kwargs,
+    ):
+        super().__init__(timeout=timeout, **kwargs)
+        self.neighbourhood_index = neighbourhood_index
 
     def get_neighbourhoods_for_force(self, force_id: str) -> List[Dict[str, str]]:
         """
@@ -37,7 +48,7 @@ class NeighbourhoodsClient(BaseClient):
             ]
         """
         endpoint = f"/{force_id}/neighbourhoods"
-        return self._get(endpoint)
+        return self.decode(self._get_reference(endpoint), "neighbourhood")
 
     def get_specific_neighbourhood(
         self, force_id: str, neighbourhood_id: str
@@ -90,7 +101,7 @@ class NeighbourhoodsClient(BaseClient):
             }
         """
         endpoint = f"/{force_id}/{neighbourhood_id}"
-        return self._get(endpoint)
+        return self.decode(self._get(endpoint), "neighbourhood_details")
 
     def get_neighbourhood_boundary(
         self, force_id: str, neighbourhood_id: str
@@ -98,6 +109,9 @@ class NeighbourhoodsClient(BaseClient):
         """
         Retrieves the boundary of a specific neighbourhood within a police force.
 
+        Served from the client's boundary_store, without a request, when the store
+        holds the neighbourhood.
+
         Args:
             force_id: The unique identifier of the police force.
             neighbourhood_id: The unique identifier of the neighbourhood.
@@ -122,8 +136,7 @@ class NeighbourhoodsClient(BaseClient):
                 }
             ]
         """
-        endpoint = f"/{force_id}/{neighbourhood_id}/boundary"
-        return self._get(endpoint)
+        return self.decode(self._boundary(force_id, neighbourhood_id), "boundary")
 
     def get_neighbourhood_team(
         self, force_id: str, neighbourhood_id: str
@@ -150,7 +163,7 @@ class NeighbourhoodsClient(BaseClient):
             ]
         """
         endpoint = f"/{force_id}/{neighbourhood_id}/people"
-        return self._get(endpoint)
+        return self.decode(self._get(endpoint), "officer")
 
     def get_neighbourhood_events(
         self, force_id: str, neighbourhood_id: str
@@ -180,7 +193,7 @@ class NeighbourhoodsClient(BaseClient):
             ]
         """
         endpoint = f"/{force_id}/{neighbourhood_id}/events"
-        return self._get(endpoint)
+        return self.decode(self._get(endpoint), "event")
 
     def get_neighbourhood_priorities(
         self, force_id: str, neighbourhood_id: str
@@ -213,7 +226,7 @@ class NeighbourhoodsClient(BaseClient):
             ]
         """
         endpoint = f"/{force_id}/{neighbourhood_id}/priorities"
-        return self._get(endpoint)
+        return self.decode(self._get(endpoint), "priority")
 
     def locate_neighbourhood(self, coordinates: str) -> Dict[str, str]:
         """
@@ -232,4 +245,125 @@ class NeighbourhoodsClient(BaseClient):
             }
         """
         params = {"q": coordinates}
-        return self._get("/locate-neighbourhood", params=params)
+        return self.decode(
+            self._get("/locate-neighbourhood", params=params), "located_neighbourhood"
+        )
+
+    def locate_neighbourhoods(
+        self,
+        points: Iterable[Union[str, Point]],
+        index: Optional[NeighbourhoodIndex] = None,
+        fallback: bool = True,
+    ) -> List[Optional[Dict[str, str]]]:
+        """
+        Locates the neighbourhood policing team responsible for each of many points.
+
+        Points are looked up in a local NeighbourhoodIndex first; only the points it
+        cannot place are sent to the locate-neighbourhood endpoint, concurrently.
+
+        Args:
+            points: "lat,lng" strings or (latitude, longitude) pairs.
+            index: Optional index to use instead of the client's neighbourhood_index.
+                Without either, every point is sent to the API.
+            fallback: Whether points missing from the index are sent to the API,
+                defaults to True.
+
+        Returns:
+            One locate_neighbourhood result per point, or None for points outside
+            every neighbourhood.
+        """
+        index = self.neighbourhood_index if index is None else index
+        points = [parse_point(point) for point in points]
+        if index is None:
+            results = [None] * len(points)
+        else:
+            results = index.locate_many(points)
+        misses = [i for i, result in enumerate(results) if result is None]
+
+        def locate(i):
+            lat, lng = points[i]
+            try:
+                return self._get("/locate-neighbourhood", params={"q": f"{lat},{lng}"})
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code == 404:
+                    return None
+                raise
+
+        if fallback:
+            for i, result in zip(misses, self.map(locate, misses)):
+                results[i] = result
+        return [
+            None if result is None else self.decode(result, "located_neighbourhood")
+            for result in results
+        ]
+
+    def build_neighbourhood_index(
+        self, forces: Optional[Iterable[str]] = None, cell_size: float = 0.02
+    ) -> NeighbourhoodIndex:
+        """
+        Downloads neighbourhood boundaries concurrently and indexes them for
+        locate_neighbourhoods.
+
+        Args:
+            forces: Force IDs to cover, or None for every force.
+            cell_size: Size of the index's grid cells in degrees, defaults to 0.02.
+
+        Returns:
+            A NeighbourhoodIndex; save it with `index.save(path)` to avoid rebuilding it.
+        """
+        return NeighbourhoodIndex.from_boundaries(
+            self.fetch_boundaries(forces), cell_size
+        )
+
+    def snapshot_boundaries(
+        self, path: str, forces: Optional[Iterable[str]] = None
+    ) -> int:
+        """
+        Downloads neighbourhood boundaries concurrently into a snapshot file that
+        can be opened with BoundaryStore and passed as `boundary_store`.
+
+        Args:
+            path: Path of the snapshot file, which is overwritten.
+            forces: Force IDs to cover, or None for every force.
+
+        Returns:
+            The number of boundaries written.
+        """
+        return write_boundary_store(path, self.fetch_boundaries(forces))
+
+    def fetch_boundaries(
+        self, forces: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, str, List[Point]]]:
+        """
+        Retrieves the boundary of every neighbourhood of the given forces concurrently,
+        from the boundary store when it has them.
+
+        Args:
+            forces: Force IDs to cover, or None for every force.
+
+        Returns:
+            (force_id, neighbourhood_id, points) tuples, with the points as
+            (latitude, longitude) tuples.
+        """
+        force_ids = self.force_ids(forces)
+        neighbourhoods = self.map(
+            lambda force_id: self._get_reference(f"/{force_id}/neighbourhoods"),
+            force_ids,
+        )
+        pairs = [
+            (force_id, neighbourhood["id"])
+            for force_id, found in zip(force_ids, neighbourhoods)
+            for neighbourhood in found
+        ]
+        boundaries = self.map(lambda pair: self._boundary(*pair), pairs)
+        return [
+            (force_id, neighbourhood_id, boundary_points(boundary))
+            for (force_id, neighbourhood_id), boundary in zip(pairs, boundaries)
+        ]
+
+    def stream_neighbourhood_boundary(
+        self, force_id: str, neighbourhood_id: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Streaming variant of `get_neighbourhood_boundary`; yields records one at a time."""
+        endpoint = f"/{force_id}/{neighbourhood_id}/boundary"
+        return self._stream(endpoint)
@@ -2,16 +2,19 @@
     Client for the Stop & Search endpoints
 """
 
-from typing import Optional, Dict, Any, List
+from itertools import product
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple, Union
+from datetime import datetime
 
 from uk_police_client.clients.base_client import BaseClient
+from uk_police_client.utils import month_range
 
 
 class StopAndSearchClient(BaseClient):
     """Client for accessing stop and searches data from the UK Police API."""
 
-    def __init__(self, timeout=10):
-        super().__init__(timeout=timeout)
+    def __init__(self, timeout=10, **kwargs):
+        super().__init__(timeout=timeout, **kwargs)
 
     def get_stop_and_searches_by_area(
         self, location: dict, date: Optional[str] = None
@@ -25,6 +28,7 @@ class StopAndSearchClient(BaseClient):
                     {'lat': Latitude, 'lng': Longitude}
                 For a custom area:
                     {'poly': 'lat1,lng1:lat2,lng2:lat3,lng3', ...}
+                    Polygons too long to fit in a URL are sent in a POST body.
             date: Optional. Limit results to a specific month in YYYY-MM format.
                   Defaults to the latest month if not provided.
 
@@ -65,7 +69,7 @@ class StopAndSearchClient(BaseClient):
             ]
         """
         params = {"date": date, **location}
-        return self._get("/stops-street", params=params)
+        return self.decode(self._get_area("/stops-street", params), "stop_and_search")
 
     def get_stop_and_searches_by_location(
         self, location_id: str, date: Optional[str] = None
@@ -111,7 +115,9 @@ class StopAndSearchClient(BaseClient):
             ]
         """
         params = {"location_id": location_id, "date": date}
-        return self._get("/stops-at-location", params=params)
+        return self.decode(
+            self._get("/stops-at-location", params=params), "stop_and_search"
+        )
 
     def get_stops_no_location(
         self, force: str, date: Optional[str] = None
@@ -150,7 +156,9 @@ class StopAndSearchClient(BaseClient):
             ]
         """
         params = {"force": force, "date": date}
-        return self._get("/stops-no-location", params=params)
+        return self.decode(
+            self._get("/stops-no-location", params=params), "stop_and_search"
+        )
 
     def get_stops_by_force(
         self, force: str, date: Optional[str] = None
@@ -196,4 +204,59 @@ class StopAndSearchClient(BaseClient):
             ]
         """
         params = {"force": force, "date": date}
-        return self._get("/stops-force", params=params)
+        return self.decode(self._get("/stops-force", params=params), "stop_and_search")
+
+    def stream_stop_and_searches_by_area(
+        self, location: dict, date: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Streaming variant of `get_stop_and_searches_by_area`; yields records one at a time."""
+        params = {"date": date, **location}
+        return self._stream("/stops-street", params)
+
+    def stream_stop_and_searches_by_location(
+        self, location_id: str, date: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Streaming variant of `get_stop_and_searches_by_location`; yields records one at a time."""
+        params = {"location_id": location_id, "date": date}
+        return self._stream("/stops-at-location", params)
+
+    def stream_stops_no_location(
+        self, force: str, date: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Streaming variant of `get_stops_no_location`; yields records one at a time."""
+        params = {"force": force, "date": date}
+        return self._stream("/stops-no-location", params)
+
+    def stream_stops_by_force(
+        self, force: str, date: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Streaming variant of `get_stops_by_force`; yields records one at a time."""
+        params = {"force": force, "date": date}
+        return self._stream("/stops-force", params)
+
+    def iter_stops_by_force(
+        self,
+        forces: Optional[Iterable[str]],
+        start: Union[str, datetime],
+        end: Union[str, datetime],
+    ) -> Iterator[Tuple[str, str, List[Dict[str, Any]]]]:
+        """
+        Retrieves stop and searches for every force and month in a range concurrently.
+
+        Requests for the whole force x month grid are spread over the client's thread
+        pool (`max_workers`) and throttled by its rate limiter.
+
+        Args:
+            forces: Force IDs to cover, or None for every force.
+            start: First month, in any format accepted by utils.format_date.
+            end: Last month, in any format accepted by utils.format_date.
+
+        Yields:
+            (force, month, searches) tuples in the order the requests complete, where
+            searches is the get_stops_by_force response.
+        """
+        grid = list(product(self.force_ids(forces), month_range(start, end)))
+        for (force, month), searches in self.imap_unordered(
+            lambda cell: self.get_stops_by_force(*cell), grid
+        ):
+            yield force, month, searches
@@ -0,0 +1,79 @@
+"""
+    Output formats for record-list responses
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+from uk_police_client.frames import CrimeFrame
+from uk_police_client.records import crime_records, stop_and_search_records
+
+# Decoders keyed by output format, then by record kind. Record kinds without a
+# decoder for the selected format are returned as plain dictionaries.
+DECODERS: Dict[str, Dict[str, Callable[[Any], Any]]] = {
+    "dict": {},
+    "frame": {"crime": CrimeFrame.from_records},
+    "record": {"crime": crime_records, "stop_and_search": stop_and_search_records},
+}
+# Output formats backed by pydantic models, whose decoders (and TypeAdapters) are
+# only built when first used, mapped to whether they validate lazily.
+MODEL_OUTPUTS = {"model": False, "lazy_model": True}
+
+
+def _decoders(output: str) -> Optional[Dict[str, Callable[[Any], Any]]]:
+    """Returns the decoders of an output format, building model decoders on first use."""
+    decoders = DECODERS.get(output)
+    if decoders is None and output in MODEL_OUTPUTS:
+        from uk_police_client.models import model_decoders
+
+        decoders = DECODERS.setdefault(
+            output, model_decoders(lazy=MODEL_OUTPUTS[output])
+        )
+    return decoders
+
+
+def register_decoder(output: str, kind: str, decoder: Callable[[Any], Any]) -> None:
+    """
+    Registers how responses of a record kind are decoded in an output format.
+
+    Args:
+        output: The output format, e.g. "frame".
+        kind: The record kind, e.g. "crime" or "stop_and_search".
+        decoder: Function turning the decoded JSON response into the output value.
+    """
+    if _decoders(output) is None:
+        DECODERS[output] = {}
+    DECODERS[output][kind] = decoder
+
+
+def check_output(output: str) -> str:
+    """
+    Validates an output format name.
+
+    Args:
+        output: The output format.
+
+    Returns:
+        The output format, unchanged.
+    """
+    if output not in DECODERS and output not in MODEL_OUTPUTS:
+        expected = sorted({*DECODERS, *MODEL_OUTPUTS})
+        raise ValueError(
+            f"Unknown output format {output!r}; expected one of {expected}."
+        )
+    return output
+
+
+def decode(data: Any, kind: str, output: str) -> Any:
+    """
+    Decodes a response into the requested output format.
+
+    Args:
+        data: The decoded JSON response.
+        kind: The record kind of the response.
+        output: The output format.
+
+    Returns:
+        The decoded value, or `data` itself if the format has no decoder for `kind`.
+    """
+    decoder = _decoders(output).get(kind)
+    return data if decoder is None else decoder(data)
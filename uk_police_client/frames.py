@@ -0,0 +1,268 @@
+"""
+    Columnar containers for street-level crime results
+"""
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from uk_police_client.utils import outcome_ids
+
+MISSING = -1
+
+
+class _DictionaryColumn:
+    """A string column stored as int32 codes into a list of distinct values."""
+
+    def __init__(self):
+        self.codes = array("i")
+        self.values: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self.codes.append(MISSING)
+            return
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        code = self.codes[i]
+        return None if code == MISSING else self.values[code]
+
+
+def _float(value: Any) -> float:
+    return float("nan") if value in (None, "") else float(value)
+
+
+class CrimeFrame:
+    """
+    Column-wise container for crime records, as returned by the crimes endpoints.
+
+    Coordinates are stored as float64, identifiers as int64 and repeated strings
+    (category, month, street name, ...) are dictionary-encoded as int32 codes, which
+    takes a fraction of the memory of the equivalent list of nested dictionaries.
+    Numeric columns and dictionary codes are exposed to NumPy, Arrow and pandas
+    without copying; those libraries are only needed for the conversion methods.
+
+    Missing values are NaN for coordinates and -1 for integer ids and codes.
+
+    Columns:
+        id, street_id: int64
+        latitude, longitude: float64
+        persistent_id, context: Python strings
+        category, month, street_name, location_type, location_subtype,
+        outcome_category, outcome_date: dictionary-encoded strings
+    """
+
+    NUMERIC_COLUMNS = {"id": "q", "street_id": "q", "latitude": "d", "longitude": "d"}
+    STRING_COLUMNS = ("persistent_id", "context")
+    DICTIONARY_COLUMNS = (
+        "category",
+        "month",
+        "street_name",
+        "location_type",
+        "location_subtype",
+        "outcome_category",
+        "outcome_date",
+    )
+
+    def __init__(self):
+        self._numeric = {
+            name: array(code) for name, code in self.NUMERIC_COLUMNS.items()
+        }
+        self._strings: Dict[str, List[str]] = {name: [] for name in self.STRING_COLUMNS}
+        self._dictionaries = {
+            name: _DictionaryColumn() for name in self.DICTIONARY_COLUMNS
+        }
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "CrimeFrame":
+        """
+        Builds a frame from crime records.
+
+        Args:
+            records: Crime dictionaries, e.g. a get_street_level_crimes response or a
+                stream_street_level_crimes iterator.
+
+        Returns:
+            A new CrimeFrame.
+        """
+        frame = cls()
+        frame.extend(records)
+        return frame
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> "CrimeFrame":
+        """
+        Appends crime records to the frame.
+
+        Args:
+            records: Crime dictionaries.
+
+        Returns:
+            The frame itself, so results of several requests can be chained together.
+        """
+        numeric = self._numeric
+        strings = self._strings
+        dictionaries = self._dictionaries
+        for record in records:
+            location = record.get("location") or {}
+            street = location.get("street") or {}
+            outcome = record.get("outcome_status") or {}
+            crime_id = record.get("id")
+            street_id = street.get("id")
+            numeric["id"].append(MISSING if crime_id is None else int(crime_id))
+            numeric["street_id"].append(
+                MISSING if street_id is None else int(street_id)
+            )
+            numeric["latitude"].append(_float(location.get("latitude")))
+            numeric["longitude"].append(_float(location.get("longitude")))
+            strings["persistent_id"].append(record.get("persistent_id") or "")
+            strings["context"].append(record.get("context") or "")
+            dictionaries["category"].append(record.get("category"))
+            dictionaries["month"].append(record.get("month"))
+            dictionaries["street_name"].append(street.get("name"))
+            dictionaries["location_type"].append(record.get("location_type"))
+            dictionaries["location_subtype"].append(record.get("location_subtype"))
+            dictionaries["outcome_category"].append(outcome.get("category"))
+            dictionaries["outcome_date"].append(outcome.get("date"))
+        return self
+
+    def __len__(self) -> int:
+        return len(self._numeric["id"])
+
+    @property
+    def columns(self) -> List[str]:
+        """The names of the columns."""
+        return [*self.NUMERIC_COLUMNS, *self.STRING_COLUMNS, *self.DICTIONARY_COLUMNS]
+
+    def categories(self, name: str) -> List[str]:
+        """
+        Returns the distinct values of a dictionary-encoded column.
+
+        Args:
+            name: One of DICTIONARY_COLUMNS.
+
+        Returns:
+            The values, indexed by their code.
+        """
+        return self._dictionaries[name].values
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Returns a column as a list of Python values, decoding dictionary columns.
+
+        Args:
+            name: The column name.
+
+        Returns:
+            A list with one value per crime.
+        """
+        if name in self._numeric:
+            return self._numeric[name].tolist()
+        if name in self._strings:
+            return list(self._strings[name])
+        column = self._dictionaries[name]
+        return [column[i] for i in range(len(column.codes))]
+
+    def outcome_ids(self) -> array:
+        """
+        Normalises the outcome_category labels to the integer ids of
+        utils.court_outcome_ids, e.g. to join or group crimes with outcomes.
+
+        Only the distinct labels are looked up; the codes of the column are then
+        translated through the resulting table.
+
+        Returns:
+            An int8 array with one id per crime, -1 where the outcome is missing or
+            unknown.
+        """
+        column = self._dictionaries["outcome_category"]
+        # Index -1 (MISSING) picks the trailing entry.
+        table = outcome_ids(column.values).tolist() + [MISSING]
+        return array("b", [table[code] for code in column.codes])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterates over the crimes as flat dictionaries."""
+        names = self.columns
+        for values in zip(*(self.column(name) for name in names)):
+            yield dict(zip(names, values))
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """
+        Exposes the columns as NumPy arrays.
+
+        Numeric columns and dictionary codes share memory with the frame, which
+        therefore cannot be extended while the arrays are alive. Use
+        `categories(name)` to decode the int32 codes of dictionary columns.
+
+        Returns:
+            A dictionary of arrays keyed by column name; string columns are object arrays.
+        """
+        np = _require("numpy")
+        arrays = {
+            name: np.frombuffer(values, dtype=np.dtype(values.typecode))
+            for name, values in self._numeric.items()
+        }
+        for name, values in self._strings.items():
+            arrays[name] = np.array(values, dtype=object)
+        for name, column in self._dictionaries.items():
+            arrays[name] = np.frombuffer(column.codes, dtype=np.int32)
+        return arrays
+
+    def to_arrow(self):
+        """
+        Converts the frame to a pyarrow Table, using dictionary arrays for the
+        dictionary-encoded columns.
+
+        Returns:
+            A pyarrow.Table with one row per crime.
+        """
+        np = _require("numpy")
+        pa = _require("pyarrow")
+        arrays = self.to_numpy()
+        columns = {}
+        for name in self.NUMERIC_COLUMNS:
+            mask = np.isnan(arrays[name]) if name in ("latitude", "longitude") else None
+            columns[name] = pa.array(arrays[name], mask=mask)
+        for name in self.STRING_COLUMNS:
+            columns[name] = pa.array(self._strings[name], type=pa.string())
+        for name in self.DICTIONARY_COLUMNS:
+            codes = arrays[name]
+            indices = pa.array(codes, mask=codes == MISSING)
+            dictionary = pa.array(self.categories(name), type=pa.string())
+            columns[name] = pa.DictionaryArray.from_arrays(indices, dictionary)
+        return pa.table(columns)
+
+    def to_pandas(self):
+        """
+        Converts the frame to a pandas DataFrame, using Categorical columns for the
+        dictionary-encoded columns.
+
+        Returns:
+            A pandas.DataFrame with one row per crime.
+        """
+        pd = _require("pandas")
+        arrays = self.to_numpy()
+        data = {}
+        for name in self.columns:
+            if name in self._dictionaries:
+                data[name] = pd.Categorical.from_codes(
+                    arrays[name], categories=self.categories(name)
+                )
+            else:
+                data[name] = arrays[name]
+        return pd.DataFrame(data, copy=False)
+
+
+def _require(module: str):
+    """Imports an optional dependency, explaining how to install it if missing."""
+    try:
+        return __import__(module)
+    except ImportError as exc:
+        raise ImportError(
+            f"{module} is required for this conversion; install it with "
+            "`pip install uk_police_client[frames]`."
+        ) from exc
@@ -0,0 +1,524 @@
+"""
+    Polygon helpers for the `poly` location parameter
+"""
+
+import math
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+Point = Tuple[float, float]
+
+# Distance in degrees (about 0.1mm) within which a point counts as on an edge.
+EPSILON = 1e-9
+
+
+def parse_poly(poly: str) -> List[Point]:
+    """
+    Parses a poly parameter into a list of points.
+
+    Args:
+        poly: Points in the API's "lat1,lng1:lat2,lng2:..." format.
+
+    Returns:
+        A list of (latitude, longitude) tuples.
+    """
+    points = []
+    for pair in poly.strip().strip(":").split(":"):
+        lat, lng = pair.split(",")
+        points.append((float(lat), float(lng)))
+    return points
+
+
+def format_poly(points: List[Point], precision: int = 6) -> str:
+    """
+    Formats a list of points as a poly parameter.
+
+    Args:
+        points: A list of (latitude, longitude) tuples.
+        precision: Number of decimal places kept, defaults to 6 (about 0.1m).
+
+    Returns:
+        Points in the API's "lat1,lng1:lat2,lng2:..." format.
+    """
+    return ":".join(f"{lat:.{precision}f},{lng:.{precision}f}" for lat, lng in points)
+
+
+def parse_point(point: Union[str, Point]) -> Point:
+    """
+    Parses a single coordinate pair.
+
+    Args:
+        point: A "lat,lng" string or a (latitude, longitude) pair.
+
+    Returns:
+        A (latitude, longitude) tuple of floats.
+    """
+    if isinstance(point, str):
+        lat, lng = point.split(",")
+    else:
+        lat, lng = point
+    return float(lat), float(lng)
+
+
+def boundary_points(boundary: List[Dict[str, Any]]) -> List[Point]:
+    """
+    Converts a get_neighbourhood_boundary response into a list of points.
+
+    Args:
+        boundary: Dictionaries with 'latitude' and 'longitude' entries, as strings or
+            numbers.
+
+    Returns:
+        A list of (latitude, longitude) tuples.
+    """
+    return [(float(p["latitude"]), float(p["longitude"])) for p in boundary]
+
+
+def contains_point(points: List[Point], point: Point) -> bool:
+    """
+    Tests whether a point lies inside a polygon, using the even-odd rule.
+
+    Args:
+        points: The polygon, as a list of (latitude, longitude) tuples.
+        point: The (latitude, longitude) tuple to test.
+
+    Returns:
+        True if the point is inside the polygon.
+    """
+    lat, lng = point
+    inside = False
+    lat2, lng2 = points[-1]
+    for lat1, lng1 in points:
+        if (lng1 > lng) != (lng2 > lng):
+            crossing = lat1 + (lng - lng1) * (lat2 - lat1) / (lng2 - lng1)
+            if lat < crossing:
+                inside = not inside
+        lat2, lng2 = lat1, lng1
+    return inside
+
+
+def record_within(boundary: List[Point], record: Dict[str, Any]) -> bool:
+    """
+    Tests whether a record's location falls inside a boundary.
+
+    Args:
+        boundary: The polygon, as a list of (latitude, longitude) tuples.
+        record: A crime, or any API record with a "location" object.
+
+    Returns:
+        True if the record has a location and it is inside the boundary.
+    """
+    location = record.get("location") or {}
+    if location.get("latitude") is None or location.get("longitude") is None:
+        return False
+    point = (float(location["latitude"]), float(location["longitude"]))
+    return contains_point(boundary, point)
+
+
+def polygon_area(points: List[Point]) -> float:
+    """
+    Computes the signed area of a polygon in squared degrees.
+
+    Args:
+        points: A list of (latitude, longitude) tuples.
+
+    Returns:
+        The shoelace area, positive for counter-clockwise rings in (lat, lng) order.
+    """
+    area = 0.0
+    for i, (x1, y1) in enumerate(points):
+        x2, y2 = points[(i + 1) % len(points)]
+        area += x1 * y2 - x2 * y1
+    return area / 2
+
+
+def bounding_box(points: List[Point]) -> Tuple[float, float, float, float]:
+    """
+    Computes the bounding box of a list of points.
+
+    Args:
+        points: A list of (latitude, longitude) tuples.
+
+    Returns:
+        A (min_lat, min_lng, max_lat, max_lng) tuple.
+    """
+    lats = [lat for lat, _ in points]
+    lngs = [lng for _, lng in points]
+    return min(lats), min(lngs), max(lats), max(lngs)
+
+
+def _clip_edge(points: List[Point], axis: int, bound: float, keep_below: bool):
+    """Sutherland-Hodgman step: keeps the part of a ring on one side of an axis line."""
+
+    def inside(point):
+        return point[axis] <= bound if keep_below else point[axis] >= bound
+
+    def crossing(a, b):
+        t = (bound - a[axis]) / (b[axis] - a[axis])
+        other = 1 - axis
+        point = [0.0, 0.0]
+        point[axis] = bound
+        point[other] = a[other] + t * (b[other] - a[other])
+        return tuple(point)
+
+    clipped = []
+    for i, current in enumerate(points):
+        previous = points[i - 1]
+        if inside(current):
+            if not inside(previous):
+                clipped.append(crossing(previous, current))
+            clipped.append(current)
+        elif inside(previous):
+            clipped.append(crossing(previous, current))
+    return clipped
+
+
+def clip_to_box(
+    points: List[Point], min_lat: float, min_lng: float, max_lat: float, max_lng: float
+) -> Optional[List[Point]]:
+    """
+    Clips a polygon to an axis-aligned box.
+
+    Args:
+        points: A list of (latitude, longitude) tuples.
+        min_lat, min_lng, max_lat, max_lng: The box to clip to.
+
+    Returns:
+        The clipped polygon, or None if nothing with a non-zero area is left.
+    """
+    for axis, bound, keep_below in (
+        (0, min_lat, False),
+        (0, max_lat, True),
+        (1, min_lng, False),
+        (1, max_lng, True),
+    ):
+        if not points:
+            return None
+        points = _clip_edge(points, axis, bound, keep_below)
+    # Drop consecutive duplicates created where the polygon touches the box.
+    deduped = [p for i, p in enumerate(points) if p != points[i - 1]]
+    if len(deduped) < 3 or abs(polygon_area(deduped)) < 1e-12:
+        return None
+    return deduped
+
+
+def split_polygon(points: List[Point]) -> List[List[Point]]:
+    """
+    Splits a polygon into the parts that fall in each quadrant of its bounding box.
+
+    Args:
+        points: A list of (latitude, longitude) tuples.
+
+    Returns:
+        Up to four polygons which together cover exactly the original shape.
+    """
+    min_lat, min_lng, max_lat, max_lng = bounding_box(points)
+    mid_lat = (min_lat + max_lat) / 2
+    mid_lng = (min_lng + max_lng) / 2
+    quadrants = [
+        (min_lat, min_lng, mid_lat, mid_lng),
+        (min_lat, mid_lng, mid_lat, max_lng),
+        (mid_lat, min_lng, max_lat, mid_lng),
+        (mid_lat, mid_lng, max_lat, max_lng),
+    ]
+    parts = (clip_to_box(points, *quadrant) for quadrant in quadrants)
+    return [part for part in parts if part]
+
+
+def _ring(points: List[Point]) -> List[Point]:
+    """Drops the closing point of rings that repeat their first point at the end."""
+    return points[:-1] if len(points) > 1 and points[0] == points[-1] else points
+
+
+def _cross(a: Point, b: Point, p: Point) -> float:
+    return (b[0] - a[0]) * (p[1] - a[1]) - (b[1] - a[1]) * (p[0] - a[0])
+
+
+def _douglas_peucker(
+    points: List[Point], first: int, last: int, tolerance: float, keep: List[bool]
+) -> None:
+    """Marks the vertices between `first` and `last` kept by Douglas-Peucker."""
+    pending = [(first, last)]
+    while pending:
+        first, last = pending.pop()
+        a, b = points[first], points[last]
+        length = math.hypot(b[0] - a[0], b[1] - a[1])
+        worst, worst_distance = None, tolerance
+        for i in range(first + 1, last):
+            if length:
+                distance = abs(_cross(a, b, points[i])) / length
+            else:
+                distance = math.hypot(points[i][0] - a[0], points[i][1] - a[1])
+            if distance > worst_distance:
+                worst, worst_distance = i, distance
+        if worst is not None:
+            keep[worst] = True
+            pending.extend(((first, worst), (worst, last)))
+
+
+def _line_intersection(a1, a2, b1, b2) -> Optional[Point]:
+    """Intersection of the infinite lines through a1-a2 and b1-b2, if not parallel."""
+    da = (a2[0] - a1[0], a2[1] - a1[1])
+    db = (b2[0] - b1[0], b2[1] - b1[1])
+    denominator = da[0] * db[1] - da[1] * db[0]
+    if abs(denominator) < 1e-18:
+        return None
+    t = ((b1[0] - a1[0]) * db[1] - (b1[1] - a1[1]) * db[0]) / denominator
+    return a1[0] + t * da[0], a1[1] + t * da[1]
+
+
+def _segments_cross(a1: Point, a2: Point, b1: Point, b2: Point) -> bool:
+    """Whether two segments intersect, touching included."""
+    d1, d2 = _cross(b1, b2, a1), _cross(b1, b2, a2)
+    d3, d4 = _cross(a1, a2, b1), _cross(a1, a2, b2)
+    return (d1 * d2 <= 0) and (d3 * d4 <= 0)
+
+
+def _crossing_edges(
+    first: List[Point], second: Optional[List[Point]] = None
+) -> Iterator[Tuple[int, int]]:
+    """
+    Yields (i, j) for every edge i of `first` touching edge j of `second`, or for
+    every pair of touching edges i < j of `first` alone. Edges are swept in order
+    of latitude so distant edges are never compared.
+    """
+    edges = []
+    for label, ring in enumerate((first, first if second is None else second)):
+        if label and second is None:
+            break
+        for i, a in enumerate(ring):
+            b = ring[(i + 1) % len(ring)]
+            edges.append((min(a[0], b[0]), max(a[0], b[0]), label, i, a, b))
+    edges.sort(key=lambda edge: edge[0])
+    active = []
+    for edge in edges:
+        min_lat, _, label, i, a, b = edge
+        active = [other for other in active if other[1] >= min_lat]
+        for _, _, other_label, j, c, d in active:
+            if second is None:
+                if _segments_cross(a, b, c, d):
+                    yield min(i, j), max(i, j)
+            elif other_label != label and _segments_cross(a, b, c, d):
+                yield (i, j) if label == 0 else (j, i)
+        active.append(edge)
+
+
+def _on_boundary(points: List[Point], point: Point) -> bool:
+    """Whether a point lies on an edge of a polygon, within EPSILON."""
+    return any(
+        _segment_distance(point, a, points[i - 1]) <= EPSILON
+        for i, a in enumerate(points)
+    )
+
+
+def _splits(a: Point, b: Point, c: Point, d: Point) -> List[float]:
+    """Positions along a-b, from 0 to 1, where the touching segment c-d meets it."""
+    crossing = _line_intersection(a, b, c, d)
+    length = (b[0] - a[0]) ** 2 + (b[1] - a[1]) ** 2
+    if crossing is not None:
+        touching = [crossing]
+    else:
+        # Collinear overlap: the segments meet between their endpoints.
+        touching = [c, d]
+    along = (
+        (p[0] - a[0]) * (b[0] - a[0]) + (p[1] - a[1]) * (b[1] - a[1]) for p in touching
+    )
+    return [min(max(t / length, 0.0), 1.0) for t in along]
+
+
+def polygon_contains(outer: List[Point], inner: List[Point]) -> bool:
+    """
+    Tests whether a polygon lies inside another one, boundaries included, so every
+    polygon contains itself.
+
+    Every edge of `inner` is cut where it meets an edge of `outer`; the pieces in
+    between cannot cross the boundary of `outer`, so each one is inside if its
+    endpoints and midpoint are inside or on the boundary.
+
+    Args:
+        outer: The containing polygon, as a list of (latitude, longitude) tuples.
+        inner: The contained polygon.
+
+    Returns:
+        True if no part of `inner` lies outside `outer`.
+    """
+    outer, inner = _ring(outer), _ring(inner)
+    cuts: Dict[int, List[float]] = {}
+    for i, j in _crossing_edges(outer, inner):
+        a, b = inner[j], inner[(j + 1) % len(inner)]
+        if a != b:
+            cuts.setdefault(j, []).extend(
+                _splits(a, b, outer[i], outer[(i + 1) % len(outer)])
+            )
+    for j, a in enumerate(inner):
+        b = inner[(j + 1) % len(inner)]
+        steps = sorted({0.0, 1.0, *cuts.get(j, [])})
+        for t in (*steps, *((s + e) / 2 for s, e in zip(steps, steps[1:]))):
+            point = (a[0] + t * (b[0] - a[0]), a[1] + t * (b[1] - a[1]))
+            if not contains_point(outer, point) and not _on_boundary(outer, point):
+                return False
+    return True
+
+
+def _segment_distance(point: Point, a: Point, b: Point) -> float:
+    """Distance from a point to the segment a-b."""
+    d_lat, d_lng = b[0] - a[0], b[1] - a[1]
+    length = d_lat * d_lat + d_lng * d_lng
+    if not length:
+        return math.hypot(point[0] - a[0], point[1] - a[1])
+    t = ((point[0] - a[0]) * d_lat + (point[1] - a[1]) * d_lng) / length
+    t = min(max(t, 0.0), 1.0)
+    return math.hypot(point[0] - a[0] - t * d_lat, point[1] - a[1] - t * d_lng)
+
+
+def _is_simple(ring: List[Point]) -> bool:
+    """Whether no two non-adjacent edges of a ring touch."""
+    n = len(ring)
+    for i, j in _crossing_edges(ring):
+        if j - i not in (1, n - 1):
+            return False
+    return True
+
+
+def _simplified(ring: List[Point], tolerance: float) -> List[Point]:
+    """Simplifies a ring with Douglas-Peucker, from the vertex furthest from the first."""
+    anchor = max(
+        range(1, len(ring)),
+        key=lambda i: math.hypot(ring[i][0] - ring[0][0], ring[i][1] - ring[0][1]),
+    )
+    keep = [False] * len(ring)
+    keep[0] = keep[anchor] = True
+    closed = ring + [ring[0]]
+    _douglas_peucker(closed, 0, anchor, tolerance, keep)
+    _douglas_peucker(closed, anchor, len(ring), tolerance, keep)
+    return [point for point, flag in zip(ring, keep) if flag]
+
+
+def _convex_hull(points: List[Point]) -> List[Point]:
+    """Counter-clockwise convex hull without collinear vertices (monotone chain)."""
+    points = sorted(set(points))
+    if len(points) < 3:
+        return points
+    lower: List[Point] = []
+    upper: List[Point] = []
+    for chain, ordered in ((lower, points), (upper, reversed(points))):
+        for point in ordered:
+            while len(chain) >= 2 and _cross(chain[-2], chain[-1], point) <= 0:
+                chain.pop()
+            chain.append(point)
+    return lower[:-1] + upper[:-1]
+
+
+def _expanded_hull(
+    ring: List[Point], tolerance: float, margin: float
+) -> Optional[List[Point]]:
+    """
+    Simplifies the convex hull of a ring and moves every edge out by `tolerance`
+    plus `margin`.
+
+    The simplified hull is convex and Douglas-Peucker leaves every hull vertex it
+    drops within `tolerance` of the edge replacing it, so the moved edges enclose
+    the whole hull, and the ring with it, with `margin` to spare.
+    """
+    hull = _convex_hull(ring)
+    if len(hull) < 3:
+        return None
+    hull = _simplified(hull, tolerance)
+    if len(hull) < 3:
+        return None
+    lines = []
+    for k, a in enumerate(hull):
+        b = hull[(k + 1) % len(hull)]
+        length = math.hypot(b[0] - a[0], b[1] - a[1])
+        # The interior is on the left of counter-clockwise rings: move to the right.
+        offset = (tolerance + margin) / length
+        shift = (offset * (b[1] - a[1]), -offset * (b[0] - a[0]))
+        lines.append(
+            ((a[0] + shift[0], a[1] + shift[1]), (b[0] + shift[0], b[1] + shift[1]))
+        )
+    corners = [_line_intersection(*lines[k - 1], *line) for k, line in enumerate(lines)]
+    return None if None in corners else corners
+
+
+def _rounded_box(ring: List[Point], precision: int) -> List[Point]:
+    """The bounding box of a ring, rounded outwards to `precision` decimals."""
+    scale = 10**precision
+    min_lat, min_lng, max_lat, max_lng = bounding_box(ring)
+    min_lat, min_lng = math.floor(min_lat * scale), math.floor(min_lng * scale)
+    max_lat, max_lng = math.ceil(max_lat * scale), math.ceil(max_lng * scale)
+    return [
+        (min_lat / scale, min_lng / scale),
+        (min_lat / scale, max_lng / scale),
+        (max_lat / scale, max_lng / scale),
+        (max_lat / scale, min_lng / scale),
+    ]
+
+
+def simplify_polygon(
+    points: List[Point], tolerance: float, precision: int = 6
+) -> List[Point]:
+    """
+    Simplifies a polygon into one with fewer vertices that still covers the whole
+    original shape.
+
+    Candidates are tried in turn, rounded to `precision` decimals, and the first
+    simple one that polygon_contains confirms covers the original is returned:
+
+    1. the ring simplified with Douglas-Peucker, which covers it when every
+       dropped vertex lies inside the simplified ring;
+    2. the convex hull of the ring, simplified with Douglas-Peucker and with every
+       edge moved out by `tolerance` so it covers the hull vertices it dropped;
+    3. the bounding box of the ring, rounded outwards, which always covers it.
+
+    Args:
+        points: A list of (latitude, longitude) tuples.
+        tolerance: Maximum distance in degrees (0.0005 is about 50m) a simplified
+            edge may stray from the vertices it replaces.
+        precision: Decimal places the result will be formatted with, defaults to 6.
+
+    Returns:
+        A list of (latitude, longitude) tuples covering the original polygon.
+    """
+    ring = _ring(points)
+    if len(ring) < 3:
+        return ring
+    # Rounding moves a vertex by less than 10**-precision, so leave room for it.
+    margin = 2 * 10**-precision
+    for candidate in (
+        _simplified(ring, tolerance),
+        _expanded_hull(ring, tolerance, margin),
+    ):
+        if not candidate or len(candidate) < 3:
+            continue
+        rounded = [
+            (round(lat, precision), round(lng, precision)) for lat, lng in candidate
+        ]
+        if _is_simple(rounded) and polygon_contains(rounded, ring):
+            return rounded
+    return _rounded_box(ring, precision)
+
+
+def boundary_poly(
+    boundary: List[Any], tolerance: Optional[float] = 0.0005, precision: int = 6
+) -> str:
+    """
+    Builds a `poly` parameter covering a neighbourhood boundary.
+
+    Args:
+        boundary: A get_neighbourhood_boundary response, or a list of
+            (latitude, longitude) tuples.
+        tolerance: Simplification tolerance in degrees passed to simplify_polygon,
+            defaults to 0.0005 (about 50m). None or 0 keeps every vertex.
+        precision: Number of decimal places kept, defaults to 6.
+
+    Returns:
+        Points in the API's "lat1,lng1:lat2,lng2:..." format.
+    """
+    if boundary and isinstance(boundary[0], dict):
+        points = boundary_points(boundary)
+    else:
+        points = [parse_point(point) for point in boundary]
+    if len(_ring(points)) < 3:
+        raise ValueError("A boundary needs at least three distinct points.")
+    if tolerance:
+        points = simplify_polygon(points, tolerance, precision)
+    return format_poly(_ring(points), precision)
@@ -0,0 +1,546 @@
+"""
+    Instrumentation hooks and metrics for requests sent to the UK Police API
+"""
+
+import bisect
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+# Upper bounds in seconds of the request latency histogram buckets.
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Path segments kept as they are in routes; any other segment is an identifier.
+_STATIC_SEGMENTS = frozenset(
+    {
+        "forces",
+        "people",
+        "neighbourhoods",
+        "boundary",
+        "events",
+        "priorities",
+        "crimes-street",
+        "crimes-at-location",
+        "crimes-no-location",
+        "crime-categories",
+        "crime-last-updated",
+        "outcomes-at-location",
+        "outcomes-for-crime",
+        "locate-neighbourhood",
+        "stops-street",
+        "stops-at-location",
+        "stops-no-location",
+        "stops-force",
+    }
+)
+
+# httpcore trace steps, and the phase of a request they are accounted to.
+_PHASES = {
+    "connect_tcp": "connect",
+    "start_tls": "tls",
+    "send_request_headers": "send",
+    "send_request_body": "send",
+    "receive_response_headers": "wait",
+    "receive_response_body": "receive",
+}
+
+
+def route(endpoint: str) -> str:
+    """
+    Replaces the identifiers in an endpoint with placeholders, so metrics are
+    aggregated per API route rather than per force or neighbourhood.
+
+    Args:
+        endpoint: The endpoint a request was sent to, e.g. "/leicestershire/NC04".
+
+    Returns:
+        The route, e.g. "/{id}/{id}".
+    """
+    segments = endpoint.strip("/").split("/")
+    return "/" + "/".join(
+        (
+            segment
+            if segment in _STATIC_SEGMENTS or (i and segments[i - 1] == "crimes-street")
+            else "{id}"
+        )
+        for i, segment in enumerate(segments)
+    )
+
+
+@dataclass
+class RequestEvent:
+    """
+    One attempt at sending a request.
+
+    Attributes:
+        method: "GET" or "POST".
+        endpoint: The endpoint the request was sent to.
+        route: The endpoint with identifiers replaced by placeholders.
+        attempt: The number of the attempt, starting at 1.
+        status: The HTTP status code, or None if no response was received.
+        elapsed: Seconds from sending the request to receiving its whole body (to
+            the end of iteration for streamed responses).
+        request_bytes: Size of the request body.
+        response_bytes: Bytes of response body received over the network.
+        parse_time: Seconds spent decoding the JSON body, None if it was not parsed
+            (errors, retries and streamed responses, which are parsed as they are
+            consumed).
+        phases: Seconds spent in each phase of the exchange reported by the
+            connection pool: "connect" (DNS lookup and TCP connect), "tls", "send",
+            "wait" (server time to the response headers) and "receive". Empty for
+            transports without tracing, e.g. mock transports.
+        error: Name of the exception raised by the attempt, if any.
+    """
+
+    method: str
+    endpoint: str
+    route: str
+    attempt: int
+    status: Optional[int] = None
+    elapsed: float = 0.0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    parse_time: Optional[float] = None
+    phases: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class DecodeEvent:
+    """
+    One conversion of records into the client's output format.
+
+    Attributes:
+        kind: The record kind, e.g. "crime".
+        output: The output format, e.g. "frame".
+        records: Number of records converted.
+        elapsed: Seconds spent converting them.
+    """
+
+    kind: str
+    output: str
+    records: int
+    elapsed: float
+
+
+class Instrument:
+    """
+    Receives instrumentation events from clients.
+
+    Subclass it and override the hooks of interest, then pass instances to a
+    client with `instruments=[...]`. Hooks run on the thread (or event loop) that
+    sent the request, so they should be quick and must be thread-safe when the
+    client fans out requests.
+    """
+
+    def on_request(self, event: RequestEvent) -> None:
+        """Called after every attempt at sending a request."""
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        """Called after records are converted into the client's output format."""
+
+
+class _NullTrace:
+    """Stands in for RequestTrace when a client has no instruments."""
+
+    extensions = None
+
+    def complete(self, response: httpx.Response) -> Any:
+        response.raise_for_status()
+        return response.json()
+
+    def finish(self, response: Optional[httpx.Response] = None) -> None:
+        pass
+
+    def failed(self, exc: BaseException) -> None:
+        pass
+
+
+NULL_TRACE = _NullTrace()
+
+
+class RequestTrace:
+    """Measures one attempt at sending a request and reports it to instruments."""
+
+    def __init__(
+        self,
+        instruments: Tuple[Instrument, ...],
+        method: str,
+        endpoint: str,
+        attempt: int,
+        asynchronous: bool = False,
+    ):
+        self.instruments = instruments
+        self.event = RequestEvent(method, endpoint, route(endpoint), attempt)
+        self.extensions = {"trace": self._atrace if asynchronous else self._trace}
+        self._steps: Dict[str, float] = {}
+        self._done = False
+        self._started = time.perf_counter()
+
+    def _trace(self, name: str, info: dict) -> None:
+        now = time.perf_counter()
+        step, _, state = name.rpartition(".")
+        step = step.partition(".")[2]
+        if state == "started":
+            self._steps[step] = now
+        elif step in self._steps and step in _PHASES:
+            phase = _PHASES[step]
+            phases = self.event.phases
+            phases[phase] = phases.get(phase, 0.0) + now - self._steps.pop(step)
+
+    async def _atrace(self, name: str, info: dict) -> None:
+        self._trace(name, info)
+
+    def complete(self, response: httpx.Response) -> Any:
+        """
+        Raises for error statuses, otherwise decodes the JSON body, timing it.
+
+        Args:
+            response: The response of the attempt.
+
+        Returns:
+            The decoded JSON body.
+        """
+        try:
+            response.raise_for_status()
+            self.event.elapsed = time.perf_counter() - self._started
+            started = time.perf_counter()
+            data = response.json()
+            self.event.parse_time = time.perf_counter() - started
+            return data
+        finally:
+            self.finish(response)
+
+    def finish(self, response: Optional[httpx.Response] = None) -> None:
+        """
+        Reports the attempt to the instruments, once.
+
+        Args:
+            response: The response of the attempt, if one was received.
+        """
+        if self._done:
+            return
+        self._done = True
+        event = self.event
+        if not event.elapsed:
+            event.elapsed = time.perf_counter() - self._started
+        if response is not None:
+            event.status = response.status_code
+            event.response_bytes = response.num_bytes_downloaded
+            if not event.response_bytes:
+                # Responses built in memory, e.g. by mock transports, are not counted.
+                try:
+                    event.response_bytes = len(response.content)
+                except httpx.ResponseNotRead:
+                    pass
+            event.request_bytes = len(response.request.content)
+        for instrument in self.instruments:
+            instrument.on_request(event)
+
+    def failed(self, exc: BaseException) -> None:
+        """
+        Reports an attempt that raised instead of returning a response.
+
+        Args:
+            exc: The exception raised.
+        """
+        if not self._done:
+            self.event.error = type(exc).__name__
+            self.finish()
+
+
+def start_trace(
+    instruments: Tuple[Instrument, ...],
+    method: str,
+    endpoint: str,
+    attempt: int,
+    asynchronous: bool = False,
+):
+    """
+    Starts measuring an attempt at sending a request.
+
+    Args:
+        instruments: The instruments of the client.
+        method: "GET" or "POST".
+        endpoint: The endpoint the request is sent to.
+        attempt: The number of the attempt, starting at 1.
+        asynchronous: Whether the request is sent by an async client.
+
+    Returns:
+        A RequestTrace, or a no-op stand-in when there are no instruments.
+    """
+    if not instruments:
+        return NULL_TRACE
+    return RequestTrace(instruments, method, endpoint, attempt, asynchronous)
+
+
+def timed_decode(
+    instruments: Tuple[Instrument, ...], decoder: Any, data: Any, kind: str, output: str
+) -> Any:
+    """
+    Converts records with `decoder(data, kind, output)`, reporting the time it took.
+
+    Args:
+        instruments: The instruments of the client.
+        decoder: The conversion function, e.g. decoding.decode.
+        data: The decoded JSON response.
+        kind: The record kind, e.g. "crime".
+        output: The output format.
+
+    Returns:
+        The converted records.
+    """
+    started = time.perf_counter()
+    result = decoder(data, kind, output)
+    records = len(data) if isinstance(data, list) else 1
+    event = DecodeEvent(kind, output, records, time.perf_counter() - started)
+    for instrument in instruments:
+        instrument.on_decode(event)
+    return result
+
+
+@dataclass
+class RouteMetrics:
+    """
+    Aggregated metrics of the requests sent to one route.
+
+    Attributes:
+        requests: Number of attempts.
+        retries: Number of attempts after the first one.
+        errors: Number of attempts that raised or returned an error status.
+        statuses: Number of attempts per HTTP status code.
+        seconds: Total seconds spent on the attempts.
+        latency: Number of attempts per bucket of LATENCY_BUCKETS, plus one for
+            slower attempts.
+        request_bytes: Total size of the request bodies.
+        response_bytes: Total bytes of response bodies received.
+        parse_seconds: Total seconds spent decoding JSON bodies.
+        phases: Total seconds per phase of the exchange.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+    seconds: float = 0.0
+    latency: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    request_bytes: int = 0
+    response_bytes: int = 0
+    parse_seconds: float = 0.0
+    phases: Dict[str, float] = field(default_factory=dict)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimates a latency quantile from the histogram.
+
+        Args:
+            q: The quantile, between 0 and 1.
+
+        Returns:
+            The upper bound of the bucket holding the quantile, or infinity if it
+            falls beyond the last bucket.
+        """
+        target = q * self.requests
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS, self.latency):
+            seen += count
+            if seen >= target:
+                return bound
+        return float("inf")
+
+
+class MetricsRecorder(Instrument):
+    """
+    Instrument aggregating metrics in memory, per method and route.
+
+    Share one between clients to see which endpoints dominate the time and bytes
+    of an ingest job, e.g. with `recorder.report()`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+        self.decodes: Dict[Tuple[str, str], List[float]] = {}
+
+    def on_request(self, event: RequestEvent) -> None:
+        with self._lock:
+            metrics = self.routes.get((event.method, event.route))
+            if metrics is None:
+                metrics = self.routes[(event.method, event.route)] = RouteMetrics()
+            metrics.requests += 1
+            metrics.retries += event.attempt > 1
+            if event.status is not None:
+                metrics.statuses[event.status] = (
+                    metrics.statuses.get(event.status, 0) + 1
+                )
+            if event.error is not None or (event.status or 0) >= 400:
+                metrics.errors += 1
+            metrics.seconds += event.elapsed
+            metrics.latency[bisect.bisect_left(LATENCY_BUCKETS, event.elapsed)] += 1
+            metrics.request_bytes += event.request_bytes
+            metrics.response_bytes += event.response_bytes
+            metrics.parse_seconds += event.parse_time or 0.0
+            for phase, seconds in event.phases.items():
+                metrics.phases[phase] = metrics.phases.get(phase, 0.0) + seconds
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        with self._lock:
+            totals = self.decodes.setdefault((event.kind, event.output), [0, 0, 0.0])
+            totals[0] += 1
+            totals[1] += event.records
+            totals[2] += event.elapsed
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Summarises the recorded requests.
+
+        Returns:
+            One dictionary per method and route, with its request count, retries,
+            errors, total and median seconds, bytes and JSON decode seconds, sorted
+            by total seconds, slowest first.
+        """
+        with self._lock:
+            rows = [
+                {
+                    "method": method,
+                    "route": route_,
+                    "requests": metrics.requests,
+                    "retries": metrics.retries,
+                    "errors": metrics.errors,
+                    "seconds": metrics.seconds,
+                    "p50": metrics.quantile(0.5),
+                    "response_bytes": metrics.response_bytes,
+                    "parse_seconds": metrics.parse_seconds,
+                }
+                for (method, route_), metrics in self.routes.items()
+            ]
+        return sorted(rows, key=lambda row: row["seconds"], reverse=True)
+
+
+def _require(module: str, extra: str):
+    """Imports an optional dependency, explaining how to install it if missing."""
+    try:
+        return __import__(module, fromlist=["_"])
+    except ImportError as exc:
+        raise ImportError(
+            f"{module} is required for this instrument; install it with "
+            f"`pip install uk_police_client[{extra}]`."
+        ) from exc
+
+
+class PrometheusInstrument(Instrument):
+    """
+    Instrument exporting metrics with prometheus_client.
+
+    Exposes `<namespace>_request_seconds` (histogram by method, route and status),
+    `<namespace>_response_bytes_total`, `<namespace>_request_bytes_total`,
+    `<namespace>_json_decode_seconds` (histogram by route) and
+    `<namespace>_decode_seconds` (histogram by kind and output).
+    """
+
+    def __init__(self, namespace: str = "uk_police", registry: Any = None):
+        """
+        Initializes the PrometheusInstrument.
+
+        Args:
+            namespace: Prefix of the metric names, defaults to "uk_police".
+            registry: Optional CollectorRegistry, defaults to the global one.
+        """
+        prometheus = _require("prometheus_client", "prometheus")
+        options = {"namespace": namespace}
+        if registry is not None:
+            options["registry"] = registry
+        self.request_seconds = prometheus.Histogram(
+            "request_seconds",
+            "Time spent on requests to the UK Police API.",
+            ["method", "route", "status"],
+            buckets=LATENCY_BUCKETS,
+            **options,
+        )
+        self.response_bytes = prometheus.Counter(
+            "response_bytes",
+            "Bytes of response bodies received from the UK Police API.",
+            ["method", "route"],
+            **options,
+        )
+        self.request_bytes = prometheus.Counter(
+            "request_bytes",
+            "Bytes of request bodies sent to the UK Police API.",
+            ["method", "route"],
+            **options,
+        )
+        self.json_decode_seconds = prometheus.Histogram(
+            "json_decode_seconds",
+            "Time spent decoding JSON response bodies.",
+            ["route"],
+            **options,
+        )
+        self.decode_seconds = prometheus.Histogram(
+            "decode_seconds",
+            "Time spent converting records into the client's output format.",
+            ["kind", "output"],
+            **options,
+        )
+
+    def on_request(self, event: RequestEvent) -> None:
+        status = event.error or str(event.status)
+        self.request_seconds.labels(event.method, event.route, status).observe(
+            event.elapsed
+        )
+        self.response_bytes.labels(event.method, event.route).inc(event.response_bytes)
+        self.request_bytes.labels(event.method, event.route).inc(event.request_bytes)
+        if event.parse_time is not None:
+            self.json_decode_seconds.labels(event.route).observe(event.parse_time)
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        self.decode_seconds.labels(event.kind, event.output).observe(event.elapsed)
+
+
+class OpenTelemetryInstrument(Instrument):
+    """
+    Instrument recording metrics with the OpenTelemetry metrics API.
+
+    Records the `uk_police.request.duration`, `uk_police.json_decode.duration` and
+    `uk_police.decode.duration` histograms (in seconds) and the
+    `uk_police.response.size` and `uk_police.request.size` counters (in bytes),
+    with method, route and status attributes.
+    """
+
+    def __init__(self, meter: Any = None):
+        """
+        Initializes the OpenTelemetryInstrument.
+
+        Args:
+            meter: Optional Meter, defaults to one from the global MeterProvider.
+        """
+        if meter is None:
+            metrics = _require("opentelemetry.metrics", "opentelemetry")
+            meter = metrics.get_meter("uk_police_client")
+        self.request_duration = meter.create_histogram(
+            "uk_police.request.duration", unit="s"
+        )
+        self.json_decode_duration = meter.create_histogram(
+            "uk_police.json_decode.duration", unit="s"
+        )
+        self.decode_duration = meter.create_histogram(
+            "uk_police.decode.duration", unit="s"
+        )
+        self.response_size = meter.create_counter("uk_police.response.size", unit="By")
+        self.request_size = meter.create_counter("uk_police.request.size", unit="By")
+
+    def on_request(self, event: RequestEvent) -> None:
+        attributes = {"method": event.method, "route": event.route}
+        self.response_size.add(event.response_bytes, attributes)
+        self.request_size.add(event.request_bytes, attributes)
+        if event.parse_time is not None:
+            self.json_decode_duration.record(event.parse_time, attributes)
+        attributes["status"] = event.error or str(event.status)
+        self.request_duration.record(event.elapsed, attributes)
+
+    def on_decode(self, event: DecodeEvent) -> None:
+        self.decode_duration.record(
+            event.elapsed, {"kind": event.kind, "output": event.output}
+        )
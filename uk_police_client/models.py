@@ -0,0 +1,274 @@
+"""
+    Typed models for UK Police API responses
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union, get_args
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+
+class _Model(BaseModel):
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
+
+
+class Street(_Model):
+    id: int
+    name: str
+
+
+class Location(_Model):
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+    street: Optional[Street] = None
+
+
+class OutcomeStatus(_Model):
+    category: str
+    date: str
+
+
+class Crime(_Model):
+    id: int
+    category: str
+    month: str
+    persistent_id: str = ""
+    context: str = ""
+    location_type: Optional[str] = None
+    location_subtype: Optional[str] = None
+    location: Optional[Location] = None
+    outcome_status: Optional[OutcomeStatus] = None
+
+
+class OutcomeCategory(_Model):
+    code: str
+    name: str
+
+
+class Outcome(_Model):
+    category: OutcomeCategory
+    date: str
+    person_id: Optional[int] = None
+    crime: Optional[Crime] = None
+
+
+class CrimeOutcomes(_Model):
+    crime: Crime
+    outcomes: List[Outcome]
+
+
+class CrimeCategory(_Model):
+    url: str
+    name: str
+
+
+class LastUpdated(_Model):
+    date: str
+
+
+class OutcomeObject(_Model):
+    id: str
+    name: str
+
+
+class StopAndSearch(_Model):
+    type: str
+    datetime: datetime
+    involved_person: Optional[bool] = None
+    age_range: Optional[str] = None
+    gender: Optional[str] = None
+    self_defined_ethnicity: Optional[str] = None
+    officer_defined_ethnicity: Optional[str] = None
+    legislation: Optional[str] = None
+    object_of_search: Optional[str] = None
+    outcome: Union[str, bool, None] = None
+    outcome_object: Optional[OutcomeObject] = None
+    outcome_linked_to_object_of_search: Optional[bool] = None
+    removal_of_more_than_outer_clothing: Optional[bool] = None
+    operation: Optional[bool] = None
+    operation_name: Optional[str] = None
+    location: Optional[Location] = None
+
+
+class Force(_Model):
+    id: str
+    name: str
+
+
+class EngagementMethod(_Model):
+    url: Optional[str] = None
+    description: Optional[str] = None
+    title: Optional[str] = None
+
+
+class ForceDetails(_Model):
+    id: str
+    name: str
+    description: Optional[str] = None
+    url: Optional[str] = None
+    telephone: Optional[str] = None
+    engagement_methods: List[EngagementMethod] = []
+
+
+class Officer(_Model):
+    name: str
+    rank: Optional[str] = None
+    bio: Optional[str] = None
+    contact_details: Dict[str, str] = {}
+
+
+class Neighbourhood(_Model):
+    id: str
+    name: str
+
+
+class Link(_Model):
+    url: Optional[str] = None
+    description: Optional[str] = None
+    title: Optional[str] = None
+
+
+class Centre(_Model):
+    latitude: float
+    longitude: float
+
+
+class NeighbourhoodLocation(_Model):
+    name: Optional[str] = None
+    type: Optional[str] = None
+    address: Optional[str] = None
+    postcode: Optional[str] = None
+    description: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+
+class NeighbourhoodDetails(_Model):
+    id: str
+    name: str
+    description: Optional[str] = None
+    population: Optional[str] = None
+    url_force: Optional[str] = None
+    contact_details: Dict[str, str] = {}
+    links: List[Link] = []
+    centre: Optional[Centre] = None
+    locations: List[NeighbourhoodLocation] = []
+
+
+class BoundaryPoint(_Model):
+    latitude: float
+    longitude: float
+
+
+class Event(_Model):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    address: Optional[str] = None
+    type: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    contact_details: Dict[str, str] = {}
+
+
+class Priority(_Model):
+    issue: Optional[str] = None
+    issue_date: Optional[datetime] = Field(None, alias="issue-date")
+    action: Optional[str] = None
+    action_date: Optional[datetime] = Field(None, alias="action-date")
+
+
+class LocatedNeighbourhood(_Model):
+    force: str
+    neighbourhood: str
+
+
+# The type every record kind is validated as.
+MODEL_TYPES: Dict[str, Any] = {
+    "crime": List[Crime],
+    "outcome": List[Outcome],
+    "crime_outcomes": CrimeOutcomes,
+    "crime_category": List[CrimeCategory],
+    "last_updated": LastUpdated,
+    "stop_and_search": List[StopAndSearch],
+    "force": List[Force],
+    "force_details": ForceDetails,
+    "officer": List[Officer],
+    "neighbourhood": List[Neighbourhood],
+    "neighbourhood_details": NeighbourhoodDetails,
+    "boundary": List[BoundaryPoint],
+    "event": List[Event],
+    "priority": List[Priority],
+    "located_neighbourhood": LocatedNeighbourhood,
+}
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Any) -> TypeAdapter:
+    """Returns a shared TypeAdapter, since building one compiles a validator."""
+    return TypeAdapter(tp)
+
+
+class LazyModelList(Sequence):
+    """
+    List of records that are only validated into models when first accessed.
+
+    Useful when a large response is filtered or only partly read: records that are
+    never looked at cost nothing beyond the decoded JSON.
+    """
+
+    def __init__(self, records: List[Dict[str, Any]], model: type):
+        """
+        Initializes the LazyModelList.
+
+        Args:
+            records: The decoded JSON records.
+            model: The model class each record is validated as.
+        """
+        self._records = records
+        self._adapter = type_adapter(model)
+        self._models: List[Optional[BaseModel]] = [None] * len(records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        model = self._models[index]
+        if model is None:
+            model = self._models[index] = self._adapter.validate_python(
+                self._records[index]
+            )
+        return model
+
+    @property
+    def raw(self) -> List[Dict[str, Any]]:
+        """The underlying records, as dictionaries."""
+        return self._records
+
+
+def model_decoders(lazy: bool = False) -> Dict[str, Callable[[Any], Any]]:
+    """
+    Builds the decoders turning every record kind into models.
+
+    Args:
+        lazy: Whether lists are wrapped in a LazyModelList instead of being validated
+            in bulk.
+
+    Returns:
+        Decoders keyed by record kind.
+    """
+
+    def bulk(tp):
+        adapter = type_adapter(tp)
+        return adapter.validate_python
+
+    def deferred(tp):
+        if getattr(tp, "__origin__", None) is list:
+            (model,) = get_args(tp)
+            return lambda records: LazyModelList(records, model)
+        return bulk(tp)
+
+    build = deferred if lazy else bulk
+    return {kind: build(tp) for kind, tp in MODEL_TYPES.items()}
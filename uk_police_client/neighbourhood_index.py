@@ -0,0 +1,186 @@
+"""
+    Local reverse-geocoding index of neighbourhood boundaries
+"""
+
+import json
+import math
+import zlib
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from uk_police_client.geometry import Point, bounding_box, contains_point, parse_point
+
+FORMAT_VERSION = 1
+
+
+class NeighbourhoodIndex:
+    """
+    Answers locate_neighbourhood lookups in-process from neighbourhood boundaries.
+
+    Boundaries are bucketed into a grid of `cell_size` degree cells by their bounding
+    box, so a lookup only runs the point-in-polygon test against the few
+    neighbourhoods whose bounding box overlaps the point's cell.
+
+    Build one with `NeighbourhoodsClient.build_neighbourhood_index()`, persist it
+    with `save()` and reload it with `NeighbourhoodIndex.load()`.
+    """
+
+    def __init__(self, cell_size: float = 0.02):
+        """
+        Initializes an empty NeighbourhoodIndex.
+
+        Args:
+            cell_size: Size of the grid cells in degrees, defaults to 0.02 (about
+                2km). Smaller cells mean fewer candidates per lookup but more cells
+                per neighbourhood.
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive.")
+        self.cell_size = cell_size
+        self._neighbourhoods: List[Tuple[str, str, List[Point], Tuple]] = []
+        self._grid: Dict[Tuple[int, int], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._neighbourhoods)
+
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return math.floor(lat / self.cell_size), math.floor(lng / self.cell_size)
+
+    def add(self, force_id: str, neighbourhood_id: str, points: List[Point]) -> None:
+        """
+        Adds a neighbourhood boundary to the index.
+
+        Args:
+            force_id: The unique identifier of the police force.
+            neighbourhood_id: The unique identifier of the neighbourhood.
+            points: The boundary, as a list of (latitude, longitude) tuples.
+        """
+        if len(points) < 3:
+            return
+        box = bounding_box(points)
+        position = len(self._neighbourhoods)
+        self._neighbourhoods.append((force_id, neighbourhood_id, points, box))
+        min_row, min_col = self._cell(box[0], box[1])
+        max_row, max_col = self._cell(box[2], box[3])
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                self._grid.setdefault((row, col), []).append(position)
+
+    def locate(self, point: Union[str, Point]) -> Optional[Dict[str, str]]:
+        """
+        Finds the neighbourhood containing a point.
+
+        Args:
+            point: A "lat,lng" string or a (latitude, longitude) pair.
+
+        Returns:
+            A dictionary with the 'force' and 'neighbourhood' identifiers, like
+            locate_neighbourhood, or None if no indexed boundary contains the point.
+        """
+        lat, lng = parse_point(point)
+        for position in self._grid.get(self._cell(lat, lng), ()):
+            force_id, neighbourhood_id, points, box = self._neighbourhoods[position]
+            if (
+                box[0] <= lat <= box[2]
+                and box[1] <= lng <= box[3]
+                and contains_point(points, (lat, lng))
+            ):
+                return {"force": force_id, "neighbourhood": neighbourhood_id}
+        return None
+
+    def locate_many(
+        self, points: Iterable[Union[str, Point]]
+    ) -> List[Optional[Dict[str, str]]]:
+        """
+        Finds the neighbourhood containing each of several points.
+
+        Args:
+            points: "lat,lng" strings or (latitude, longitude) pairs.
+
+        Returns:
+            One result per point, as returned by `locate`.
+        """
+        return [self.locate(point) for point in points]
+
+    def overlaps(self, box: Tuple[float, float, float, float]) -> bool:
+        """
+        Tests whether any indexed neighbourhood may have ground inside a box.
+
+        Args:
+            box: A (min_lat, min_lng, max_lat, max_lng) tuple.
+
+        Returns:
+            True if the bounding box of a neighbourhood overlaps the box.
+        """
+        min_lat, min_lng, max_lat, max_lng = box
+        min_row, min_col = self._cell(min_lat, min_lng)
+        max_row, max_col = self._cell(max_lat, max_lng)
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                for position in self._grid.get((row, col), ()):
+                    other = self._neighbourhoods[position][3]
+                    if (
+                        other[0] <= max_lat
+                        and min_lat <= other[2]
+                        and other[1] <= max_lng
+                        and min_lng <= other[3]
+                    ):
+                        return True
+        return False
+
+    @classmethod
+    def from_boundaries(
+        cls, boundaries: Iterable[Tuple[str, str, List[Point]]], cell_size: float = 0.02
+    ) -> "NeighbourhoodIndex":
+        """
+        Builds an index from boundaries, e.g. those of a BoundaryStore.
+
+        Args:
+            boundaries: (force_id, neighbourhood_id, points) tuples, such as
+                `store.items()`.
+            cell_size: Size of the grid cells in degrees, defaults to 0.02.
+
+        Returns:
+            A new NeighbourhoodIndex.
+        """
+        index = cls(cell_size)
+        for force_id, neighbourhood_id, points in boundaries:
+            index.add(force_id, neighbourhood_id, points)
+        return index
+
+    def save(self, path: str) -> None:
+        """
+        Writes the index to a file.
+
+        Args:
+            path: Path of the file, which is overwritten.
+        """
+        payload = {
+            "version": FORMAT_VERSION,
+            "cell_size": self.cell_size,
+            "neighbourhoods": [
+                [force_id, neighbourhood_id, points]
+                for force_id, neighbourhood_id, points, _ in self._neighbourhoods
+            ],
+        }
+        with open(path, "wb") as file:
+            file.write(zlib.compress(json.dumps(payload).encode()))
+
+    @classmethod
+    def load(cls, path: str) -> "NeighbourhoodIndex":
+        """
+        Reads an index written by `save`.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            The NeighbourhoodIndex.
+        """
+        with open(path, "rb") as file:
+            payload = json.loads(zlib.decompress(file.read()))
+        if payload.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported neighbourhood index file: {path}")
+        index = cls(payload["cell_size"])
+        for force_id, neighbourhood_id, points in payload["neighbourhoods"]:
+            index.add(force_id, neighbourhood_id, [tuple(p) for p in points])
+        return index
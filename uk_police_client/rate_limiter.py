@@ -0,0 +1,91 @@
+"""
+    Client-side rate limiting for the UK Police API
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter that is safe to share between threads and event loops.
+
+    The bucket refills at `rate` tokens per second up to `burst` tokens and every
+    request consumes one token. Callers reserve a token under a lock and then sleep
+    outside of it, so waiting threads and coroutines never hold the lock and are
+    served in the order they arrived.
+    """
+
+    def __init__(self, rate: float = 15, burst: int = 30):
+        """
+        Initializes the TokenBucket.
+
+        Args:
+            rate: Sustained number of requests allowed per second, defaults to 15.
+            burst: Maximum number of requests that may be sent back to back, defaults to 30.
+        """
+        self._lock = threading.Lock()
+        self.configure(rate, burst)
+
+    def configure(self, rate: float, burst: int) -> None:
+        """
+        Changes the rate and burst size, refilling the bucket to the new burst size.
+
+        Args:
+            rate: Sustained number of requests allowed per second.
+            burst: Maximum number of requests that may be sent back to back.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("Rate must be positive and burst at least 1.")
+        with self._lock:
+            self.rate = float(rate)
+            self.burst = int(burst)
+            self._tokens = float(burst)
+            self._updated = time.monotonic()
+
+    def _reserve(self) -> float:
+        """
+        Takes one token from the bucket.
+
+        Returns:
+            The number of seconds the caller must wait before sending its request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """Blocks the current thread until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Suspends the current coroutine until a request may be sent."""
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+# Shared by every client in the process unless one is given its own limiter.
+# Matches the published data.police.uk policy of 15 requests/second, burst 30.
+default_rate_limiter = TokenBucket(rate=15, burst=30)
+
+
+def configure_rate_limit(rate: float = 15, burst: int = 30) -> None:
+    """
+    Reconfigures the process-wide rate limiter shared by all clients.
+
+    Args:
+        rate: Sustained number of requests allowed per second, defaults to 15.
+        burst: Maximum number of requests that may be sent back to back, defaults to 30.
+    """
+    default_rate_limiter.configure(rate, burst)
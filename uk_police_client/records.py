@@ -0,0 +1,168 @@
+"""
+    Compact record classes for crime and stop and search rows
+"""
+
+from sys import intern
+from typing import Any, Dict, List, Optional
+
+
+def _interned(value: Optional[str]) -> Optional[str]:
+    return intern(value) if isinstance(value, str) else value
+
+
+def _coordinate(value: Any) -> Optional[float]:
+    return None if value in (None, "") else float(value)
+
+
+class _Record:
+    """Base for flat records stored in __slots__ instead of a per-instance dict."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the record as a flat dictionary."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._values()))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{n}={getattr(self, n)!r}" for n in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class CrimeRecord(_Record):
+    """
+    A crime with its location and outcome flattened into attributes.
+
+    Repeated strings (category, month, street name, ...) are interned so every
+    record refers to a single shared copy. A blank persistent_id stays "", as in
+    the API response and CrimeFrame.
+    """
+
+    __slots__ = (
+        "id",
+        "category",
+        "month",
+        "persistent_id",
+        "context",
+        "location_type",
+        "location_subtype",
+        "latitude",
+        "longitude",
+        "street_id",
+        "street_name",
+        "outcome_category",
+        "outcome_date",
+    )
+
+    def __init__(self, record: Dict[str, Any]):
+        """
+        Initializes the CrimeRecord from a crime dictionary.
+
+        Args:
+            record: A crime as returned by the crimes endpoints.
+        """
+        location = record.get("location") or {}
+        street = location.get("street") or {}
+        outcome = record.get("outcome_status") or {}
+        self.id = record.get("id")
+        self.category = _interned(record.get("category"))
+        self.month = _interned(record.get("month"))
+        self.persistent_id = record.get("persistent_id") or ""
+        self.context = _interned(record.get("context"))
+        self.location_type = _interned(record.get("location_type"))
+        self.location_subtype = _interned(record.get("location_subtype"))
+        self.latitude = _coordinate(location.get("latitude"))
+        self.longitude = _coordinate(location.get("longitude"))
+        self.street_id = street.get("id")
+        self.street_name = _interned(street.get("name"))
+        self.outcome_category = _interned(outcome.get("category"))
+        self.outcome_date = _interned(outcome.get("date"))
+
+
+class StopAndSearchRecord(_Record):
+    """
+    A stop and search with its location and outcome flattened into attributes.
+
+    Repeated strings (type, age range, legislation, street name, ...) are interned
+    so every record refers to a single shared copy.
+    """
+
+    __slots__ = (
+        "type",
+        "datetime",
+        "involved_person",
+        "age_range",
+        "gender",
+        "self_defined_ethnicity",
+        "officer_defined_ethnicity",
+        "legislation",
+        "object_of_search",
+        "outcome",
+        "outcome_id",
+        "outcome_linked_to_object_of_search",
+        "removal_of_more_than_outer_clothing",
+        "operation",
+        "operation_name",
+        "latitude",
+        "longitude",
+        "street_id",
+        "street_name",
+    )
+
+    def __init__(self, record: Dict[str, Any]):
+        """
+        Initializes the StopAndSearchRecord from a stop and search dictionary.
+
+        Args:
+            record: A stop and search as returned by the stop and search endpoints.
+        """
+        location = record.get("location") or {}
+        street = location.get("street") or {}
+        outcome_object = record.get("outcome_object") or {}
+        self.type = _interned(record.get("type"))
+        self.datetime = record.get("datetime")
+        self.involved_person = record.get("involved_person")
+        self.age_range = _interned(record.get("age_range"))
+        self.gender = _interned(record.get("gender"))
+        self.self_defined_ethnicity = _interned(record.get("self_defined_ethnicity"))
+        self.officer_defined_ethnicity = _interned(
+            record.get("officer_defined_ethnicity")
+        )
+        self.legislation = _interned(record.get("legislation"))
+        self.object_of_search = _interned(record.get("object_of_search"))
+        self.outcome = _interned(record.get("outcome"))
+        self.outcome_id = _interned(outcome_object.get("id"))
+        self.outcome_linked_to_object_of_search = record.get(
+            "outcome_linked_to_object_of_search"
+        )
+        self.removal_of_more_than_outer_clothing = record.get(
+            "removal_of_more_than_outer_clothing"
+        )
+        self.operation = record.get("operation")
+        self.operation_name = _interned(record.get("operation_name"))
+        self.latitude = _coordinate(location.get("latitude"))
+        self.longitude = _coordinate(location.get("longitude"))
+        self.street_id = street.get("id")
+        self.street_name = _interned(street.get("name"))
+
+
+def crime_records(records: List[Dict[str, Any]]) -> List[CrimeRecord]:
+    """Converts crime dictionaries into CrimeRecords."""
+    return [CrimeRecord(record) for record in records]
+
+
+def stop_and_search_records(
+    records: List[Dict[str, Any]],
+) -> List[StopAndSearchRecord]:
+    """Converts stop and search dictionaries into StopAndSearchRecords."""
+    return [StopAndSearchRecord(record) for record in records]
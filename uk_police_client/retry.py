@@ -0,0 +1,230 @@
+"""
+    Retry policy for transient UK Police API failures
+"""
+
+import random
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, FrozenSet, Optional
+
+import httpx
+
+RETRYABLE_EXCEPTIONS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.ReadTimeout,
+    httpx.RemoteProtocolError,
+)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Decides whether a failed request is retried and how long to wait first.
+
+    Attributes:
+        max_attempts: Total number of attempts per request, including the first one.
+        backoff_factor: Base delay in seconds, doubled after every attempt.
+        max_backoff: Upper bound in seconds for a single backoff delay.
+        retry_statuses: HTTP status codes that are considered transient.
+        respect_retry_after: Whether to wait as long as a Retry-After header asks.
+        max_retry_after: Upper bound in seconds for a Retry-After wait.
+    """
+
+    max_attempts: int = 4
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Computes a jittered exponential backoff delay.
+
+        Args:
+            attempt: The number of the attempt that just failed, starting at 1.
+
+        Returns:
+            A delay in seconds drawn uniformly from [0, min(max_backoff, factor * 2 ** (attempt - 1))].
+        """
+        ceiling = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    def retry_after(self, response: httpx.Response) -> Optional[float]:
+        """
+        Parses the Retry-After header of a response.
+
+        Args:
+            response: The response to inspect.
+
+        Returns:
+            The requested delay in seconds, or None if the header is absent or invalid.
+        """
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                when = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                return None
+            delay = (when - datetime.now(timezone.utc)).total_seconds()
+        return min(max(delay, 0.0), self.max_retry_after)
+
+    def is_retryable(
+        self,
+        response: Optional[httpx.Response] = None,
+        exception: Optional[Exception] = None,
+    ) -> bool:
+        """
+        Checks whether the outcome of an attempt is a transient failure.
+
+        Args:
+            response: The response received, if any.
+            exception: The exception raised instead of a response, if any.
+
+        Returns:
+            True if the failure is worth retrying. The API's refusal of a custom
+            area matching too many records never is, as it would only be refused
+            again.
+        """
+        if exception is not None:
+            return isinstance(exception, RETRYABLE_EXCEPTIONS)
+        if response is None or is_over_limit(response):
+            return False
+        return response.status_code in self.retry_statuses
+
+    def next_delay(
+        self,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+        exception: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Decides what to do after an attempt.
+
+        Args:
+            attempt: The number of the attempt that just finished, starting at 1.
+            response: The response received, if any.
+            exception: The exception raised instead of a response, if any.
+
+        Returns:
+            The number of seconds to wait before retrying, or None if the request
+            should not be retried.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(response, exception):
+            return None
+        if response is not None and self.respect_retry_after:
+            delay = self.retry_after(response)
+            if delay is not None:
+                return delay
+        return self.backoff(attempt)
+
+    def schedule_retry(
+        self,
+        attempt: int,
+        stats: "RetryStats",
+        response: Optional[httpx.Response] = None,
+        exception: Optional[Exception] = None,
+    ) -> Optional[float]:
+        """
+        Decides what to do after an attempt and records the decision in `stats`.
+
+        Args:
+            attempt: The number of the attempt that just finished, starting at 1.
+            stats: Counters to update.
+            response: The response received, if any.
+            exception: The exception raised instead of a response, if any.
+
+        Returns:
+            The number of seconds to wait before retrying, or None if the request
+            should not be retried.
+        """
+        delay = self.next_delay(attempt, response, exception)
+        if delay is None:
+            if attempt > 1 and self.is_retryable(response, exception):
+                stats.record_exhausted()
+            return None
+        if exception is not None:
+            reason = type(exception).__name__
+        else:
+            reason = str(response.status_code)
+        stats.record_retry(reason, delay)
+        return delay
+
+
+def is_over_limit(response: httpx.Response) -> bool:
+    """
+    Checks whether a response is the API's refusal of a custom area matching more
+    than 10,000 crimes.
+
+    The API answers those with a bare 503, while outages and maintenance pages come
+    with a Retry-After header or an HTML body. Custom areas are sent either as a
+    POST or with a `poly` query parameter, so a bare 503 to any other request is
+    an outage too.
+
+    Args:
+        response: The response to inspect.
+
+    Returns:
+        True if the area should be split rather than the request retried.
+    """
+    if response.status_code != 503 or "Retry-After" in response.headers:
+        return False
+    if "html" in response.headers.get("Content-Type", ""):
+        return False
+    try:
+        request = response.request
+    except RuntimeError:
+        return True
+    return request.method == "POST" or "poly" in request.url.params
+
+
+@dataclass
+class RetryStats:
+    """
+    Thread-safe counters describing the retries performed by a client.
+
+    Attributes:
+        requests: Number of logical requests made.
+        retries: Number of additional attempts made because of transient failures.
+        retry_wait: Total seconds spent sleeping between attempts.
+        exhausted: Number of requests that failed after using every attempt.
+        reasons: Retry counts keyed by status code or exception name.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    retry_wait: float = 0.0
+    exhausted: int = 0
+    reasons: Dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_retry(self, reason: str, delay: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.retry_wait += delay
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+
+    def record_exhausted(self) -> None:
+        with self._lock:
+            self.exhausted += 1
+
+    def reset(self) -> None:
+        """Sets every counter back to zero."""
+        with self._lock:
+            self.requests = self.retries = self.exhausted = 0
+            self.retry_wait = 0.0
+            self.reasons = {}
@@ -0,0 +1,127 @@
+"""
+    Coalescing of identical concurrent requests
+"""
+
+import asyncio
+import copy
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """A request in flight, which callers arriving later wait for."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Lets concurrent callers asking for the same key share one call.
+
+    The first caller for a key runs the function; callers arriving while it is in
+    flight wait for it and receive a copy of its result (or its exception) instead
+    of sending their own request. Once the call completes the key is forgotten, so
+    later callers trigger a new call. If anyone joined, the first caller gets a
+    copy too, as followers copy the result after it has returned.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Calls `func`, unless a call for `key` is already in flight.
+
+        Args:
+            key: Identifies the request, e.g. its endpoint and parameters.
+            func: The function sending the request.
+
+        Returns:
+            The result of `func`; when callers joined an in-flight call, every
+            caller gets its own deep copy, so they never share mutable results.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                call.followers += 1
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        try:
+            call.result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        # Nobody can join once the key is gone, so the count is final.
+        return copy.deepcopy(call.result) if call.followers else call.result
+
+
+class AsyncSingleFlight:
+    """
+    Lets concurrent coroutines asking for the same key share one call.
+
+    Mirrors SingleFlight on an event loop. The call runs as its own task, so
+    cancelling the coroutine that started it does not cancel it for the others.
+    Followers copy the result when they resume, after the first coroutine may
+    have changed it, so that one gets a copy too if anyone joined.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+        self._followers: Dict[asyncio.Task, int] = {}
+        self.calls = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable]) -> Any:
+        """
+        Awaits `func()`, unless a call for `key` is already in flight.
+
+        Args:
+            key: Identifies the request, e.g. its endpoint and parameters.
+            func: The coroutine function sending the request.
+
+        Returns:
+            The result of `func()`; when coroutines joined an in-flight call, every
+            one of them gets its own deep copy.
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = asyncio.ensure_future(func())
+            task.add_done_callback(lambda _: self._forget(key, task))
+            self._followers[task] = 0
+            self.calls += 1
+            try:
+                result = await asyncio.shield(task)
+            finally:
+                followers = self._followers.pop(task)
+            # _forget ran before this coroutine resumed, so the count is final.
+            return copy.deepcopy(result) if followers else result
+        if task in self._followers:
+            self._followers[task] += 1
+        self.shared += 1
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every waiter was cancelled.
+            task.exception()
@@ -0,0 +1,346 @@
+"""
+    Local SQLite store of crimes, outcomes and stop and searches for analytical queries
+"""
+
+import math
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from uk_police_client.records import CrimeRecord, StopAndSearchRecord, _coordinate
+from uk_police_client.sync import SyncStore
+
+# Columns of each table, after its PARTITION_COLUMNS.
+COLUMNS = {
+    # The month of a crime is its partition's.
+    "crimes": tuple(name for name in CrimeRecord.__slots__ if name != "month"),
+    "outcomes": (
+        "crime_id",
+        "persistent_id",
+        "crime_category",
+        "category_code",
+        "category_name",
+        "date",
+        "person_id",
+        "latitude",
+        "longitude",
+        "street_id",
+        "street_name",
+    ),
+    "stops": StopAndSearchRecord.__slots__,
+}
+INDEXES = {
+    "crimes": [("category", "month"), ("outcome_category",), ("cell_row", "cell_col")],
+    "outcomes": [("category_code",), ("crime_id",), ("cell_row", "cell_col")],
+    "stops": [("object_of_search",), ("outcome",), ("cell_row", "cell_col")],
+}
+# Columns every table has in addition to its own.
+PARTITION_COLUMNS = ("force", "month", "cell_row", "cell_col")
+Bbox = Tuple[float, float, float, float]
+
+
+def _outcome_row(outcome: Dict[str, Any]) -> Tuple:
+    crime = outcome.get("crime") or {}
+    location = crime.get("location") or {}
+    street = location.get("street") or {}
+    category = outcome.get("category") or {}
+    return (
+        crime.get("id"),
+        crime.get("persistent_id"),
+        crime.get("category"),
+        category.get("code"),
+        category.get("name"),
+        outcome.get("date"),
+        outcome.get("person_id"),
+        _coordinate(location.get("latitude")),
+        _coordinate(location.get("longitude")),
+        street.get("id"),
+        street.get("name"),
+    )
+
+
+def _check_columns(dataset: str, columns: Sequence[str] = ()) -> None:
+    """Rejects unknown datasets and names that are not columns of their table."""
+    if dataset not in COLUMNS:
+        raise ValueError(
+            f"Unknown dataset {dataset!r}; expected one of {list(COLUMNS)}."
+        )
+    for column in columns:
+        if column not in PARTITION_COLUMNS and column not in COLUMNS[dataset]:
+            raise ValueError(f"Unknown {dataset} column {column!r}.")
+
+
+def _record_row(record_class, columns: Sequence[str]):
+    def row(record: Dict[str, Any]) -> Tuple:
+        converted = record_class(record)
+        return tuple(getattr(converted, name) for name in columns)
+
+    return row
+
+
+ROWS = {
+    "crimes": _record_row(CrimeRecord, COLUMNS["crimes"]),
+    "outcomes": _outcome_row,
+    "stops": _record_row(StopAndSearchRecord, COLUMNS["stops"]),
+}
+
+
+class SQLiteStore(SyncStore):
+    """
+    Crimes, outcomes and stop and searches flattened into indexed SQLite tables.
+
+    Every table is partitioned by force and month: writing a partition replaces its
+    rows in one transaction, and a (force, month) index finds them. Rows are also
+    indexed by a lat/lng grid cell and by category or outcome, so aggregate
+    queries for dashboards are answered locally in milliseconds.
+
+    Fill it with a SyncEngine (`SyncEngine(client, SQLiteStore(path))`, whose
+    `backfill()` loads past months), or with `write()` for records fetched by other
+    means.
+    """
+
+    def __init__(self, path: str = "uk_police.sqlite", cell_size: float = 0.01):
+        """
+        Initializes the SQLiteStore, creating the database if needed.
+
+        Args:
+            path: Location of the SQLite database file, or ":memory:".
+            cell_size: Size of the grid cells in degrees, defaults to 0.01 (about
+                1km). Only applies to a new database.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        if path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS partitions ("
+                " dataset TEXT, force TEXT, month TEXT, records INTEGER,"
+                " written_at REAL, PRIMARY KEY (dataset, force, month))"
+            )
+            for table, columns in COLUMNS.items():
+                self._db.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ("
+                    " force TEXT NOT NULL, month TEXT NOT NULL,"
+                    " cell_row INTEGER, cell_col INTEGER, " + ", ".join(columns) + ")"
+                )
+                self._db.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_partition"
+                    f" ON {table} (force, month)"
+                )
+                for index in INDEXES[table]:
+                    self._db.execute(
+                        f"CREATE INDEX IF NOT EXISTS {table}_{'_'.join(index)}"
+                        f" ON {table} ({', '.join(index)})"
+                    )
+            self._db.execute(
+                "INSERT OR IGNORE INTO state VALUES ('cell_size', ?)", (str(cell_size),)
+            )
+        self.cell_size = float(self._state("cell_size"))
+
+    def _state(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM state WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def watermark(self) -> Optional[str]:
+        return self._state("watermark")
+
+    def set_watermark(self, month: str) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO state VALUES ('watermark', ?)", (month,)
+            )
+
+    def write(
+        self, dataset: str, force: str, month: str, records: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Stores a partition, replacing any previous version.
+
+        Args:
+            dataset: "crimes", "outcomes" or "stops".
+            force: The force ID.
+            month: The month in YYYY-MM format.
+            records: The records as returned by the API.
+        """
+        _check_columns(dataset)
+        columns = COLUMNS[dataset]
+        latitude = columns.index("latitude")
+        row = ROWS[dataset]
+        rows = []
+        for record in records:
+            values = row(record)
+            lat, lng = values[latitude], values[latitude + 1]
+            cell = (None, None) if lat is None else self.cell(lat, lng)
+            rows.append((force, month) + cell + values)
+        placeholders = ", ".join("?" * (len(columns) + 4))
+        with self._lock, self._db:
+            self._db.execute(
+                f"DELETE FROM {dataset} WHERE force = ? AND month = ?", (force, month)
+            )
+            self._db.executemany(f"INSERT INTO {dataset} VALUES ({placeholders})", rows)
+            self._db.execute(
+                "INSERT OR REPLACE INTO partitions VALUES (?, ?, ?, ?, ?)",
+                (dataset, force, month, len(rows), time.time()),
+            )
+
+    def cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        """
+        Returns the grid cell of a point.
+
+        Args:
+            lat: Latitude.
+            lng: Longitude.
+
+        Returns:
+            The (row, column) of the cell.
+        """
+        return math.floor(lat / self.cell_size), math.floor(lng / self.cell_size)
+
+    def partitions(self, dataset: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Lists the stored partitions.
+
+        Args:
+            dataset: Optional dataset to restrict the list to.
+
+        Returns:
+            Dictionaries with the dataset, force, month, number of records and the
+            time the partition was written.
+        """
+        if dataset is not None:
+            _check_columns(dataset)
+        sql = "SELECT * FROM partitions"
+        params: Tuple = ()
+        if dataset is not None:
+            sql += " WHERE dataset = ?"
+            params = (dataset,)
+        with self._lock:
+            rows = self._db.execute(sql + " ORDER BY dataset, force, month", params)
+            return [dict(row) for row in rows]
+
+    def _where(
+        self,
+        dataset: str,
+        bbox: Optional[Bbox],
+        start: Optional[str],
+        end: Optional[str],
+        equals: Dict[str, Any],
+    ) -> Tuple[str, List[Any]]:
+        """Builds the WHERE clause of a query and its parameters."""
+        _check_columns(dataset, equals)
+        clauses, params = [], []
+        for column, value in equals.items():
+            if isinstance(value, (list, tuple, set, frozenset)):
+                value = list(value)
+                clauses.append(f"{column} IN ({', '.join('?' * len(value))})")
+                params += value
+            elif value is None:
+                clauses.append(f"{column} IS NULL")
+            else:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if start is not None:
+            clauses.append("month >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("month <= ?")
+            params.append(end)
+        if bbox is not None:
+            min_lat, min_lng, max_lat, max_lng = bbox
+            min_row, min_col = self.cell(min_lat, min_lng)
+            max_row, max_col = self.cell(max_lat, max_lng)
+            clauses.append(
+                "cell_row BETWEEN ? AND ? AND cell_col BETWEEN ? AND ?"
+                " AND latitude BETWEEN ? AND ? AND longitude BETWEEN ? AND ?"
+            )
+            params += [min_row, max_row, min_col, max_col]
+            params += [min_lat, max_lat, min_lng, max_lng]
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, params
+
+    def query(
+        self,
+        dataset: str,
+        columns: Optional[Sequence[str]] = None,
+        bbox: Optional[Bbox] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        **equals: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Reads stored rows.
+
+        Args:
+            dataset: "crimes", "outcomes" or "stops".
+            columns: Optional columns to return, defaults to all of them.
+            bbox: Optional (min_lat, min_lng, max_lat, max_lng) box rows must fall in.
+            start: Optional first month, in YYYY-MM format.
+            end: Optional last month, in YYYY-MM format.
+            limit: Optional maximum number of rows.
+            **equals: Column filters, e.g. force="leicestershire",
+                category=["burglary", "robbery"] or outcome_category=None.
+
+        Returns:
+            The matching rows as flat dictionaries.
+        """
+        where, params = self._where(dataset, bbox, start, end, equals)
+        selected = "*"
+        if columns is not None:
+            _check_columns(dataset, columns)
+            selected = ", ".join(columns)
+        sql = f"SELECT {selected} FROM {dataset}{where}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            return [dict(row) for row in self._db.execute(sql, params)]
+
+    def count(
+        self,
+        dataset: str,
+        by: Sequence[str] = (),
+        bbox: Optional[Bbox] = None,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        **equals: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Counts stored rows, optionally grouped.
+
+        Args:
+            dataset: "crimes", "outcomes" or "stops".
+            by: Columns to group by, e.g. ["month", "category"], or
+                ["cell_row", "cell_col"] for a grid heatmap.
+            bbox: Optional (min_lat, min_lng, max_lat, max_lng) box rows must fall in.
+            start: Optional first month, in YYYY-MM format.
+            end: Optional last month, in YYYY-MM format.
+            **equals: Column filters, as for `query`.
+
+        Returns:
+            One dictionary per group, with the grouped columns and a 'count', largest
+            groups first.
+        """
+        where, params = self._where(dataset, bbox, start, end, equals)
+        _check_columns(dataset, by)
+        grouped = ", ".join(by)
+        sql = f"SELECT {grouped + ', ' if by else ''}COUNT(*) AS count FROM {dataset}"
+        sql += where
+        if by:
+            sql += f" GROUP BY {grouped} ORDER BY count DESC, {grouped}"
+        with self._lock:
+            return [dict(row) for row in self._db.execute(sql, params)]
+
+    def close(self) -> None:
+        """Closes the database."""
+        self._db.close()
@@ -0,0 +1,118 @@
+"""
+    Incremental parsing of JSON array responses
+"""
+
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator
+
+_decoder = json.JSONDecoder()
+_skip_whitespace = re.compile(r"[ \t\n\r]*").match
+
+
+class _ArrayParser:
+    """
+    Incremental parser for a JSON array that is fed text in arbitrary pieces.
+
+    Only the element currently being received is kept in memory, so parsing a
+    response of any size needs memory proportional to its largest record.
+    """
+
+    def __init__(self):
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+        self._scalar = False
+
+    def feed(self, chunk: bytes, final: bool = False) -> Iterator[Any]:
+        """
+        Adds a chunk of the body and yields every element it completes.
+
+        Args:
+            chunk: The next bytes of the response body.
+            final: Whether this is the last chunk of the body.
+
+        Yields:
+            The decoded array elements, in order. A body that is not an array is
+            yielded as a single value.
+        """
+        buffer = self._buffer + self._text.decode(chunk, final)
+        pos = 0
+        while True:
+            pos = _skip_whitespace(buffer, pos).end()
+            if pos == len(buffer) or self._scalar:
+                break
+            char = buffer[pos]
+            if self._finished:
+                raise ValueError("Unexpected data after the end of the JSON array.")
+            if not self._started:
+                if char != "[":
+                    self._scalar = True
+                    break
+                self._started = True
+                pos += 1
+            elif char == "]":
+                self._finished = True
+                pos += 1
+            elif char == ",":
+                pos += 1
+            else:
+                try:
+                    value, end = _decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break
+                if (
+                    not final
+                    and not isinstance(value, (dict, list, str))
+                    and (end == len(buffer) or buffer[end] not in ",] \t\n\r")
+                ):
+                    # A number may continue in the next chunk, e.g. "2" then ".5".
+                    break
+                pos = end
+                yield value
+        self._buffer = buffer[pos:]
+
+        if final:
+            if self._scalar:
+                yield json.loads(self._buffer)
+            elif not self._finished:
+                raise ValueError("Truncated JSON array.")
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Parses a JSON array from a stream of byte chunks, one element at a time.
+
+    Args:
+        chunks: The response body, e.g. httpx.Response.iter_bytes().
+
+    Yields:
+        The decoded array elements, in order.
+    """
+    parser = _ArrayParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.feed(b"", final=True)
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """
+    Parses a JSON array from an asynchronous stream of byte chunks, one element at
+    a time.
+
+    Args:
+        chunks: The response body, e.g. httpx.Response.aiter_bytes().
+
+    Yields:
+        The decoded array elements, in order.
+    """
+    parser = _ArrayParser()
+    async for chunk in chunks:
+        for value in parser.feed(chunk):
+            yield value
+    for value in parser.feed(b"", final=True):
+        yield value
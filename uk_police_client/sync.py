@@ -0,0 +1,408 @@
+"""
+    Incremental synchronisation of newly published months to a local store
+"""
+
+import gzip
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from uk_police_client.geometry import boundary_poly
+from uk_police_client.utils import month_range
+
+DATASETS = ("crimes", "outcomes", "stops")
+
+
+def shift_month(month: str, months: int) -> str:
+    """
+    Moves a month forwards or backwards.
+
+    Args:
+        month: A month in YYYY-MM format.
+        months: Number of months to move by, negative to go back.
+
+    Returns:
+        The resulting month in YYYY-MM format.
+    """
+    year, number = map(int, month[:7].split("-"))
+    index = year * 12 + number - 1 + months
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+class SyncStore(ABC):
+    """
+    Where a SyncEngine persists partitions and its watermark.
+
+    A partition holds every record of one dataset, force and month; writing a
+    partition replaces any previous version of it. Subclass it and implement every
+    method to sync into another store.
+    """
+
+    @abstractmethod
+    def watermark(self) -> Optional[str]:
+        """The latest published month fully synced, or None before the first sync."""
+
+    @abstractmethod
+    def set_watermark(self, month: str) -> None:
+        """Records the latest published month fully synced."""
+
+    @abstractmethod
+    def write(
+        self, dataset: str, force: str, month: str, records: List[Dict[str, Any]]
+    ) -> None:
+        """Stores a partition, replacing any previous version."""
+
+
+class DirectoryStore(SyncStore):
+    """
+    Stores partitions as gzip-compressed JSON files, at
+    `<path>/<dataset>/<force>/<month>.json.gz`, and the watermark in
+    `<path>/state.json`.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes the DirectoryStore, creating the directory if needed.
+
+        Args:
+            path: Directory of the store.
+        """
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def _state_path(self) -> str:
+        return os.path.join(self.path, "state.json")
+
+    def _partition_path(self, dataset: str, force: str, month: str) -> str:
+        return os.path.join(self.path, dataset, force, f"{month}.json.gz")
+
+    def watermark(self) -> Optional[str]:
+        if not os.path.exists(self._state_path()):
+            return None
+        with open(self._state_path()) as file:
+            return json.load(file).get("watermark")
+
+    def set_watermark(self, month: str) -> None:
+        _replace(self._state_path(), json.dumps({"watermark": month}).encode())
+
+    def write(
+        self, dataset: str, force: str, month: str, records: List[Dict[str, Any]]
+    ) -> None:
+        path = self._partition_path(dataset, force, month)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _replace(path, gzip.compress(json.dumps(records).encode()))
+
+    def read(self, dataset: str, force: str, month: str) -> List[Dict[str, Any]]:
+        """
+        Reads a partition.
+
+        Args:
+            dataset: "crimes", "outcomes" or "stops".
+            force: The force ID.
+            month: The month in YYYY-MM format.
+
+        Returns:
+            The records of the partition.
+        """
+        with gzip.open(self._partition_path(dataset, force, month), "rt") as file:
+            return json.load(file)
+
+
+def _replace(path: str, data: bytes) -> None:
+    """Writes a file atomically, so readers never see a partial partition."""
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        file.write(data)
+    os.replace(temporary, path)
+
+
+@dataclass
+class SyncReport:
+    """
+    Outcome of a SyncEngine run.
+
+    Attributes:
+        published: The latest published month reported by the API.
+        previous: The watermark before the run.
+        months: The months fetched, oldest first; empty if nothing was published.
+        partitions: Number of (dataset, force, month) partitions written.
+        records: Number of records written.
+    """
+
+    published: str
+    previous: Optional[str]
+    months: List[str] = field(default_factory=list)
+    partitions: int = 0
+    records: int = 0
+
+
+class SyncEngine:
+    """
+    Fetches only what the API published since the last run.
+
+    Each run polls the date of the latest data release and compares it with the
+    store's watermark. When it has advanced, the newly published months (and,
+    optionally, the previously synced month, which the API sometimes revises) are
+    fetched for every force and dataset and written to the store, then the
+    watermark moves forward. A run that fails part-way leaves the watermark where
+    it was, so the next run fetches the same months again.
+
+    Street-level crimes and outcomes have no per-force endpoint, so they are
+    fetched per neighbourhood with a simplified boundary polygon, deduplicated
+    and combined with the force's crimes with no location. Every record returned
+    for those polygons is kept, including those in gaps between neighbourhoods;
+    as the polygons cover their neighbourhoods with a small margin, records right
+    next to the force's boundary can also appear in a neighbouring force.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        store: SyncStore,
+        forces: Optional[Iterable[str]] = None,
+        datasets: Iterable[str] = DATASETS,
+        refetch_previous: bool = True,
+        initial_months: int = 1,
+        tolerance: float = 0.0005,
+    ):
+        """
+        Initializes the SyncEngine.
+
+        Args:
+            client: A UKPoliceClient with the default "dict" output; its cache,
+                rate limiter and max_workers apply.
+            store: Where partitions and the watermark are kept.
+            forces: Force IDs to sync, or None for every force.
+            datasets: Any of "crimes", "outcomes" and "stops", defaults to all three.
+            refetch_previous: Whether to fetch the last synced month again,
+                defaults to True.
+            initial_months: Number of months fetched by the first run, defaults to 1.
+            tolerance: Simplification tolerance of neighbourhood polygons in
+                degrees, defaults to 0.0005.
+        """
+        unknown = set(datasets) - set(DATASETS)
+        if unknown:
+            raise ValueError(
+                f"Unknown datasets {sorted(unknown)}; expected {DATASETS}."
+            )
+        if client.output != "dict":
+            raise ValueError(
+                f"SyncEngine stores JSON records; expected a client with "
+                f"output='dict', got {client.output!r}."
+            )
+        self.client = client
+        self.store = store
+        self.forces = None if forces is None else list(forces)
+        self.datasets = list(datasets)
+        self.refetch_previous = refetch_previous
+        self.initial_months = initial_months
+        self.tolerance = tolerance
+        self._polys: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    def published_month(self) -> str:
+        """The latest month published by the API, in YYYY-MM format."""
+        return self.client.get_last_updated_date()["date"][:7]
+
+    def pending_months(
+        self, published: str, watermark: Optional[str] = None
+    ) -> List[str]:
+        """
+        Lists the months a run should fetch.
+
+        Args:
+            published: The latest published month.
+            watermark: The latest month already synced, or None.
+
+        Returns:
+            The months to fetch, oldest first.
+        """
+        if watermark is None:
+            return month_range(
+                shift_month(published, 1 - self.initial_months), published
+            )
+        if watermark >= published:
+            return []
+        first = watermark if self.refetch_previous else shift_month(watermark, 1)
+        return month_range(first, published)
+
+    def run(self) -> SyncReport:
+        """
+        Syncs the store with the API.
+
+        Returns:
+            A SyncReport describing what was fetched.
+        """
+        published = self.published_month()
+        previous = self.store.watermark()
+        report = SyncReport(
+            published, previous, self.pending_months(published, previous)
+        )
+        if report.months:
+            self._fetch_months(report)
+            self.store.set_watermark(published)
+        return report
+
+    def backfill(
+        self, start: Union[str, datetime], end: Union[str, datetime]
+    ) -> SyncReport:
+        """
+        Fetches every month in a range into the store, e.g. history older than the
+        first run, without moving the watermark.
+
+        Args:
+            start: First month, in any format accepted by utils.format_date.
+            end: Last month, in any format accepted by utils.format_date.
+
+        Returns:
+            A SyncReport describing what was fetched.
+        """
+        report = SyncReport(
+            self.published_month(), self.store.watermark(), month_range(start, end)
+        )
+        self._fetch_months(report)
+        return report
+
+    def _fetch_months(self, report: SyncReport) -> None:
+        """Fetches and stores every partition of the report's months."""
+        partitions = [
+            (dataset, force, month)
+            for dataset in self.datasets
+            for force in self.client.force_ids(self.forces)
+            for month in report.months
+        ]
+        for (dataset, force, month), records in self.client.imap_unordered(
+            lambda partition: self.fetch(*partition), partitions
+        ):
+            self.store.write(dataset, force, month, records)
+            report.partitions += 1
+            report.records += len(records)
+
+    def fetch(self, dataset: str, force: str, month: str) -> List[Dict[str, Any]]:
+        """
+        Fetches one partition.
+
+        Args:
+            dataset: "crimes", "outcomes" or "stops".
+            force: The force ID.
+            month: The month in YYYY-MM format.
+
+        Returns:
+            The raw records of the partition, as returned by the API.
+        """
+        if dataset == "stops":
+            return self.client.get_records(
+                "/stops-force", {"force": force, "date": month}
+            )
+        if dataset == "crimes":
+            crimes = self._sweep(force, month, "/crimes-street/all-crime", _crime_key)
+            crimes += self.client.get_records(
+                "/crimes-no-location",
+                {"category": "all-crime", "force": force, "date": month},
+            )
+            return _unique(crimes, _crime_key)
+        outcomes = self._sweep(force, month, "/outcomes-at-location", _outcome_key)
+        return _unique(outcomes, _outcome_key)
+
+    def _sweep(
+        self, force: str, month: str, endpoint: str, key: Callable
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetches the records of every neighbourhood of a force, splitting polygons
+        the API refuses for matching too many records.
+        """
+        results = self.client.map(
+            lambda poly: self.client.get_records(
+                endpoint, {"date": month, "poly": poly}, subdivide=True, key=key
+            ),
+            self._force_polys(force),
+        )
+        return [record for records in results for record in records]
+
+    def _force_polys(self, force: str) -> List[str]:
+        """
+        Returns the simplified polygon of every neighbourhood of a force, fetching
+        the boundaries once per engine.
+        """
+        with self._lock:
+            polys = self._polys.get(force)
+        if polys is not None:
+            return polys
+        polys = [
+            boundary_poly(points, self.tolerance)
+            for _, _, points in self.client.fetch_boundaries([force])
+            if len(points) >= 3
+        ]
+        with self._lock:
+            self._polys[force] = polys
+        return polys
+
+
+def _crime_key(crime: Dict[str, Any]) -> Any:
+    """Identity of a crime."""
+    return crime["id"]
+
+
+def _outcome_key(outcome: Dict[str, Any]) -> Any:
+    """Identity of an outcome, which has no ID of its own."""
+    return (
+        (outcome.get("crime") or {}).get("id"),
+        (outcome.get("category") or {}).get("code"),
+        outcome.get("date"),
+        outcome.get("person_id"),
+    )
+
+
+def _unique(records: List[Dict[str, Any]], key) -> List[Dict[str, Any]]:
+    """Drops records whose key was already seen, keeping the first one."""
+    seen = set()
+    unique = []
+    for record in records:
+        identity = key(record)
+        if identity not in seen:
+            seen.add(identity)
+            unique.append(record)
+    return unique
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Syncs newly published months into a local store."""
+    import argparse
+
+    from uk_police_client.clients import UKPoliceClient
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("path", help="directory of the store")
+    parser.add_argument("forces", nargs="*", help="force IDs, defaults to all forces")
+    parser.add_argument(
+        "--datasets", nargs="+", default=list(DATASETS), choices=DATASETS
+    )
+    parser.add_argument("--no-refetch-previous", action="store_true")
+    parser.add_argument("--initial-months", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=8, help="concurrent requests")
+    args = parser.parse_args(argv)
+
+    engine = SyncEngine(
+        UKPoliceClient(max_workers=args.workers),
+        DirectoryStore(args.path),
+        forces=args.forces or None,
+        datasets=args.datasets,
+        refetch_previous=not args.no_refetch_previous,
+        initial_months=args.initial_months,
+    )
+    report = engine.run()
+    if report.months:
+        print(
+            f"Synced {', '.join(report.months)}: {report.partitions} partitions, "
+            f"{report.records} records"
+        )
+    else:
+        print(f"Up to date with {report.published}")
+
+
+if __name__ == "__main__":
+    main()
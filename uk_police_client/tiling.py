@@ -0,0 +1,389 @@
+"""
+    Tiling planner for sweeping street-level crimes over large areas
+"""
+
+import json
+import math
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from uk_police_client.clients.base_client import _merge_records
+from uk_police_client.geometry import Point, bounding_box, clip_to_box, format_poly
+from uk_police_client.neighbourhood_index import NeighbourhoodIndex
+
+FORMAT_VERSION = 1
+Bbox = Tuple[float, float, float, float]
+ENGLAND_AND_WALES: Bbox = (49.85, -6.45, 55.85, 1.8)
+
+
+class DensityGrid:
+    """
+    Average number of street-level crimes per month in a grid of `cell_size` degree
+    cells, learned from previous sweeps so the next one can be tiled to match.
+
+    Every call to `add` counts as one month, so feed it one month of the same area
+    at a time, as TilePlanner.sweep does.
+    """
+
+    def __init__(self, cell_size: float = 0.02):
+        """
+        Initializes an empty DensityGrid.
+
+        Args:
+            cell_size: Size of the grid cells in degrees, defaults to 0.02 (about
+                2km).
+        """
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive.")
+        self.cell_size = cell_size
+        self.months = 0
+        self._counts: Dict[Tuple[int, int], int] = {}
+
+    def __bool__(self) -> bool:
+        return self.months > 0
+
+    def add(self, crimes: Iterable[Any]) -> None:
+        """
+        Counts one month of crimes.
+
+        Args:
+            crimes: Crimes as dictionaries returned by the API, or CrimeRecords.
+                Crimes without a location are ignored.
+        """
+        for crime in crimes:
+            if isinstance(crime, dict):
+                location = crime.get("location") or {}
+                lat, lng = location.get("latitude"), location.get("longitude")
+            else:
+                lat, lng = crime.latitude, crime.longitude
+            if lat in (None, "") or lng in (None, ""):
+                continue
+            cell = (
+                math.floor(float(lat) / self.cell_size),
+                math.floor(float(lng) / self.cell_size),
+            )
+            self._counts[cell] = self._counts.get(cell, 0) + 1
+        self.months += 1
+
+    def points(self, box: Bbox) -> List[Tuple[float, float, float]]:
+        """
+        Lists the cells whose centre falls in a box.
+
+        Args:
+            box: A (min_lat, min_lng, max_lat, max_lng) tuple.
+
+        Returns:
+            (latitude, longitude, crimes per month) tuples for the centre of every
+            non-empty cell.
+        """
+        min_lat, min_lng, max_lat, max_lng = box
+        points = []
+        for (row, col), count in self._counts.items():
+            lat = (row + 0.5) * self.cell_size
+            lng = (col + 0.5) * self.cell_size
+            if min_lat <= lat <= max_lat and min_lng <= lng <= max_lng:
+                points.append((lat, lng, count / self.months))
+        return points
+
+    def save(self, path: str) -> None:
+        """
+        Writes the grid to a file.
+
+        Args:
+            path: Path of the file, which is overwritten.
+        """
+        payload = {
+            "version": FORMAT_VERSION,
+            "cell_size": self.cell_size,
+            "months": self.months,
+            "counts": [[row, col, count] for (row, col), count in self._counts.items()],
+        }
+        with open(path, "wb") as file:
+            file.write(zlib.compress(json.dumps(payload).encode()))
+
+    @classmethod
+    def load(cls, path: str) -> "DensityGrid":
+        """
+        Reads a grid written by `save`.
+
+        Args:
+            path: Path of the file.
+
+        Returns:
+            The DensityGrid.
+        """
+        with open(path, "rb") as file:
+            payload = json.loads(zlib.decompress(file.read()))
+        if payload.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported density grid file: {path}")
+        grid = cls(payload["cell_size"])
+        grid.months = payload["months"]
+        grid._counts = {(row, col): count for row, col, count in payload["counts"]}
+        return grid
+
+
+def plan_tiles(
+    box: Bbox,
+    density: Optional[DensityGrid] = None,
+    target: float = 8_000,
+    tile_size: float = 0.25,
+    min_size: float = 0.01,
+) -> List[Bbox]:
+    """
+    Splits a box into tiles that should each hold at most `target` crimes.
+
+    With a density grid, the box is cut recursively at the median of the expected
+    crimes along its longer side (a k-d tree), so sparse areas end up in a few large
+    tiles and dense cities in many small ones. Without one, it is cut into a uniform
+    grid of `tile_size` degree tiles.
+
+    Args:
+        box: A (min_lat, min_lng, max_lat, max_lng) tuple.
+        density: Optional DensityGrid learned from previous months.
+        target: Expected crimes per tile to aim for, defaults to 8,000, leaving room
+            below the API's 10,000 limit for month-to-month variation.
+        tile_size: Size of the tiles in degrees when there is no density grid.
+        min_size: Smallest tile side in degrees.
+
+    Returns:
+        The tiles, as (min_lat, min_lng, max_lat, max_lng) tuples.
+    """
+    min_lat, min_lng, max_lat, max_lng = box
+    if not density:
+        rows = max(1, math.ceil((max_lat - min_lat) / tile_size))
+        cols = max(1, math.ceil((max_lng - min_lng) / tile_size))
+        height = (max_lat - min_lat) / rows
+        width = (max_lng - min_lng) / cols
+        return [
+            (
+                min_lat + row * height,
+                min_lng + col * width,
+                min_lat + (row + 1) * height,
+                min_lng + (col + 1) * width,
+            )
+            for row in range(rows)
+            for col in range(cols)
+        ]
+
+    tiles: List[Bbox] = []
+    pending = [(box, density.points(box))]
+    while pending:
+        tile, points = pending.pop()
+        low_lat, low_lng, high_lat, high_lng = tile
+        # Compare sides in distance, a degree of longitude being shorter.
+        height = high_lat - low_lat
+        width = (high_lng - low_lng) * math.cos(math.radians((low_lat + high_lat) / 2))
+        axis = 0 if height >= width else 1
+        low, high = tile[axis], tile[axis + 2]
+        if sum(point[2] for point in points) <= target or high - low < 2 * min_size:
+            tiles.append(tile)
+            continue
+        points.sort(key=lambda point: point[axis])
+        half = sum(point[2] for point in points) / 2
+        running = 0.0
+        for point in points:
+            running += point[2]
+            if running >= half:
+                break
+        # Cut at the edge of the median cell, but never closer than min_size to
+        # the sides of the tile.
+        cut = point[axis] + density.cell_size / 2
+        cut = min(max(cut, low + min_size), high - min_size)
+        below, above = list(tile), list(tile)
+        below[axis + 2] = above[axis] = cut
+        pending.append((tuple(below), [point for point in points if point[axis] < cut]))
+        pending.append(
+            (tuple(above), [point for point in points if point[axis] >= cut])
+        )
+    return tiles
+
+
+def _box_poly(box: Bbox) -> List[Point]:
+    min_lat, min_lng, max_lat, max_lng = box
+    return [
+        (min_lat, min_lng),
+        (min_lat, max_lng),
+        (max_lat, max_lng),
+        (max_lat, min_lng),
+    ]
+
+
+def _overlaps(a: Bbox, b: Bbox) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+class TilePlanner:
+    """
+    Covers large areas, up to the whole of England and Wales, with as few
+    street-level crime requests as possible.
+
+    The area is tiled with `poly` queries sized by a DensityGrid of previous months
+    (see plan_tiles), the tiles are requested concurrently on the client's thread
+    pool, any tile still refused for holding too many crimes is split into
+    quadrants, and crimes on the border between tiles are only returned once.
+    Every sweep adds its crimes to the density grid, so the first sweep uses a
+    uniform grid and the following ones adapt to where crimes are. Given the
+    neighbourhood boundaries, tiles overlapping none of them, such as those out at
+    sea, are not requested at all.
+    """
+
+    def __init__(
+        self,
+        density: Optional[DensityGrid] = None,
+        target: float = 8_000,
+        tile_size: float = 0.25,
+        min_size: float = 0.01,
+        neighbourhoods: Optional[NeighbourhoodIndex] = None,
+    ):
+        """
+        Initializes the TilePlanner.
+
+        Args:
+            density: Optional DensityGrid learned from previous months, e.g. one
+                loaded with DensityGrid.load; defaults to a new empty grid.
+            target: Expected crimes per tile to aim for, defaults to 8,000.
+            tile_size: Size of the tiles in degrees until the grid has learned
+                anything, defaults to 0.25.
+            min_size: Smallest tile side in degrees, defaults to 0.01.
+            neighbourhoods: Optional NeighbourhoodIndex of the neighbourhoods to
+                cover, e.g. one built with NeighbourhoodIndex.from_boundaries from a
+                BoundaryStore; tiles overlapping none of them are skipped. Defaults
+                to the boundary store of the client passed to `sweep`, if any.
+        """
+        self.density = density if density is not None else DensityGrid()
+        self.target = target
+        self.tile_size = tile_size
+        self.min_size = min_size
+        self.neighbourhoods = neighbourhoods
+
+    def plan(
+        self,
+        area: Union[Bbox, List[Point]] = ENGLAND_AND_WALES,
+        neighbourhoods: Optional[NeighbourhoodIndex] = None,
+    ) -> List[str]:
+        """
+        Plans the `poly` queries covering an area.
+
+        Args:
+            area: A (min_lat, min_lng, max_lat, max_lng) box, or a polygon as a list
+                of (latitude, longitude) tuples. Defaults to England and Wales.
+            neighbourhoods: Optional NeighbourhoodIndex used instead of the
+                planner's own.
+
+        Returns:
+            The `poly` parameter of every query, leaving out tiles that overlap no
+            neighbourhood when a neighbourhood index is available.
+        """
+        if neighbourhoods is None:
+            neighbourhoods = self.neighbourhoods
+        is_box = isinstance(area[0], (int, float))
+        tiles = plan_tiles(
+            area if is_box else bounding_box(area),
+            self.density,
+            self.target,
+            self.tile_size,
+            self.min_size,
+        )
+        if neighbourhoods is not None:
+            tiles = [tile for tile in tiles if neighbourhoods.overlaps(tile)]
+        if is_box:
+            return [format_poly(_box_poly(tile)) for tile in tiles]
+        parts = (clip_to_box(area, *tile) for tile in tiles)
+        return [format_poly(part) for part in parts if part]
+
+    def sweep(
+        self,
+        client: Any,
+        area: Union[Bbox, List[Point]] = ENGLAND_AND_WALES,
+        date: Optional[str] = None,
+    ) -> Any:
+        """
+        Retrieves every street-level crime in an area.
+
+        Args:
+            client: A CrimesClient or UKPoliceClient; its rate limiter, retries and
+                max_workers apply. Without a neighbourhood index, the planner builds
+                one for this sweep from its boundary_store, if it has one.
+            area: A (min_lat, min_lng, max_lat, max_lng) box, or a polygon as a list
+                of (latitude, longitude) tuples. Defaults to England and Wales.
+            date: Optional month in YYYY-MM format, defaults to the latest month.
+
+        Returns:
+            The crimes in the client's output format, each one once.
+        """
+        neighbourhoods = self.neighbourhoods
+        store = getattr(client, "boundary_store", None)
+        if neighbourhoods is None and store is not None:
+            neighbourhoods = NeighbourhoodIndex.from_boundaries(store.items())
+        crimes = self._fetch(client, self.plan(area, neighbourhoods), date)
+        self.density.add(crimes)
+        return client.decode(crimes, "crime")
+
+    def sweep_force(self, client: Any, force: str, date: Optional[str] = None) -> Any:
+        """
+        Retrieves every street-level crime located in a force's neighbourhoods.
+
+        The bounding box of the force is tiled, skipping tiles that overlap none of
+        its neighbourhoods, and crimes are kept if they fall inside one of them.
+
+        Args:
+            client: A UKPoliceClient; its boundary store, rate limiter, retries and
+                max_workers apply.
+            force: The force ID.
+            date: Optional month in YYYY-MM format, defaults to the latest month.
+
+        Returns:
+            The crimes in the client's output format, each one once.
+        """
+        boundaries = [
+            boundary
+            for boundary in client.fetch_boundaries([force])
+            if len(boundary[2]) >= 3
+        ]
+        if not boundaries:
+            return client.decode([], "crime")
+        boxes = [bounding_box(points) for _, _, points in boundaries]
+        area = (
+            min(box[0] for box in boxes),
+            min(box[1] for box in boxes),
+            max(box[2] for box in boxes),
+            max(box[3] for box in boxes),
+        )
+        tiles = plan_tiles(
+            area, self.density, self.target, self.tile_size, self.min_size
+        )
+        polys = [
+            format_poly(_box_poly(tile))
+            for tile in tiles
+            if any(_overlaps(tile, box) for box in boxes)
+        ]
+        crimes = self._fetch(client, polys, date)
+        self.density.add(crimes)
+        index = NeighbourhoodIndex.from_boundaries(boundaries)
+
+        def located(crime):
+            location = crime.get("location") or {}
+            if location.get("latitude") is None or location.get("longitude") is None:
+                return False
+            point = (float(location["latitude"]), float(location["longitude"]))
+            return index.locate(point) is not None
+
+        return client.decode(list(filter(located, crimes)), "crime")
+
+    @staticmethod
+    def _fetch(
+        client: Any, polys: List[str], date: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Requests every tile concurrently and merges the crimes by ID."""
+        results = client.map(
+            lambda poly: client.get_records(
+                "/crimes-street/all-crime",
+                {"date": date, "poly": poly},
+                subdivide=True,
+            ),
+            polys,
+        )
+        merged: Dict[Any, Dict[str, Any]] = {}
+        for crimes in results:
+            _merge_records(merged, crimes, lambda crime: crime["id"])
+        return list(merged.values())
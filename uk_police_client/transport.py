@@ -0,0 +1,137 @@
+"""
+    Connection pools shared between client instances
+"""
+
+from typing import Optional
+
+import httpx
+
+
+def pool_limits(
+    max_connections: Optional[int] = 100,
+    max_keepalive_connections: Optional[int] = 20,
+    keepalive_expiry: Optional[float] = 5.0,
+) -> httpx.Limits:
+    """
+    Builds the connection limits of a pool.
+
+    Args:
+        max_connections: Maximum number of open connections, defaults to 100.
+        max_keepalive_connections: Maximum number of idle connections kept open for
+            reuse, defaults to 20.
+        keepalive_expiry: Seconds an idle connection is kept open, defaults to 5.
+
+    Returns:
+        The httpx.Limits.
+    """
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+class SharedTransport(httpx.BaseTransport):
+    """
+    Connection pool that can be passed as `transport` to any number of clients.
+
+    Closing a client, or leaving its `with` block, leaves the pool open, so clients
+    created per request or per job keep reusing warm connections (and their TLS
+    sessions). Call `shutdown()` to close the pool itself.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        transport: Optional[httpx.BaseTransport] = None,
+    ):
+        """
+        Initializes the SharedTransport.
+
+        Args:
+            max_connections: Maximum number of open connections, defaults to 100.
+            max_keepalive_connections: Maximum number of idle connections kept open
+                for reuse, defaults to 20.
+            keepalive_expiry: Seconds an idle connection is kept open, defaults to 5.
+            http2: Whether to negotiate HTTP/2, which multiplexes concurrent requests
+                over one connection. Requires `pip install httpx[http2]`.
+            transport: Optional transport to share instead of a new connection pool,
+                in which case the other arguments are ignored.
+        """
+        self._transport = transport or httpx.HTTPTransport(
+            limits=pool_limits(
+                max_connections, max_keepalive_connections, keepalive_expiry
+            ),
+            http2=http2,
+        )
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Called by clients leaving their `with` block; the pool stays open."""
+
+    def close(self) -> None:
+        """Called by clients when they are closed; the pool stays open."""
+
+    def shutdown(self) -> None:
+        """Closes the pool and all its connections."""
+        self._transport.close()
+
+
+class AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """
+    Connection pool that can be passed as `transport` to any number of async
+    clients running on the same event loop.
+
+    Closing a client leaves the pool open; call `shutdown()` to close the pool
+    itself.
+    """
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initializes the AsyncSharedTransport.
+
+        Args:
+            max_connections: Maximum number of open connections, defaults to 100.
+            max_keepalive_connections: Maximum number of idle connections kept open
+                for reuse, defaults to 20.
+            keepalive_expiry: Seconds an idle connection is kept open, defaults to 5.
+            http2: Whether to negotiate HTTP/2. Requires `pip install httpx[http2]`.
+            transport: Optional transport to share instead of a new connection pool.
+        """
+        self._transport = transport or httpx.AsyncHTTPTransport(
+            limits=pool_limits(
+                max_connections, max_keepalive_connections, keepalive_expiry
+            ),
+            http2=http2,
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Called by clients leaving their `async with` block; the pool stays open."""
+
+    async def aclose(self) -> None:
+        """Called by clients when they are closed; the pool stays open."""
+
+    async def shutdown(self) -> None:
+        """Closes the pool and all its connections."""
+        await self._transport.aclose()
@@ -1,6 +1,7 @@
+from array import array
 from dateutil import parser
 from datetime import datetime
-from typing import Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 court_outcomes = {
     "awaiting-court-result": "Awaiting court outcome",
@@ -32,6 +33,45 @@ court_outcomes = {
     "under-investigation": "Under investigation",
     "status-update-unavailable": "Status update unavailable",
 }
+# Compact integer id of every outcome, in the order of court_outcomes.
+court_outcome_ids = {code: i for i, code in enumerate(court_outcomes)}
+# Id of missing or unrecognised outcomes.
+UNKNOWN_OUTCOME = -1
+# Reverse lookup from lower-cased codes and labels to ids.
+_outcome_lookup = {
+    **court_outcome_ids,
+    **{
+        label.lower(): court_outcome_ids[code] for code, label in court_outcomes.items()
+    },
+}
+# Outcomes after which a case history will not grow. Any other code, including
+# new ones and missing categories, keeps the case open.
+final_outcomes = frozenset(
+    {
+        "unable-to-proceed",
+        "local-resolution",
+        "no-further-action",
+        "deprived-of-property",
+        "fined",
+        "absolute-discharge",
+        "cautioned",
+        "drugs-possession-warning",
+        "penalty-notice-issued",
+        "community-penalty",
+        "conditional-discharge",
+        "suspended-sentence",
+        "imprisoned",
+        "other-court-disposal",
+        "compensation",
+        "sentenced-in-another-case",
+        "not-guilty",
+        "unable-to-prosecute",
+        "formal-action-not-in-public-interest",
+        "action-taken-by-another-organisation",
+        "further-investigation-not-in-public-interest",
+        "further-action-not-in-public-interest",
+    }
+)
 
 
 def format_date(date_input: Union[str, datetime]) -> datetime:
@@ -51,3 +91,87 @@ def format_date(date_input: Union[str, datetime]) -> datetime:
         return parsed_date.strftime("%Y-%m")
     else:
         raise ValueError("Invalid date input. Must be a string or datetime object.")
+
+
+def month_range(start: Union[str, datetime], end: Union[str, datetime]) -> List[str]:
+    """
+    List every month between two dates, inclusive.
+
+    Args:
+        start (str or datetime): First month, in any format accepted by format_date.
+        end (str or datetime): Last month, in any format accepted by format_date.
+
+    Returns:
+        list: Months of form "YYYY-MM", oldest first. Empty if end is before start.
+    """
+    year, month = map(int, format_date(start).split("-"))
+    last = format_date(end)
+    months = []
+    while f"{year:04d}-{month:02d}" <= last:
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def is_case_closed(case: Dict[str, Any]) -> bool:
+    """
+    Check whether a case history will not change again.
+
+    Args:
+        case (dict): An /outcomes-for-crime response.
+
+    Returns:
+        bool: True if the case has outcomes and the code of its latest one is in
+            final_outcomes; unknown or missing codes count as open.
+    """
+    outcomes = case.get("outcomes") or []
+    if not outcomes:
+        return False
+    # Outcomes are listed oldest first, so the last one of the latest month wins.
+    _, latest = max(
+        enumerate(outcomes), key=lambda item: (item[1].get("date") or "", item[0])
+    )
+    return (latest.get("category") or {}).get("code") in final_outcomes
+
+
+def outcome_id(outcome: Union[str, Dict[str, str], None]) -> int:
+    """
+    Normalise an outcome category, in any of the forms used by the API, to its id.
+
+    Args:
+        outcome (str or dict): A code ("under-investigation"), a label
+            ("Under investigation", as in a crime's outcome_status) or a
+            {"code": ..., "name": ...} category, as in street-level outcomes.
+
+    Returns:
+        int: The id in court_outcome_ids, or UNKNOWN_OUTCOME.
+    """
+    if isinstance(outcome, dict):
+        outcome = outcome.get("code") or outcome.get("name")
+    if not outcome:
+        return UNKNOWN_OUTCOME
+    return _outcome_lookup.get(outcome.strip().lower(), UNKNOWN_OUTCOME)
+
+
+def outcome_ids(outcomes: Iterable[Union[str, Dict[str, str], None]]) -> array:
+    """
+    Normalise a batch of outcome categories to ids, looking each distinct value up
+    once.
+
+    Args:
+        outcomes (iterable): Codes, labels or categories, as accepted by outcome_id.
+
+    Returns:
+        array: The ids as an int8 array ("b" typecode), which NumPy can wrap with
+        numpy.frombuffer(ids, dtype=numpy.int8) without copying.
+    """
+    ids = array("b")
+    seen: Dict[Optional[str], int] = {}
+    for outcome in outcomes:
+        if isinstance(outcome, dict):
+            outcome = outcome.get("code") or outcome.get("name")
+        value = seen.get(outcome)
+        if value is None:
+            value = seen[outcome] = outcome_id(outcome)
+        ids.append(value)
+    return ids